@@ -0,0 +1,98 @@
+"""
+Сравнение оформления заказа в два шага и через /shopping_cart/checkout/.
+
+    python -m benchmarks.checkout [--sizes 1 10 100 500]
+
+Два шага - как делает клиент сейчас: чтение корзины, POST /orders/
+с id продуктов и удаление каждого продукта из корзины.
+"""
+# Standart lib imports
+import argparse
+
+# Projects imports
+from benchmarks.utils import (
+    benchmark_database,
+    create_products,
+    measure,
+    setup_django,
+)
+
+DEFAULT_SIZES = (1, 10, 100, 500)
+URL_SHOPPING_CART = '/api/v1/shopping_cart/'
+URL_CHECKOUT = '/api/v1/shopping_cart/checkout/'
+URL_ORDERS = '/api/v1/orders/'
+URL_PRODUCT_SHOPPING_CART = '/api/v1/products/{}/shopping_cart/'
+
+
+def fill_cart(user, product_ids):
+    # Projects imports
+    from products.models import ShoppingCart
+
+    ShoppingCart.objects.filter(user=user).delete()
+    ShoppingCart.objects.bulk_create(
+        ShoppingCart(user=user, product_id=product_id)
+        for product_id in product_ids
+    )
+
+
+def checkout_in_two_steps(client, user):
+    cart = client.get(URL_SHOPPING_CART).json()
+    product_ids = [
+        row['product'] for row in cart if row['user'] == user.id
+    ]
+    response = client.post(
+        URL_ORDERS,
+        {'products': [{'id': product_id} for product_id in product_ids]},
+        format='json',
+    )
+    assert response.status_code == 201, response.content
+    for product_id in product_ids:
+        client.delete(URL_PRODUCT_SHOPPING_CART.format(product_id))
+
+
+def checkout_in_one_step(client, user):
+    response = client.post(URL_CHECKOUT)
+    assert response.status_code == 201, response.content
+
+
+def run(sizes):
+    # Thirdparty imports
+    from django.contrib.auth import get_user_model
+    from rest_framework.test import APIClient
+
+    user = get_user_model().objects.create(
+        email='buyer@example.com',
+        username='buyer',
+        phone_number='+79990000001',
+    )
+    client = APIClient()
+    client.force_authenticate(user)
+    product_ids = create_products(max(sizes))
+    print(f'{"items":>10} {"path":>10} {"seconds":>9} {"queries":>8}')
+
+    for size in sizes:
+        for name, checkout in (
+            ('two steps', checkout_in_two_steps),
+            ('checkout', checkout_in_one_step),
+        ):
+            fill_cart(user, product_ids[:size])
+            with measure() as result:
+                checkout(client, user)
+            print(
+                f'{size:>10} {name:>10} '
+                f'{result["seconds"]:>9.3f} {result["queries"]:>8}'
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    args = parser.parse_args()
+
+    setup_django()
+    with benchmark_database():
+        run(args.sizes)
+
+
+if __name__ == '__main__':
+    main()
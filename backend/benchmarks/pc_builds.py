@@ -0,0 +1,132 @@
+"""
+Сравнение чтения сборок ПК через JOIN и двухфазным pc_diy_reader_util.
+
+    python -m benchmarks.pc_builds [--sizes 1000] [--products 200]
+
+Сборки собираются из общего набора продуктов, как популярные
+комплектующие в реальных сборках. JOIN-путь повторяет прежний
+PcDIYManager.get_annotated_queryset: select_related creator и article
+восьми слотов и восемь prefetch характеристик. Ответы рендерятся в JSON
+и сравниваются побайтно.
+"""
+# Standart lib imports
+import argparse
+
+# Projects imports
+from benchmarks.utils import (
+    BATCH_SIZE,
+    benchmark_database,
+    create_products,
+    measure,
+    setup_django,
+)
+
+DEFAULT_SIZES = (1_000,)
+DEFAULT_PRODUCTS = 200
+
+
+def create_builds(count, product_ids):
+    # Projects imports
+    from make_pc.constants import PC_DIY_SLOT_FIELDS
+    from make_pc.models import PcDIY
+
+    PcDIY.objects.bulk_create(
+        (
+            PcDIY(
+                **{
+                    f'{slot}_id': product_ids[
+                        (index * (position + 1)) % len(product_ids)
+                    ]
+                    for position, slot in enumerate(PC_DIY_SLOT_FIELDS)
+                }
+            )
+            for index in range(count)
+        ),
+        batch_size=BATCH_SIZE,
+    )
+
+
+def serialize_with_joins():
+    # Thirdparty imports
+    from django.db.models import Prefetch
+
+    # Projects imports
+    from make_pc.constants import PC_DIY_SLOT_FIELDS
+    from make_pc.models import PcDIY
+    from make_pc.serializers import GetPcDIYSerializer
+    from products.models import ProductProperty
+
+    queryset = (
+        PcDIY.objects.order_by('id')
+        .select_related(
+            *(
+                f'{slot}__{relation}'
+                for slot in PC_DIY_SLOT_FIELDS
+                for relation in ('creator', 'article_by_product')
+            )
+        )
+        .prefetch_related(
+            *(
+                Prefetch(
+                    f'{slot}__product_property_prod',
+                    queryset=ProductProperty.objects.order_by('id'),
+                )
+                for slot in PC_DIY_SLOT_FIELDS
+            )
+        )
+    )
+    return GetPcDIYSerializer(queryset, many=True).data
+
+
+def serialize_with_reader():
+    # Projects imports
+    from make_pc.models import PcDIY
+    from make_pc.readers import pc_diy_reader_util
+
+    return pc_diy_reader_util.get_many(PcDIY.objects.order_by('id'))
+
+
+def run(sizes, products):
+    # Thirdparty imports
+    from rest_framework.renderers import JSONRenderer
+
+    # Projects imports
+    from make_pc.models import PcDIY
+
+    renderer = JSONRenderer()
+    product_ids = create_products(products)
+    print(f'{"builds":>10} {"path":>18} {"seconds":>9} {"queries":>8}')
+
+    for size in sizes:
+        PcDIY.objects.all().delete()
+        create_builds(size, product_ids)
+
+        rendered = {}
+        for name, serialize in (
+            ('select_related', serialize_with_joins),
+            ('pc_diy_reader_util', serialize_with_reader),
+        ):
+            with measure() as result:
+                rendered[name] = renderer.render(serialize())
+            print(
+                f'{size:>10} {name:>18} '
+                f'{result["seconds"]:>9.3f} {result["queries"]:>8}'
+            )
+
+        if rendered['select_related'] != rendered['pc_diy_reader_util']:
+            raise AssertionError(f'Ответы различаются на {size} сборках.')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    parser.add_argument('--products', type=int, default=DEFAULT_PRODUCTS)
+    args = parser.parse_args()
+
+    setup_django()
+    with benchmark_database():
+        run(args.sizes, args.products)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+"""
+Сравнение ProductSerializer.create по строке и import_util пачками.
+
+    python -m benchmarks.product_import [--sizes 1000 10000]
+
+Оба пути загружают одинаковые строки JSONL с тремя характеристиками.
+"""
+# Standart lib imports
+import argparse
+import json
+from io import StringIO
+
+# Projects imports
+from benchmarks.utils import benchmark_database, measure, setup_django
+
+DEFAULT_SIZES = (1_000, 10_000)
+
+
+def get_rows(count, prefix):
+    # Projects imports
+    from products.models import Category, ProductType, Property, SubCategory
+
+    category_id = Category.objects.first().id
+    sub_category_id = SubCategory.objects.first().id
+    product_type_ids = list(ProductType.objects.values_list('id', flat=True))
+    property_ids = list(Property.objects.values_list('id', flat=True))
+    return [
+        {
+            'name': f'{prefix} product {index}',
+            'description': 'Описание продукта для бенчмарка',
+            'price': index + 1,
+            'category': category_id,
+            'sub_category': sub_category_id,
+            'product_type': product_type_ids[index % len(product_type_ids)],
+            'properties': [
+                {'id': property_id, 'value': str(index % 10)}
+                for property_id in property_ids
+            ],
+        }
+        for index in range(count)
+    ]
+
+
+def import_with_serializer(rows, creator):
+    # Projects imports
+    from products.serializers import ProductSerializer
+
+    for row in rows:
+        serializer = ProductSerializer(data=row)
+        serializer.is_valid(raise_exception=True)
+        serializer.save(creator=creator)
+
+
+def import_with_importer(rows, creator):
+    # Projects imports
+    from products.constants import IMPORT_BATCH_SIZE
+    from products.importer import import_util
+
+    stream = StringIO('\n'.join(json.dumps(row) for row in rows))
+    report = import_util.run(stream, 'jsonl', creator, IMPORT_BATCH_SIZE)
+    if report.errors:
+        raise AssertionError(report.errors[:5])
+
+
+def run(sizes):
+    # Thirdparty imports
+    from django.contrib.auth import get_user_model
+
+    # Projects imports
+    from products.models import Product
+
+    creator = get_user_model().objects.create(
+        email='bench@example.com',
+        username='bench',
+        phone_number='+79990000000',
+    )
+    print(f'{"rows":>10} {"path":>18} {"seconds":>9} {"queries":>8}')
+
+    for size in sizes:
+        for name, load in (
+            ('ProductSerializer', import_with_serializer),
+            ('import_util', import_with_importer),
+        ):
+            Product.objects.all().delete()
+            rows = get_rows(size, name)
+            with measure() as result:
+                load(rows, creator)
+            print(
+                f'{size:>10} {name:>18} '
+                f'{result["seconds"]:>9.3f} {result["queries"]:>8}'
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    args = parser.parse_args()
+
+    setup_django()
+    with benchmark_database():
+        run(args.sizes)
+
+
+if __name__ == '__main__':
+    main()
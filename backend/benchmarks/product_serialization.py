@@ -0,0 +1,89 @@
+"""
+Сравнение GetProductSerializer и reader_util на 1k/10k/100k продуктов.
+
+    python -m benchmarks.product_serialization [--sizes 1000 10000 100000]
+
+Оба пути сериализуют продукты пачками по BATCH_SIZE (как страницы
+каталога), рендерятся в JSON и сравниваются побайтно.
+"""
+# Standart lib imports
+import argparse
+
+# Projects imports
+from benchmarks.utils import (
+    benchmark_database,
+    chunks,
+    create_products,
+    measure,
+    setup_django,
+)
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+
+
+def serialize_with_model_serializer(product_ids):
+    # Projects imports
+    from products.models import Product
+    from products.serializers import GetProductSerializer
+
+    data = []
+    for chunk in chunks(product_ids):
+        queryset = Product.objects.get_annotated_queryset().filter(
+            id__in=chunk
+        )
+        data.extend(GetProductSerializer(queryset, many=True).data)
+    return data
+
+
+def serialize_with_reader(product_ids):
+    # Projects imports
+    from products.readers import reader_util
+
+    data = []
+    for chunk in chunks(product_ids):
+        data.extend(reader_util.get_many(chunk))
+    return data
+
+
+def run(sizes):
+    # Thirdparty imports
+    from rest_framework.renderers import JSONRenderer
+
+    # Projects imports
+    from products.models import Product
+
+    renderer = JSONRenderer()
+    print(f'{"products":>10} {"path":>18} {"seconds":>9} {"queries":>8}')
+
+    for size in sizes:
+        Product.objects.all().delete()
+        product_ids = create_products(size)
+
+        rendered = {}
+        for name, serialize in (
+            ('ModelSerializer', serialize_with_model_serializer),
+            ('reader_util', serialize_with_reader),
+        ):
+            with measure() as result:
+                rendered[name] = renderer.render(serialize(product_ids))
+            print(
+                f'{size:>10} {name:>18} '
+                f'{result["seconds"]:>9.3f} {result["queries"]:>8}'
+            )
+
+        if rendered['ModelSerializer'] != rendered['reader_util']:
+            raise AssertionError(f'Ответы различаются на {size} продуктах.')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    args = parser.parse_args()
+
+    setup_django()
+    with benchmark_database():
+        run(args.sizes)
+
+
+if __name__ == '__main__':
+    main()
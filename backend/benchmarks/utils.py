@@ -0,0 +1,144 @@
+"""
+Общие утилиты бенчмарков.
+
+Бенчмарки запускаются из каталога backend, например:
+    python -m benchmarks.product_serialization
+
+Каждый бенчмарк работает на отдельной тестовой БД, рабочая БД не
+затрагивается. Кэш cachalot отключается, чтобы замерять сами запросы.
+"""
+# Standart lib imports
+import os
+import time
+from contextlib import contextmanager
+
+# Thirdparty imports
+import django
+
+BATCH_SIZE = 1000
+
+
+def setup_django():
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
+    django.setup()
+
+
+@contextmanager
+def benchmark_database():
+    # Thirdparty imports
+    from cachalot.settings import cachalot_settings
+    from django.db import connection
+    from django.test.utils import (
+        override_settings,
+        setup_test_environment,
+        teardown_test_environment,
+    )
+
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        # cachalot читает настройки один раз и не следит за
+        # override_settings, поэтому перечитываются явно.
+        with override_settings(CACHALOT_ENABLED=False, DEBUG=False):
+            cachalot_settings.reload()
+            yield
+    finally:
+        cachalot_settings.reload()
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+
+@contextmanager
+def measure():
+    """
+    Замеряет время и число SQL-запросов блока.
+
+    Запросы считаются execute_wrapper: журнал CaptureQueriesContext
+    ограничен 9000 записями.
+    """
+    # Thirdparty imports
+    from django.db import connection
+
+    result = {'queries': 0}
+
+    def count_queries(execute, sql, params, many, context):
+        result['queries'] += 1
+        return execute(sql, params, many, context)
+
+    with connection.execute_wrapper(count_queries):
+        started = time.perf_counter()
+        yield result
+        result['seconds'] = time.perf_counter() - started
+
+
+def create_products(count, properties_per_product=3, prefix='bench'):
+    """Создаёт count продуктов с характеристиками и артикулами."""
+    # Thirdparty imports
+    from django.contrib.auth import get_user_model
+
+    # Projects imports
+    from products.models import (
+        Article,
+        Category,
+        Product,
+        ProductProperty,
+        ProductType,
+        Property,
+        SubCategory,
+    )
+
+    User = get_user_model()
+    creator, _ = User.objects.get_or_create(
+        email=f'{prefix}@example.com',
+        defaults={'username': prefix, 'phone_number': '+79990000000'},
+    )
+    category = Category.objects.first()
+    sub_category = SubCategory.objects.first()
+    product_types = list(ProductType.objects.all())
+    properties = list(Property.objects.all()[:properties_per_product])
+
+    Product.objects.bulk_create(
+        (
+            Product(
+                name=f'{prefix} product {index}',
+                description='Описание продукта для бенчмарка',
+                category=category,
+                sub_category=sub_category,
+                product_type=product_types[index % len(product_types)],
+                price=index + 1,
+                creator=creator,
+            )
+            for index in range(count)
+        ),
+        batch_size=BATCH_SIZE,
+    )
+    product_ids = list(
+        Product.objects.filter(name__startswith=f'{prefix} product ')
+        .order_by('id')
+        .values_list('id', flat=True)
+    )
+    Article.objects.bulk_create(
+        (
+            Article(product_id=product_id, article=f'{prefix}{product_id}')
+            for product_id in product_ids
+        ),
+        batch_size=BATCH_SIZE,
+    )
+    ProductProperty.objects.bulk_create(
+        (
+            ProductProperty(
+                product_id=product_id,
+                property=product_property,
+                value=str(product_id % 10),
+            )
+            for product_id in product_ids
+            for product_property in properties
+        ),
+        batch_size=BATCH_SIZE,
+    )
+    return product_ids
+
+
+def chunks(items, size=BATCH_SIZE):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
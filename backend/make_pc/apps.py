@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class MakePcConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'make_pc'
+
+    def ready(self):
+        # Projects imports
+        import make_pc.signals  # noqa
@@ -0,0 +1,197 @@
+# Standart lib imports
+from dataclasses import dataclass
+
+# Thirdparty imports
+from django.db.models import Q
+
+# Projects imports
+from make_pc.constants import (
+    FORM_FACTOR_PROPERTY,
+    MEMORY_TYPE_PROPERTY,
+    PC_DIY_SLOT_PRODUCT_TYPES,
+    POWER_CONSUMPTION_PROPERTY,
+    POWER_PROPERTY,
+    SOCKET_PROPERTY,
+)
+from products.models import Product, ProductProperty, parse_property_number
+from products.reference import reference_util
+
+
+def get_numbers(property_id):
+    """
+    Числовые значения характеристики property_id.
+
+    Сравнения по number идут по индексу (property, number, product).
+    """
+    return ProductProperty.objects.filter(
+        property_id=property_id, number__isnull=False
+    )
+
+
+@dataclass(frozen=True)
+class MatchRule:
+    """Значения характеристики property_name слотов first и second равны."""
+
+    property_name: str
+    first: str
+    second: str
+
+    def get_properties(self):
+        return (self.property_name,)
+
+    def compile(self, slot, values, property_ids):
+        """
+        Условие на кандидатов slot по выбранным частям сборки.
+
+        values - {слот: {характеристика: значение}} выбранных частей,
+        None - правило не ограничивает слот.
+        """
+        if slot not in (self.first, self.second):
+            return None
+        other = self.second if slot == self.first else self.first
+        value = values.get(other, {}).get(self.property_name)
+        if value is None:
+            return None
+        return Q(
+            id__in=ProductProperty.objects.filter(
+                property_id=property_ids[self.property_name], value=value
+            ).values('product_id')
+        )
+
+
+@dataclass(frozen=True)
+class CapacityRule:
+    """
+    Характеристика property_name слота slot не меньше суммы
+    характеристики load_property слотов consumers.
+    """
+
+    property_name: str
+    slot: str
+    load_property: str
+    consumers: tuple
+
+    def get_properties(self):
+        return (self.property_name, self.load_property)
+
+    def _get_load(self, values, exclude=None):
+        return sum(
+            parse_property_number(
+                values.get(consumer, {}).get(self.load_property)
+            )
+            or 0
+            for consumer in self.consumers
+            if consumer != exclude
+        )
+
+    def compile(self, slot, values, property_ids):
+        if slot == self.slot:
+            load = self._get_load(values)
+            if not load:
+                return None
+            return Q(
+                id__in=get_numbers(property_ids[self.property_name])
+                .filter(number__gte=load)
+                .values('product_id')
+            )
+
+        if slot in self.consumers:
+            capacity = parse_property_number(
+                values.get(self.slot, {}).get(self.property_name)
+            )
+            if capacity is None:
+                return None
+            # Части без заявленной нагрузки не отбрасываются.
+            return ~Q(
+                id__in=get_numbers(property_ids[self.load_property])
+                .filter(number__gt=capacity - self._get_load(values, slot))
+                .values('product_id')
+            )
+        return None
+
+
+COMPATIBILITY_RULES = (
+    MatchRule(SOCKET_PROPERTY, 'cpu', 'motherboard'),
+    MatchRule(MEMORY_TYPE_PROPERTY, 'ram_memory', 'motherboard'),
+    MatchRule(FORM_FACTOR_PROPERTY, 'motherboard', 'pc_box'),
+    CapacityRule(
+        POWER_PROPERTY,
+        'power_supply',
+        POWER_CONSUMPTION_PROPERTY,
+        ('cpu', 'gpu'),
+    ),
+)
+
+
+class CandidateSearch:
+    """
+    Поиск продуктов, совместимых с частично собранной сборкой ПК.
+
+    Правила описывают совместимость слотов через характеристики
+    ProductProperty и компилируются в подзапросы id__in по индексам
+    (property, value, product) для равенства и (property, number,
+    product) для числовых сравнений. Характеристики выбранных частей читаются
+    одним запросом по уникальному индексу (product, property), кандидаты -
+    одним запросом с подзапросами правил. Правило без данных (слот пуст,
+    характеристика не заведена или не указана у части) не ограничивает
+    выбор.
+    """
+
+    def __init__(self, rules=COMPATIBILITY_RULES):
+        self.rules = rules
+
+    def _get_property_ids(self):
+        property_ids = {}
+        for rule in self.rules:
+            for name in rule.get_properties():
+                row = reference_util.get_by_name('property', name)
+                if row is not None:
+                    property_ids[name] = row['id']
+        return property_ids
+
+    def _get_values(self, build, slot, property_ids):
+        """{слот: {характеристика: значение}} частей сборки кроме slot."""
+        slots = {}
+        for other in PC_DIY_SLOT_PRODUCT_TYPES:
+            product_id = getattr(build, f'{other}_id')
+            if other != slot and product_id is not None:
+                slots.setdefault(product_id, []).append(other)
+        if not slots or not property_ids:
+            return {}
+
+        property_names = {
+            property_id: name for name, property_id in property_ids.items()
+        }
+        values = {}
+        for product_id, property_id, value in ProductProperty.objects.filter(
+            product_id__in=slots, property_id__in=property_names
+        ).values_list('product_id', 'property_id', 'value'):
+            for other in slots[product_id]:
+                values.setdefault(other, {})[
+                    property_names[property_id]
+                ] = value
+        return values
+
+    def get_queryset(self, build, slot):
+        """Продукты типа слота slot, совместимые с остальной сборкой."""
+        product_type = reference_util.get_by_name(
+            'product_type', PC_DIY_SLOT_PRODUCT_TYPES[slot]
+        )
+        if product_type is None:
+            return Product.objects.none()
+
+        property_ids = self._get_property_ids()
+        values = self._get_values(build, slot, property_ids)
+        conditions = [
+            condition
+            for rule in self.rules
+            if set(rule.get_properties()) <= set(property_ids)
+            and (condition := rule.compile(slot, values, property_ids))
+            is not None
+        ]
+        return Product.objects.filter(
+            *conditions, product_type_id=product_type['id']
+        ).only('id')
+
+
+candidate_util = CandidateSearch()
@@ -1,42 +1,42 @@
-PC_DIY_QUERY_STMNT = [
-    'pc_box__creator',
-    'pc_box__category',
-    'pc_box__sub_category',
-    'pc_box__article_by_product',
-    'pc_box__product_type',
-    'power_supply__creator',
-    'power_supply__category',
-    'power_supply__sub_category',
-    'power_supply__article_by_product',
-    'power_supply__product_type',
-    'motherboard__creator',
-    'motherboard__category',
-    'motherboard__sub_category',
-    'motherboard__article_by_product',
-    'motherboard__product_type',
-    'ram_memory__creator',
-    'ram_memory__category',
-    'ram_memory__sub_category',
-    'ram_memory__article_by_product',
-    'ram_memory__product_type',
-    'ssd_storage_memory__creator',
-    'ssd_storage_memory__category',
-    'ssd_storage_memory__sub_category',
-    'ssd_storage_memory__article_by_product',
-    'ssd_storage_memory__product_type',
-    'hdd_storage_memory__creator',
-    'hdd_storage_memory__category',
-    'hdd_storage_memory__sub_category',
-    'hdd_storage_memory__article_by_product',
-    'hdd_storage_memory__product_type',
-    'cpu__creator',
-    'cpu__category',
-    'cpu__sub_category',
-    'cpu__article_by_product',
-    'cpu__product_type',
-    'gpu__creator',
-    'gpu__category',
-    'gpu__sub_category',
-    'gpu__article_by_product',
-    'gpu__product_type',
-]
+MAKE_PC_VERSION = 'make_pc'
+
+PC_DIY_SLOT_FIELDS = (
+    'pc_box',
+    'power_supply',
+    'motherboard',
+    'ram_memory',
+    'ssd_storage_memory',
+    'hdd_storage_memory',
+    'cpu',
+    'gpu',
+)
+
+# Тип продукта (ProductType.name) каждого слота сборки.
+PC_DIY_SLOT_PRODUCT_TYPES = {
+    'pc_box': 'PC_BOX',
+    'power_supply': 'POWER_SUPPLY',
+    'motherboard': 'MOTHERBOARD',
+    'ram_memory': 'RAM',
+    'ssd_storage_memory': 'SSD',
+    'hdd_storage_memory': 'HDD',
+    'cpu': 'CPU',
+    'gpu': 'GPU',
+}
+
+# Характеристики (Property.name), по которым проверяется совместимость.
+SOCKET_PROPERTY = 'Сокет'
+MEMORY_TYPE_PROPERTY = 'Тип памяти'
+FORM_FACTOR_PROPERTY = 'Форм-фактор'
+POWER_PROPERTY = 'Мощность'
+POWER_CONSUMPTION_PROPERTY = 'Потребляемая мощность'
+
+CANDIDATE_SLOT_ERR_MSG = 'Неизвестный слот сборки {}, ожидается один из: {}.'
+
+MAKE_PC_BULK_MAX_SIZE = 100
+MAKE_PC_DRY_RUN_QUERY_PARAM = 'dry_run'
+MAKE_PC_BULK_SIZE_ERR_MSG = (
+    'За один запрос можно сохранить не больше {} сборок.'
+)
+PRODUCT_NOT_FOUND_ERR_MSG = (
+    'Недопустимый первичный ключ "{}" - объект не существует.'
+)
@@ -2,42 +2,7 @@
 from django.db import models
 
 # Projects imports
-from make_pc.constants import PC_DIY_QUERY_STMNT
-from products.models import Product, ProductProperty
-
-
-class PcDIYManager(models.Manager):
-
-    def get_annotated_queryset(self, user):
-        product_property_queryset = ProductProperty.objects.select_related(
-            'property'
-        )
-
-        prefetch_fields = [
-            'pc_box',
-            'power_supply',
-            'motherboard',
-            'ram_memory',
-            'ssd_storage_memory',
-            'hdd_storage_memory',
-            'cpu',
-            'gpu',
-        ]
-
-        prefetches = [
-            models.Prefetch(
-                f'{field}__product_property_prod',
-                queryset=product_property_queryset,
-            )
-            for field in prefetch_fields
-        ]
-
-        return (
-            super()
-            .get_queryset()
-            .select_related(*PC_DIY_QUERY_STMNT)
-            .prefetch_related(*prefetches)
-        )
+from products.models import Product
 
 
 class PcDIY(models.Model):
@@ -107,8 +72,6 @@ class PcDIY(models.Model):
         blank=True,
     )
 
-    objects = PcDIYManager()
-
     class Meta:
         verbose_name = ('ПК сборка',)
         verbose_name_plural = ('ПК сборки',)
@@ -0,0 +1,51 @@
+# Projects imports
+from make_pc.constants import PC_DIY_SLOT_FIELDS
+from products.readers import reader_util
+
+PC_DIY_FIELDS = ('id', *PC_DIY_SLOT_FIELDS)
+
+
+class PcDIYReader:
+    """
+    Двухфазное чтение сборок ПК.
+
+    Первая фаза - values_list id сборок и id продуктов в слотах,
+    вторая - reader_util по различным продуктам всех сборок. Популярный
+    процессор или видеокарта читается один раз на весь ответ, а не в
+    каждой сборке. Итого не больше трёх запросов на любое число сборок.
+    Результат совпадает с GetPcDIYSerializer(...).data.
+    """
+
+    def get_many(self, queryset, membership=None, fields=None):
+        """Словари сборок queryset в его порядке, fields - поля ответа."""
+        fields = PC_DIY_FIELDS if fields is None else fields
+        slots = [slot for slot in PC_DIY_SLOT_FIELDS if slot in fields]
+        rows = list(
+            queryset.values_list('id', *(f'{slot}_id' for slot in slots))
+        )
+
+        product_ids = {
+            product_id
+            for row in rows
+            for product_id in row[1:]
+            if product_id is not None
+        }
+        products = {}
+        if product_ids:
+            products = {
+                product['id']: product
+                for product in reader_util.get_many(
+                    sorted(product_ids), membership
+                )
+            }
+
+        builds = []
+        for build_id, *slot_product_ids in rows:
+            build = {'id': build_id} if 'id' in fields else {}
+            for slot, product_id in zip(slots, slot_product_ids):
+                build[slot] = products.get(product_id)
+            builds.append(build)
+        return builds
+
+
+pc_diy_reader_util = PcDIYReader()
@@ -1,24 +1,28 @@
 # Thirdparty imports
+from django.db import transaction
 from rest_framework import serializers
 
 # Projects imports
+from make_pc.constants import (
+    MAKE_PC_BULK_MAX_SIZE,
+    MAKE_PC_BULK_SIZE_ERR_MSG,
+    MAKE_PC_VERSION,
+    PC_DIY_SLOT_PRODUCT_TYPES,
+    PRODUCT_NOT_FOUND_ERR_MSG,
+)
 from make_pc.models import PcDIY
-from products.models import Product
+from make_pc.readers import pc_diy_reader_util
+from products.bulk import fill_bulk_ids
+from products.product_types import product_type_util
+from products.reference import reference_util
 from products.serializers import GetProductSerializer
+from products.sparse_fields import SparseFieldsetSerializerMixin
+from products.versioning import version_util
 
 
 class BasePcDIYSerializer(serializers.ModelSerializer):
 
-    RELATED_FIELDS_MAPPING = {
-        'pc_box': 'PC_BOX',
-        'power_supply': 'POWER_SUPPLY',
-        'motherboard': 'MOTHERBOARD',
-        'ram_memory': 'RAM',
-        'ssd_storage_memory': 'SSD',
-        'hdd_storage_memory': 'HDD',
-        'cpu': 'CPU',
-        'gpu': 'GPU',
-    }
+    RELATED_FIELDS_MAPPING = PC_DIY_SLOT_PRODUCT_TYPES
     type_err_mes = (
         'ожидается объект с product_type == {}, вы пытаетесь добавить {}'
     )
@@ -38,24 +42,110 @@ class BasePcDIYSerializer(serializers.ModelSerializer):
         )
 
 
-class GetPcDIYSerializer(BasePcDIYSerializer):
+class GetPcDIYSerializer(SparseFieldsetSerializerMixin, BasePcDIYSerializer):
 
     def get_fields_serializer(self, field_name):
         return GetProductSerializer()
 
 
+def get_slot_product_ids(data):
+    """id продуктов в слотах необработанных данных сборки."""
+    product_ids = set()
+    for slot in PC_DIY_SLOT_PRODUCT_TYPES:
+        try:
+            product_ids.add(int(data[slot]))
+        except (KeyError, TypeError, ValueError):
+            continue
+    return product_ids
+
+
+class PcDIYListSerializer(serializers.ListSerializer):
+    """
+    Проверка и создание многих сборок.
+
+    Типы продуктов всех сборок читаются до проверки одним запросом
+    product_type_util, сборки вставляются одним bulk_create.
+    """
+
+    def to_internal_value(self, data):
+        if isinstance(data, list):
+            if len(data) > MAKE_PC_BULK_MAX_SIZE:
+                raise serializers.ValidationError(
+                    MAKE_PC_BULK_SIZE_ERR_MSG.format(MAKE_PC_BULK_MAX_SIZE)
+                )
+            product_ids = set().union(
+                *(
+                    get_slot_product_ids(build)
+                    for build in data
+                    if isinstance(build, dict)
+                )
+            )
+            self.child.product_types = {
+                **dict.fromkeys(product_ids),
+                **product_type_util.get_many(product_ids),
+            }
+        return super().to_internal_value(data)
+
+    def create(self, validated_data):
+        builds = [PcDIY(**attrs) for attrs in validated_data]
+        with transaction.atomic():
+            PcDIY.objects.bulk_create(builds)
+            fill_bulk_ids(PcDIY, builds)
+        # bulk_create не отправляет post_save.
+        version_util.bump(MAKE_PC_VERSION)
+        return builds
+
+    def to_representation(self, data):
+        return pc_diy_reader_util.get_many(
+            PcDIY.objects.filter(id__in=[build.id for build in data]).order_by(
+                'id'
+            )
+        )
+
+
 class PcDIYSerializer(BasePcDIYSerializer):
+    """
+    Запись сборки по id продуктов в слотах.
+
+    Типы продуктов всех слотов читаются одним запросом через кэш
+    product_type_util, а не отдельным запросом на каждый слот.
+    """
+
+    class Meta(BasePcDIYSerializer.Meta):
+        list_serializer_class = PcDIYListSerializer
 
     def get_fields_serializer(self, field_name):
-        return serializers.PrimaryKeyRelatedField(
-            queryset=Product.objects.all(),
-            required=False,
-        )
+        return serializers.IntegerField(min_value=1, required=False)
+
+    def get_product_types(self, product_ids):
+        """
+        {id продукта: id типа или None}, типы пачки берутся из
+        PcDIYListSerializer.
+        """
+        product_types = getattr(self, 'product_types', {})
+        missing_ids = [
+            product_id
+            for product_id in product_ids
+            if product_id not in product_types
+        ]
+        if missing_ids:
+            product_types = {
+                **product_types,
+                **product_type_util.get_many(missing_ids),
+            }
+        return product_types
 
     def validate(self, attrs):
-        for field, obj in attrs.items():
+        product_types = self.get_product_types(set(attrs.values()))
+        for field, product_id in attrs.items():
+            if (product_type_id := product_types.get(product_id)) is None:
+                raise serializers.ValidationError(
+                    {field: PRODUCT_NOT_FOUND_ERR_MSG.format(product_id)}
+                )
             if (
-                product_type := obj.product_type.name
+                product_type := reference_util.get(
+                    'product_type', product_type_id
+                )['name']
             ) != self.RELATED_FIELDS_MAPPING[field]:
 
                 raise serializers.ValidationError(
@@ -69,7 +159,11 @@ class PcDIYSerializer(BasePcDIYSerializer):
                     }
                 )
 
-        return attrs
+        return {
+            f'{field}_id': product_id for field, product_id in attrs.items()
+        }
 
     def to_representation(self, instance):
-        return GetPcDIYSerializer(instance).data
+        return pc_diy_reader_util.get_many(
+            PcDIY.objects.filter(id=instance.id)
+        )[0]
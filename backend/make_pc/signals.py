@@ -0,0 +1,13 @@
+# Thirdparty imports
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+# Projects imports
+from make_pc.constants import MAKE_PC_VERSION
+from make_pc.models import PcDIY
+from products.versioning import version_util
+
+
+@receiver((post_save, post_delete), sender=PcDIY)
+def bump_make_pc_version(sender, **kwargs):
+    version_util.bump(MAKE_PC_VERSION)
@@ -1,24 +1,50 @@
 # Thirdparty imports
-from django_auto_prefetching import AutoPrefetchViewSetMixin
-from rest_framework.decorators import permission_classes
+from django.http import Http404
+from rest_framework import status
+from rest_framework.decorators import action, permission_classes
+from rest_framework.exceptions import NotFound
 from rest_framework.permissions import (
     AllowAny,
     IsAuthenticated,
     IsAuthenticatedOrReadOnly,
 )
+from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet
 
 # Projects imports
+from make_pc.compatibility import candidate_util
+from make_pc.constants import (
+    CANDIDATE_SLOT_ERR_MSG,
+    MAKE_PC_DRY_RUN_QUERY_PARAM,
+    MAKE_PC_VERSION,
+    PC_DIY_SLOT_PRODUCT_TYPES,
+)
 from make_pc.models import PcDIY
+from make_pc.readers import pc_diy_reader_util
 from make_pc.serializers import GetPcDIYSerializer, PcDIYSerializer
-from products.models import Product
+from products.conditional import ConditionalGetViewMixin, conditional_get
+from products.constants import CATALOG_VERSION, PREFER_RETURN_MINIMAL
+from products.membership import membership_util
+from products.minimal_response import (
+    MinimalResponseViewMixin,
+    is_minimal_response,
+)
+from products.pagination import ProductCursorPagination
+from products.readers import reader_util
+from products.sparse_fields import SparseFieldsetViewMixin
 from products.views import SAFE_ACTIONS
 
 
 @permission_classes((AllowAny,))
-class MakePcViewSet(AutoPrefetchViewSetMixin, ModelViewSet):
+class MakePcViewSet(
+    ConditionalGetViewMixin,
+    SparseFieldsetViewMixin,
+    MinimalResponseViewMixin,
+    ModelViewSet,
+):
 
     queryset = PcDIY.objects.all()
+    etag_scopes = (CATALOG_VERSION, MAKE_PC_VERSION)
 
     def get_serializer_class(self):
         if self.action in SAFE_ACTIONS:
@@ -26,4 +52,77 @@ class MakePcViewSet(AutoPrefetchViewSetMixin, ModelViewSet):
         return PcDIYSerializer
 
     def get_queryset(self):
-        return PcDIY.objects.get_annotated_queryset(self.request.user)
+        return PcDIY.objects.all()
+
+    def get_builds_data(self, queryset):
+        return pc_diy_reader_util.get_many(
+            queryset, fields=self.get_sparse_fields()
+        )
+
+    @conditional_get
+    def list(self, request, *args, **kwargs):
+        return Response(
+            self.get_builds_data(self.filter_queryset(self.get_queryset()))
+        )
+
+    @conditional_get
+    def retrieve(self, request, *args, **kwargs):
+        builds = self.get_builds_data(
+            self.get_queryset().filter(pk=kwargs['pk'])
+        )
+        if not builds:
+            raise Http404
+        return Response(builds[0])
+
+    @action(
+        detail=True,
+        methods=('get',),
+        url_path=r'candidates/(?P<slot>[^/.]+)',
+    )
+    def candidates(self, request, pk=None, slot=None):
+        """Продукты для слота slot, совместимые с остальной сборкой."""
+        if slot not in PC_DIY_SLOT_PRODUCT_TYPES:
+            raise NotFound(
+                CANDIDATE_SLOT_ERR_MSG.format(
+                    slot, ', '.join(PC_DIY_SLOT_PRODUCT_TYPES)
+                )
+            )
+        paginator = ProductCursorPagination()
+        page = paginator.paginate_queryset(
+            candidate_util.get_queryset(self.get_object(), slot),
+            request,
+            self,
+        )
+        return paginator.get_paginated_response(
+            reader_util.get_many(
+                [product.id for product in page],
+                membership_util.get(request.user),
+            )
+        )
+
+    @action(detail=False, methods=('post',))
+    def bulk(self, request):
+        """
+        Проверка и сохранение списка сборок, ?dry_run=1 - только проверка.
+
+        Сохраняются все сборки или ни одной, ошибки возвращаются списком
+        в порядке сборок запроса.
+        """
+        serializer = PcDIYSerializer(
+            data=request.data, many=True, allow_empty=False
+        )
+        serializer.is_valid(raise_exception=True)
+        if request.query_params.get(MAKE_PC_DRY_RUN_QUERY_PARAM) in (
+            '1',
+            'true',
+        ):
+            return Response(status=status.HTTP_204_NO_CONTENT)
+
+        serializer.save()
+        if is_minimal_response(request):
+            return Response(
+                [{'id': build.id} for build in serializer.instance],
+                status=status.HTTP_201_CREATED,
+                headers={'Preference-Applied': PREFER_RETURN_MINIMAL},
+            )
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
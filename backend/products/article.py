@@ -1,38 +1,41 @@
-from django.db.models import Max
-
-from products.constants import DEFAULT_ARTICLE_DIGIT
+from products.constants import ARTICLE_SEQUENCE
 from products.models import Article
+from products.reference import reference_util
+from products.sequences import sequence_util
 
 
 class MakeUniqueArticle:
 
     def _get_prefix(self, instance):
-        return (
-            f'{instance.category.name[:3].upper()}-'
-            f'{instance.sub_category.name[:3].upper()}'
+        category = reference_util.get('category', instance.category_id)
+        sub_category = reference_util.get(
+            'sub_category', instance.sub_category_id
         )
-
-
-    def _get_unique_articl_digit(self):
-        max_digit = (
-            Article.objects.all()
-            .values('article')
-            .aggregate(Max('article'))['article__max']
+        return (
+            f'{category["name"][:3].upper()}-'
+            f'{sub_category["name"][:3].upper()}'
         )
 
-        if max_digit is not None:
-            max_digit = int(max_digit.split(':')[-1])
-            max_digit += 1
-            return str(max_digit)
-
-        return DEFAULT_ARTICLE_DIGIT
+    def _get_article(self, instance, unique_digit):
+        return f'{self._get_prefix(instance)}:{unique_digit}'
 
     def create(self, instance):
-        prefix = self._get_prefix(instance)
-        unique_digit = self._get_unique_articl_digit()
-        article = f'{prefix}:{unique_digit}'
+        unique_digit = sequence_util.next(ARTICLE_SEQUENCE)
+        Article.objects.create(
+            product=instance,
+            article=self._get_article(instance, unique_digit),
+        )
 
-        Article.objects.create(product=instance, article=article)
+    def create_many(self, instances):
+        """Артикулы для пачки продуктов одним резервированием номеров."""
+        unique_digits = sequence_util.reserve(ARTICLE_SEQUENCE, len(instances))
+        Article.objects.bulk_create(
+            Article(
+                product=instance,
+                article=self._get_article(instance, unique_digit),
+            )
+            for instance, unique_digit in zip(instances, unique_digits)
+        )
 
 
 article_util = MakeUniqueArticle()
@@ -0,0 +1,157 @@
+# Standart lib imports
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta
+from itertools import combinations, groupby
+from operator import itemgetter
+
+# Thirdparty imports
+from django.db import transaction
+from django.utils import timezone
+
+# Projects imports
+from products.constants import (
+    BOUGHT_TOGETHER_CHUNK_SIZE,
+    BOUGHT_TOGETHER_REFRESH_WINDOW,
+    BOUGHT_TOGETHER_TOP_K,
+    BOUGHT_TOGETHER_WATERMARK,
+)
+from products.models import BoughtTogether, Order, OrderProduct, Sequence
+
+
+class CoOccurrenceIndex:
+    """
+    Индекс "покупают вместе" по строкам заказов.
+
+    Строки OrderProduct читаются потоком, упорядоченными по заказу.
+    Для каждого заказа все пары его продуктов добавляются в
+    разреженную матрицу совместных покупок - словарь Counter по
+    продуктам. Матрица хранится только в памяти задачи, в таблицу
+    BoughtTogether попадают top_k соседей каждого продукта.
+    Чтение - один запрос по индексу (product, -count, related).
+
+    Время начала последнего обновления хранится в Sequence. refresh
+    пересчитывает только продукты заказов, созданных или изменённых
+    (Order.updated_at) после этой отметки за вычетом
+    BOUGHT_TOGETHER_REFRESH_WINDOW секунд: окно учитывает заказы, ещё
+    не зафиксированные к прошлому обновлению. Для этих продуктов заново
+    читаются все заказы, где они встречаются, поэтому повторный учёт
+    заказа ничего не искажает. Продукт, убранный из изменённого заказа
+    вместе со всеми соседями, и транзакции длиннее окна исправляет
+    только полная перестройка, её стоит запускать периодически.
+    """
+
+    def _iter_orders(self, queryset, chunk_size):
+        """(id заказа, id продуктов) по строкам queryset."""
+        rows = (
+            queryset.order_by('order_id', 'id')
+            .values_list('order_id', 'product_id')
+            .iterator(chunk_size=chunk_size)
+        )
+        for order_id, order_rows in groupby(rows, key=itemgetter(0)):
+            yield order_id, {product_id for _, product_id in order_rows}
+
+    def _count(self, orders, product_ids=None):
+        """
+        Матрица совместных покупок {продукт: Counter(сосед: заказов)}.
+
+        product_ids ограничивает строки матрицы, соседи не ограничены.
+        """
+        matrix = defaultdict(Counter)
+        for _, order_product_ids in orders:
+            for first, second in combinations(sorted(order_product_ids), 2):
+                if product_ids is None or first in product_ids:
+                    matrix[first][second] += 1
+                if product_ids is None or second in product_ids:
+                    matrix[second][first] += 1
+        return matrix
+
+    def _replace(self, matrix, product_ids, top_k):
+        """Замена соседей product_ids на top_k из matrix."""
+        BoughtTogether.objects.filter(product_id__in=product_ids).delete()
+        BoughtTogether.objects.bulk_create(
+            (
+                BoughtTogether(
+                    product_id=product_id, related_id=related_id, count=count
+                )
+                for product_id, neighbours in matrix.items()
+                for related_id, count in neighbours.most_common(top_k)
+            ),
+            batch_size=BOUGHT_TOGETHER_CHUNK_SIZE,
+        )
+
+    def _get_watermark(self):
+        timestamp = (
+            Sequence.objects.filter(name=BOUGHT_TOGETHER_WATERMARK)
+            .values_list('value', flat=True)
+            .first()
+        )
+        if timestamp is None:
+            return None
+        return datetime.fromtimestamp(timestamp, tz=timezone.utc)
+
+    def _set_watermark(self, moment):
+        Sequence.objects.update_or_create(
+            name=BOUGHT_TOGETHER_WATERMARK,
+            defaults={'value': int(moment.timestamp())},
+        )
+
+    @transaction.atomic
+    def rebuild(
+        self,
+        top_k=BOUGHT_TOGETHER_TOP_K,
+        chunk_size=BOUGHT_TOGETHER_CHUNK_SIZE,
+    ):
+        """Полное построение индекса, возвращает число продуктов."""
+        started_at = timezone.now()
+        matrix = self._count(
+            self._iter_orders(OrderProduct.objects.all(), chunk_size)
+        )
+        BoughtTogether.objects.all().delete()
+        self._replace(matrix, (), top_k)
+        self._set_watermark(started_at)
+        return len(matrix)
+
+    @transaction.atomic
+    def refresh(
+        self,
+        top_k=BOUGHT_TOGETHER_TOP_K,
+        chunk_size=BOUGHT_TOGETHER_CHUNK_SIZE,
+    ):
+        """Учёт заказов новее отметки, возвращает число продуктов."""
+        watermark = self._get_watermark()
+        if watermark is None:
+            return self.rebuild(top_k, chunk_size)
+
+        started_at = timezone.now()
+        changed_orders = Order.objects.filter(
+            updated_at__gte=watermark
+            - timedelta(seconds=BOUGHT_TOGETHER_REFRESH_WINDOW)
+        ).values('id')
+        product_ids = set(
+            OrderProduct.objects.filter(
+                order_id__in=changed_orders
+            ).values_list('product_id', flat=True)
+        )
+        if product_ids:
+            orders = OrderProduct.objects.filter(
+                order_id__in=OrderProduct.objects.filter(
+                    product_id__in=product_ids
+                ).values('order_id'),
+            )
+            matrix = self._count(
+                self._iter_orders(orders, chunk_size), product_ids
+            )
+            self._replace(matrix, product_ids, top_k)
+        self._set_watermark(started_at)
+        return len(product_ids)
+
+    def get(self, product_id, limit=BOUGHT_TOGETHER_TOP_K):
+        """[(id соседа, число общих заказов)] одним запросом по индексу."""
+        return list(
+            BoughtTogether.objects.filter(product_id=product_id)
+            .order_by('-count', 'related_id')
+            .values_list('related_id', 'count')[:limit]
+        )
+
+
+bought_together_util = CoOccurrenceIndex()
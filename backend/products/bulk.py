@@ -0,0 +1,18 @@
+def fill_bulk_ids(model, instances):
+    """
+    Проставляет id объектам после model.objects.bulk_create(instances).
+
+    Django 3.2 не возвращает id из bulk_create на SQLite. Транзакция
+    SQLite держит блокировку записи с первого INSERT, поэтому вставленные
+    строки - последние len(instances) id таблицы. Вызывать в той же
+    транзакции, что и bulk_create.
+    """
+    if not instances or instances[0].pk is not None:
+        return
+    ids = list(
+        model.objects.order_by('-id').values_list('id', flat=True)[
+            : len(instances)
+        ]
+    )
+    for instance, pk in zip(instances, reversed(ids)):
+        instance.pk = pk
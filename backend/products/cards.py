@@ -0,0 +1,71 @@
+# Thirdparty imports
+from django.core.cache import cache
+
+# Projects imports
+from products.constants import PRODUCT_CARD_CACHE_TIMEOUT
+from products.membership import ProductMembership
+from products.readers import reader_util
+from products.reference import reference_util
+
+
+class ProductCardCache:
+    """
+    Кэш анонимных карточек продукта (формат GetProductSerializer).
+
+    Ключ карточки содержит id и updated_at продукта, поэтому любое
+    изменение продукта делает старую карточку недостижимой. Изменения
+    ProductProperty/Article/Rating сдвигают updated_at через сигналы,
+    изменения справочников - версию reference_util в ключе.
+    Флаги пользователя подставляются поверх карточки при выдаче.
+    """
+
+    def _get_cache_key(self, product, reference_version):
+        return (
+            f'product_card:{reference_version}:{product.id}:'
+            f'{product.updated_at.timestamp()}'
+        )
+
+    def _build(self, product_ids):
+        return {card['id']: card for card in reader_util.get_many(product_ids)}
+
+    def _overlay(self, card, membership):
+        card = dict(card)
+        card['is_favorited'] = card['id'] in membership.favorite_ids
+        card['is_in_shopping_cart'] = (
+            card['id'] in membership.shopping_cart_ids
+        )
+        return card
+
+    def get_many(self, products, membership=None):
+        """
+        Карточки для products - объектов с загруженными id и updated_at.
+
+        Порядок сохраняется, удалённые к этому моменту продукты пропускаются.
+        """
+        membership = membership or ProductMembership()
+        reference_version = reference_util.get_version()
+        keys = {
+            product.id: self._get_cache_key(product, reference_version)
+            for product in products
+        }
+        cards = cache.get_many(keys.values())
+
+        missing_ids = [
+            product_id for product_id, key in keys.items() if key not in cards
+        ]
+        if missing_ids:
+            built = {
+                keys[product_id]: card
+                for product_id, card in self._build(missing_ids).items()
+            }
+            cache.set_many(built, PRODUCT_CARD_CACHE_TIMEOUT)
+            cards.update(built)
+
+        return [
+            self._overlay(cards[key], membership)
+            for key in keys.values()
+            if key in cards
+        ]
+
+
+card_util = ProductCardCache()
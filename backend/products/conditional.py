@@ -0,0 +1,75 @@
+# Standart lib imports
+import hashlib
+from functools import wraps
+
+# Thirdparty imports
+from django.utils.cache import (
+    get_conditional_response,
+    patch_vary_headers,
+    quote_etag,
+)
+from rest_framework import status
+
+# Projects imports
+from products.constants import CATALOG_VERSION
+from products.versioning import version_util
+
+
+def conditional_get(handler):
+    """
+    Отвечает 304, если If-None-Match совпадает с view.get_etag().
+
+    Применяется к list/retrieve, которые view переопределяет поверх
+    ConditionalGetViewMixin.
+    """
+
+    @wraps(handler)
+    def wrapper(self, request, *args, **kwargs):
+        etag = self.get_etag()
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = handler(self, request, *args, **kwargs)
+
+        if response.status_code in (
+            status.HTTP_200_OK,
+            status.HTTP_304_NOT_MODIFIED,
+        ):
+            response['ETag'] = etag
+            patch_vary_headers(response, ('Authorization', 'Cookie'))
+        return response
+
+    return wrapper
+
+
+class ConditionalGetViewMixin:
+    """
+    ETag и ответ 304 Not Modified для list и retrieve.
+
+    ETag собирается из версий etag_scopes, пути запроса с параметрами
+    и get_etag_parts(). При совпадении с If-None-Match основной запрос
+    и сериализатор не выполняются.
+    """
+
+    etag_scopes = (CATALOG_VERSION,)
+
+    def get_etag_parts(self):
+        """Дополнительные данные, от которых зависит ответ."""
+        return ()
+
+    def get_etag(self):
+        parts = (
+            *version_util.get(*self.etag_scopes),
+            self.request.get_full_path(),
+            *self.get_etag_parts(),
+        )
+        return quote_etag(
+            hashlib.md5('|'.join(map(str, parts)).encode()).hexdigest()
+        )
+
+    @conditional_get
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+    @conditional_get
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
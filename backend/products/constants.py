@@ -3,6 +3,14 @@ LONG_STR_CUT_VALUE = 15
 
 # ORDER
 DEFAULT_ORDER_TOTAL_PRICE = 0
+DEFAULT_ORDER_QUANTITY = 1
+MIN_ORDER_QUANTITY = 1
+DEFAULT_UNIT_PRICE = 0
+ORDER_HISTORY_PAGE_SIZE = 20
+ORDER_HISTORY_MAX_PAGE_SIZE = 100
+ORDER_HISTORY_CURSOR_QUERY_PARAM = 'before'
+ORDER_HISTORY_INDEX_NAME = 'order_customer_id_idx'
+ORDER_UPDATED_AT_INDEX_NAME = 'order_updated_at_idx'
 
 # CATEGORY
 CATEGORY_NAME_MAX_LENGTH = 32
@@ -17,7 +25,101 @@ MAX_VALUE_LENGTH = 255
 MAX_DESCRIPTION_LENGTH = 1000
 MIN_DESCRIPTION_LENGTH = 5
 DEFAULT_RATING = 0
+DEFAULT_RATING_COUNT = 0
+RATING_REBUILD_CHUNK_SIZE = 1000
 DEFAULT_ARTICLE_DIGIT = '100001'
+ARTICLE_MAX_LENGTH = 32
+# Число в начале значения характеристики: '650 Вт' -> 650.
+PROPERTY_NUMBER_PATTERN = r'^\s*(\d+)'
+PRODUCT_PROPERTY_NUMBER_INDEX_NAME = 'product_property_number_idx'
+PROPERTY_NUMBER_FILL_CHUNK_SIZE = 1000
+PRODUCTS_PAGE_SIZE = 20
+PRODUCTS_MAX_PAGE_SIZE = 100
+FACETS_QUERY_PARAM = 'facets'
+FIELDS_QUERY_PARAM = 'fields'
+OMIT_QUERY_PARAM = 'omit'
+
+# Поле ответа продукта -> select_related, нужный для него.
+PRODUCT_SELECT_RELATED = {
+    'article': 'article_by_product',
+    'creator': 'creator',
+}
+
+# SEQUENCE
+SEQUENCE_NAME_MAX_LENGTH = 64
+SEQUENCE_BLOCK_SIZE = 100
+ARTICLE_SEQUENCE = 'article'
+
+# SEARCH
+SEARCH_QUERY_PARAM = 'search'
+SEARCH_LANGUAGE = 'russian'
+SEARCH_NAME_WEIGHT = 10.0
+SEARCH_DESCRIPTION_WEIGHT = 1.0
+SEARCH_INDEX_CHUNK_SIZE = 1000
+SEARCH_STEM_CACHE_SIZE = 100_000
+
+# EXPORT
+EXPORT_FORMAT_QUERY_PARAM = 'file_format'
+EXPORT_CHUNK_SIZE = 1000
+EXPORT_FIELDS = (
+    'id',
+    'name',
+    'description',
+    'category',
+    'sub_category',
+    'product_type',
+    'properties',
+    'price',
+    'rating',
+    'rating_count',
+    'article',
+)
+EXPORT_CONTENT_TYPES = {
+    'jsonl': 'application/x-ndjson; charset=utf-8',
+    'csv': 'text/csv; charset=utf-8',
+}
+
+# IMPORT
+IMPORT_FORMAT_QUERY_PARAM = 'file_format'
+IMPORT_FILE_FIELD = 'file'
+IMPORT_BATCH_SIZE = 1000
+IMPORT_PROPERTIES_SEPARATOR = ';'
+
+# MINIMAL RESPONSE
+PREFER_RETURN_MINIMAL = 'return=minimal'
+RETURN_QUERY_PARAM = 'return'
+RETURN_ID = 'id'
+
+# LEADERBOARD
+LEADERBOARD_RATING = 'rating'
+LEADERBOARD_FAVORITES = 'favorites'
+LEADERBOARD_SALES = 'sales'
+LEADERBOARDS = (LEADERBOARD_RATING, LEADERBOARD_FAVORITES, LEADERBOARD_SALES)
+LEADERBOARD_PAGE_SIZE = 50
+# Лист хранит больше позиций, чем отдаётся, чтобы после понижения
+# продукта его место занял следующий без перестроения.
+LEADERBOARD_CAPACITY = 200
+
+# BOUGHT TOGETHER
+BOUGHT_TOGETHER_TOP_K = 10
+BOUGHT_TOGETHER_CHUNK_SIZE = 10000
+BOUGHT_TOGETHER_WATERMARK = 'bought_together_updated_at'
+BOUGHT_TOGETHER_REFRESH_WINDOW = 60 * 10
+BOUGHT_TOGETHER_INDEX_NAME = 'bought_together_product_idx'
+
+# BATCH
+BATCH_MAX_SIZE = 500
+
+# CACHE
+MEMBERSHIP_CACHE_TIMEOUT = 60 * 15
+PRODUCT_CARD_CACHE_TIMEOUT = 60 * 60
+CATALOG_VERSION = 'catalog'
+REFERENCE_VERSION = 'reference'
+REFERENCE_CHECK_INTERVAL = 1
+REFERENCE_MAX_AGE = 60 * 5
+RESPONSE_CACHE_TIMEOUT = 60 * 10
+LEADERBOARD_CACHE_TIMEOUT = None
+PRODUCT_TYPE_CACHE_TIMEOUT = 60 * 60
 
 # ERR MESSAGES
 RATING_ALREADY_EXIST = 'Вы уже оценили данный продукт'
@@ -25,3 +127,17 @@ FAVORITE_ALREADY_EXIST = 'Этот продукт уже в избранном.'
 SHOPPING_CART_ALREADY_EXIST = 'Этот продукт уже в корзине.'
 PRICE_ERR_MSG = 'Стоимость товара не может быть менее 1 (еденицы).'
 PRODUCT_NAME_ERR_MSG = 'Длина поля name не должна превышать {} знаков.'
+EXPORT_FORMAT_ERR_MSG = 'Поддерживаемые форматы выгрузки: {}.'
+ORDER_PRODUCT_NOT_FOUND_ERR_MSG = 'Продукты с id {} не существуют.'
+CART_EMPTY_ERR_MSG = 'Корзина пуста.'
+ORDER_EMPTY_ERR_MSG = 'Заказ должен содержать хотя бы один продукт.'
+IMPORT_FORMAT_ERR_MSG = 'Поддерживаемые форматы загрузки: {}.'
+IMPORT_FILE_ERR_MSG = 'Передайте файл в поле "{}".'
+REFERENCE_NOT_FOUND_ERR_MSG = (
+    'Недопустимый первичный ключ "{pk_value}" - объект не существует.'
+)
+PRODUCT_NAME_EXISTS_ERR_MSG = 'Продукт с таким названием уже существует.'
+IMPORT_ROW_ERR_MSG = 'Не удалось разобрать строку: {}'
+PROPERTY_FILTER_ERR_MSG = (
+    'Ожидается значение вида "<id характеристики>:<значение>", получено "{}".'
+)
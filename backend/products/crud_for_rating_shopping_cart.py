@@ -1,41 +1,85 @@
 # Thirdparty imports
 from django.db.models import Avg
+from django.http import Http404
 from django.shortcuts import get_object_or_404
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.serializers import ValidationError
 
 # Projects imports
+from products.constants import LEADERBOARD_FAVORITES
 from products.exceptions import ProductAlreadyExist
-from products.models import Product, Rating
-from products.serializers import GetProductSerializer, RatingSerializer
+from products.leaderboard import leaderboard_util
+from products.membership import membership_util
+from products.minimal_response import minimal_response
+from products.models import Favorite, Product, Rating
+from products.rating import rating_util
+from products.serializers import (
+    GetProductSerializer,
+    ProductBatchSerializer,
+    RatingScoreSerializer,
+    RatingSerializer,
+)
+
+
+def _update_leaderboard(model, product_ids):
+    """Оценки обновляет rating_util, здесь - топ по избранному."""
+    if model is Favorite:
+        leaderboard_util.update_on_commit(LEADERBOARD_FAVORITES, product_ids)
 
 
 def create_rating_favorite_shopping_cart(
-    request, serializer_class, pk, extra_fields=None
+    request, serializer_class, pk, minimal=False
 ):
     instance = get_object_or_404(Product, id=pk)
 
-    data = {'user': request.user.id, 'product': instance.id}
-    if extra_fields:
-        data.update(extra_fields)
-
-    serializer = serializer_class(data=data)
+    serializer = serializer_class(
+        data={'user': request.user.id, 'product': instance.id}
+    )
     serializer.is_valid(raise_exception=True)
     serializer.save()
 
+    membership_util.invalidate(request.user.id, serializer_class.Meta.model)
+    _update_leaderboard(serializer_class.Meta.model, [pk])
+    if minimal:
+        return minimal_response(instance, status.HTTP_201_CREATED)
+
     instance = get_object_or_404(
-        Product.objects.get_annotated_queryset(request.user), id=pk
+        Product.objects.get_annotated_queryset(), id=pk
     )
 
-    serializer = GetProductSerializer(instance)
+    serializer = GetProductSerializer(
+        instance, context={'membership': membership_util.get(request.user)}
+    )
     return Response(data=serializer.data, status=status.HTTP_201_CREATED)
 
 
+def rate_product(request, pk):
+    """Upsert оценки, в ответе новые агрегаты рейтинга продукта."""
+    serializer = RatingScoreSerializer(data=request.data)
+    serializer.is_valid(raise_exception=True)
+
+    result = rating_util.rate(
+        request.user, pk, serializer.validated_data['score']
+    )
+    if result is None:
+        raise Http404
+    created = result.pop('created')
+    return Response(
+        data=result,
+        status=status.HTTP_201_CREATED if created else status.HTTP_200_OK,
+    )
+
+
 def delete_rating_favorite_shopping_cart(request, queryset, pk):
     get_object_or_404(Product, id=pk)
 
     instance = queryset.filter(user=request.user, product_id=pk)
+
+    score = None
+    if instance.model is Rating:
+        score = instance.values_list('score', flat=True).first()
+
     count, _ = instance.delete()
 
     if not count:
@@ -44,4 +88,69 @@ def delete_rating_favorite_shopping_cart(request, queryset, pk):
             f'\'{instance.model._meta.verbose_name}\'.'
         )
 
+    if score is not None:
+        rating_util.remove(pk, score)
+    membership_util.invalidate(request.user.id, queryset.model)
+    _update_leaderboard(queryset.model, [pk])
+
     return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+def _get_batch_product_ids(request):
+    serializer = ProductBatchSerializer(data=request.data)
+    serializer.is_valid(raise_exception=True)
+    return list(dict.fromkeys(serializer.validated_data['products']))
+
+
+def batch_create_favorite_shopping_cart(request, model):
+    """
+    Пакетное добавление в избранное или корзину.
+
+    Один SELECT существующих продуктов и один INSERT: уже добавленные
+    продукты пропускаются через ignore_conflicts вместо проверки
+    UniqueTogetherValidator по каждому.
+    """
+    product_ids = _get_batch_product_ids(request)
+    existing_ids = set(
+        Product.objects.filter(id__in=product_ids).values_list(
+            'id', flat=True
+        )
+    )
+    model.objects.bulk_create(
+        (
+            model(user=request.user, product_id=product_id)
+            for product_id in product_ids
+            if product_id in existing_ids
+        ),
+        ignore_conflicts=True,
+    )
+    membership_util.invalidate(request.user.id, model)
+    _update_leaderboard(model, product_ids)
+
+    return Response(
+        data={
+            'products': [
+                product_id
+                for product_id in product_ids
+                if product_id in existing_ids
+            ],
+            'not_found': [
+                product_id
+                for product_id in product_ids
+                if product_id not in existing_ids
+            ],
+        },
+        status=status.HTTP_200_OK,
+    )
+
+
+def batch_delete_favorite_shopping_cart(request, model):
+    """Пакетное удаление из избранного или корзины одним DELETE."""
+    product_ids = _get_batch_product_ids(request)
+    count, _ = model.objects.filter(
+        user=request.user, product_id__in=product_ids
+    ).delete()
+    membership_util.invalidate(request.user.id, model)
+    _update_leaderboard(model, product_ids)
+
+    return Response(data={'deleted': count}, status=status.HTTP_200_OK)
@@ -0,0 +1,93 @@
+# Standart lib imports
+import csv
+import json
+
+# Thirdparty imports
+from rest_framework.utils.encoders import JSONEncoder
+
+# Projects imports
+from products.constants import EXPORT_FIELDS
+from products.readers import reader_util
+
+
+class Echo:
+    """Псевдофайл для csv.writer: writerow возвращает готовую строку."""
+
+    def write(self, value):
+        return value
+
+
+class CatalogExporter:
+    """
+    Построчная выгрузка каталога в JSONL и CSV.
+
+    id продуктов читаются через .iterator(chunk_size), каждая пачка
+    собирается reader_util двумя запросами. В памяти одновременно
+    находится не больше chunk_size продуктов при любом размере каталога.
+    """
+
+    csv_header = (
+        'id',
+        'name',
+        'description',
+        'category',
+        'sub_category',
+        'product_type',
+        'properties',
+        'price',
+        'rating',
+        'rating_count',
+        'article',
+    )
+
+    def iter_products(self, queryset, chunk_size):
+        chunk = []
+        for product_id in (
+            queryset.order_by('id')
+            .values_list('id', flat=True)
+            .iterator(chunk_size=chunk_size)
+        ):
+            chunk.append(product_id)
+            if len(chunk) == chunk_size:
+                yield from reader_util.get_many(chunk, fields=EXPORT_FIELDS)
+                chunk = []
+        if chunk:
+            yield from reader_util.get_many(chunk, fields=EXPORT_FIELDS)
+
+    def iter_jsonl(self, queryset, chunk_size):
+        for product in self.iter_products(queryset, chunk_size):
+            yield (
+                json.dumps(product, cls=JSONEncoder, ensure_ascii=False)
+                + '\n'
+            )
+
+    def _get_csv_row(self, product):
+        return (
+            product['id'],
+            product['name'],
+            product['description'],
+            product['category']['name'],
+            product['sub_category']['name'],
+            product['product_type']['name'],
+            '; '.join(
+                f'{product_property["name"]}={product_property["value"]}'
+                for product_property in product['properties']
+            ),
+            product['price'],
+            product['rating'],
+            product['rating_count'],
+            product['article'],
+        )
+
+    def iter_csv(self, queryset, chunk_size):
+        writer = csv.writer(Echo())
+        yield writer.writerow(self.csv_header)
+        for product in self.iter_products(queryset, chunk_size):
+            yield writer.writerow(self._get_csv_row(product))
+
+    def iter_lines(self, file_format, queryset, chunk_size):
+        """Строки файла file_format ('jsonl' или 'csv')."""
+        return getattr(self, f'iter_{file_format}')(queryset, chunk_size)
+
+
+export_util = CatalogExporter()
@@ -0,0 +1,155 @@
+# Standart lib imports
+from collections import defaultdict
+from operator import itemgetter
+
+# Thirdparty imports
+import django_filters
+from django import forms
+from django.db.models import Count, Q
+from rest_framework.filters import BaseFilterBackend
+
+# Projects imports
+from products.constants import PROPERTY_FILTER_ERR_MSG, SEARCH_QUERY_PARAM
+from products.models import Product, ProductProperty
+from products.reference import reference_util
+from products.search import get_search_backend
+
+
+class PropertyValueField(forms.Field):
+    """Список значений вида '<id характеристики>:<значение>'."""
+
+    widget = forms.MultipleHiddenInput
+
+    def to_python(self, value):
+        property_values = []
+        for item in value or ():
+            property_id, _, property_value = item.partition(':')
+            if not property_id.isdigit() or not property_value:
+                raise forms.ValidationError(
+                    PROPERTY_FILTER_ERR_MSG.format(item)
+                )
+            property_values.append((int(property_id), property_value))
+        return property_values
+
+
+def group_property_values(property_values):
+    """{id характеристики: [значения]} из [(id, значение)]."""
+    values_by_property = defaultdict(list)
+    for property_id, property_value in property_values or ():
+        values_by_property[property_id].append(property_value)
+    return values_by_property
+
+
+def filter_by_properties(qs, values_by_property):
+    """
+    Продукты qs со значениями values_by_property.
+
+    Значения одной характеристики объединяются через ИЛИ, разные
+    характеристики - через И. Каждая характеристика превращается в
+    подзапрос id IN (...), который читается по индексу
+    (property, value, product) без обращения к самой таблице.
+    """
+    for property_id, property_values in values_by_property.items():
+        qs = qs.filter(
+            id__in=ProductProperty.objects.filter(
+                property_id=property_id, value__in=property_values
+            ).values('product_id')
+        )
+    return qs
+
+
+class PropertyValueFilter(django_filters.Filter):
+    """Фильтр по EAV-таблице ProductProperty, см. filter_by_properties."""
+
+    field_class = PropertyValueField
+
+    def filter(self, qs, value):
+        return filter_by_properties(qs, group_property_values(value))
+
+
+class ProductFilter(django_filters.FilterSet):
+
+    property = PropertyValueFilter()
+
+    class Meta:
+        model = Product
+        fields = ('property',)
+
+
+class ProductSearchFilter(BaseFilterBackend):
+    """
+    Полнотекстовый поиск ?search=.
+
+    Оставляет найденные продукты и добавляет аннотацию search_rank
+    (меньше - релевантнее), по которой сортирует пагинация.
+    """
+
+    search_param = SEARCH_QUERY_PARAM
+
+    def filter_queryset(self, request, queryset, view):
+        query = request.query_params.get(self.search_param, '').strip()
+        if not query:
+            return queryset
+        return get_search_backend().search(queryset, query)
+
+
+def _count_values(queryset, condition):
+    return (
+        ProductProperty.objects.filter(
+            condition, product_id__in=queryset.order_by().values('id')
+        )
+        .values('property_id', 'value')
+        .annotate(count=Count('product_id'))
+        .order_by()
+    )
+
+
+def get_facets(queryset, property_values=()):
+    """
+    Количество продуктов по каждому значению характеристик.
+
+    queryset - продукты без фильтра по характеристикам, property_values -
+    значения этого фильтра [(id характеристики, значение)]. Фасеты
+    дизъюнктивные: значения выбранной характеристики считаются по
+    фильтрам остальных характеристик без её собственного, чтобы клиент
+    видел, сколько продуктов добавит соседнее значение. Невыбранные
+    характеристики считаются по полному фильтру. Все подсчёты идут
+    одним запросом UNION ALL.
+    """
+    values_by_property = group_property_values(property_values)
+    counts = [
+        _count_values(
+            filter_by_properties(queryset, values_by_property),
+            ~Q(property_id__in=values_by_property),
+        )
+    ]
+    for property_id in values_by_property:
+        others = {
+            other_id: values
+            for other_id, values in values_by_property.items()
+            if other_id != property_id
+        }
+        counts.append(
+            _count_values(
+                filter_by_properties(queryset, others),
+                Q(property_id=property_id),
+            )
+        )
+    rows = sorted(
+        counts[0].union(*counts[1:], all=True),
+        key=itemgetter('property_id', 'value'),
+    )
+
+    facets = {}
+    for row in rows:
+        property_id = row['property_id']
+        if property_id not in facets:
+            facets[property_id] = {
+                'id': property_id,
+                'name': reference_util.get('property', property_id)['name'],
+                'values': [],
+            }
+        facets[property_id]['values'].append(
+            {'value': row['value'], 'count': row['count']}
+        )
+    return list(facets.values())
@@ -0,0 +1,170 @@
+# Standart lib imports
+import csv
+import json
+from dataclasses import dataclass, field
+from itertools import islice
+
+# Thirdparty imports
+from django.db import transaction
+from rest_framework.exceptions import ValidationError
+from rest_framework.serializers import as_serializer_error
+
+# Projects imports
+from products.article import article_util
+from products.bulk import fill_bulk_ids
+from products.constants import (
+    CATALOG_VERSION,
+    IMPORT_PROPERTIES_SEPARATOR,
+    IMPORT_ROW_ERR_MSG,
+    PRODUCT_NAME_EXISTS_ERR_MSG,
+)
+from products.models import Product, ProductProperty
+from products.search import get_search_backend
+from products.serializers import ImportProductSerializer
+from products.versioning import version_util
+
+REFERENCE_FIELDS = ('category', 'sub_category', 'product_type')
+
+
+@dataclass
+class ImportReport:
+    """Итог импорта: число созданных продуктов и ошибки по строкам."""
+
+    created: int = 0
+    errors: list = field(default_factory=list)
+
+    def add_error(self, line, errors):
+        self.errors.append({'line': line, 'errors': errors})
+
+    def as_dict(self):
+        return {'created': self.created, 'errors': self.errors}
+
+
+class ProductImporter:
+    """
+    Потоковый импорт продуктов из CSV и JSONL.
+
+    Файл читается построчно пачками batch_size. Строки пачки проверяются
+    одним экземпляром ImportProductSerializer без запросов к БД: ссылки
+    на справочники сверяются с reference_util. Затем валидные строки
+    одной транзакцией вставляются через bulk_create в Product, Article
+    и ProductProperty. bulk_create не отправляет сигналы, поэтому
+    поисковый индекс и версия каталога обновляются здесь.
+    """
+
+    def _parse_csv_properties(self, value):
+        """'<id>:<значение>; <id>:<значение>' -> список для сериализатора."""
+        properties = []
+        for item in (value or '').split(IMPORT_PROPERTIES_SEPARATOR):
+            if item.strip():
+                property_id, _, property_value = item.strip().partition(':')
+                properties.append({'id': property_id, 'value': property_value})
+        return properties
+
+    def _iter_csv(self, stream):
+        reader = csv.DictReader(stream)
+        for row in reader:
+            row['properties'] = self._parse_csv_properties(
+                row.get('properties')
+            )
+            yield reader.line_num, row, None
+
+    def _iter_jsonl(self, stream):
+        for line, text in enumerate(stream, start=1):
+            if not text.strip():
+                continue
+            try:
+                yield line, json.loads(text), None
+            except ValueError as error:
+                yield line, None, IMPORT_ROW_ERR_MSG.format(error)
+
+    def iter_rows(self, stream, file_format):
+        """(номер строки, данные строки, ошибка разбора)."""
+        return getattr(self, f'_iter_{file_format}')(stream)
+
+    def _iter_batches(self, rows, batch_size):
+        while batch := list(islice(rows, batch_size)):
+            yield batch
+
+    def _validate(self, rows):
+        """
+        Проверка пачки одним экземпляром сериализатора.
+
+        run_validation не копирует поля на каждую строку, в отличие от
+        ImportProductSerializer(data=...) и is_valid().
+        """
+        serializer = ImportProductSerializer()
+        results = []
+        for line, data, error in rows:
+            if error is None and not isinstance(data, dict):
+                error = IMPORT_ROW_ERR_MSG.format(data)
+            if error is not None:
+                results.append((line, None, [error]))
+                continue
+            try:
+                results.append((line, serializer.run_validation(data), None))
+            except ValidationError as exc:
+                results.append((line, None, as_serializer_error(exc)))
+        return results
+
+    def _exclude_existing_names(self, rows, report):
+        """Product.name уникален: повторы в файле и в БД уходят в отчёт."""
+        existing = set(
+            Product.objects.filter(
+                name__in=[data['name'] for _, data in rows]
+            ).values_list('name', flat=True)
+        )
+        unique_rows = []
+        for line, data in rows:
+            if data['name'] in existing:
+                report.add_error(
+                    line, {'name': [PRODUCT_NAME_EXISTS_ERR_MSG]}
+                )
+                continue
+            existing.add(data['name'])
+            unique_rows.append(data)
+        return unique_rows
+
+    @transaction.atomic
+    def _save(self, rows, creator):
+        products = []
+        properties = []
+        for data in rows:
+            data = dict(data)
+            properties.append(data.pop('properties'))
+            for reference_field in REFERENCE_FIELDS:
+                data[f'{reference_field}_id'] = data.pop(reference_field)
+            products.append(Product(creator=creator, **data))
+
+        Product.objects.bulk_create(products)
+        fill_bulk_ids(Product, products)
+        article_util.create_many(products)
+        ProductProperty.objects.bulk_create(
+            ProductProperty(product=product, **product_property)
+            for product, product_properties in zip(products, properties)
+            for product_property in product_properties
+        )
+        get_search_backend().index(products)
+
+    def run(self, stream, file_format, creator, batch_size):
+        report = ImportReport()
+        rows = self.iter_rows(stream, file_format)
+        for batch in self._iter_batches(rows, batch_size):
+            valid_rows = []
+            for line, data, errors in self._validate(batch):
+                if errors is None:
+                    valid_rows.append((line, data))
+                else:
+                    report.add_error(line, errors)
+
+            valid_rows = self._exclude_existing_names(valid_rows, report)
+            if valid_rows:
+                self._save(valid_rows, creator)
+                report.created += len(valid_rows)
+
+        if report.created:
+            version_util.bump(CATALOG_VERSION)
+        return report
+
+
+import_util = ProductImporter()
@@ -0,0 +1,123 @@
+# Thirdparty imports
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, F, Sum
+from django.db.models.functions import Coalesce
+
+# Projects imports
+from products.constants import (
+    LEADERBOARD_CACHE_TIMEOUT,
+    LEADERBOARD_CAPACITY,
+    LEADERBOARD_FAVORITES,
+    LEADERBOARD_RATING,
+    LEADERBOARD_SALES,
+)
+from products.models import Category, Product
+
+# Рейтинг -> выражение очков продукта.
+SCORES = {
+    LEADERBOARD_RATING: F('rating_avg'),
+    LEADERBOARD_FAVORITES: Count('favorite_list'),
+    LEADERBOARD_SALES: Coalesce(Sum('order_product_by_product__quantity'), 0),
+}
+
+
+class Leaderboard:
+    """
+    Топы продуктов по рейтингу, избранному и продажам.
+
+    Каждый лист - список [id продукта, очки] по убыванию очков в кэше,
+    общий и по каждой категории, не длиннее LEADERBOARD_CAPACITY.
+    Чтение страницы - один cache.get. После записи Rating, Favorite или
+    OrderProduct update пересчитывает очки только затронутых продуктов
+    одним запросом и вливает их в листы. Гонки параллельных обновлений
+    и вытесненные из листа продукты исправляет полная перестройка
+    командой rebuild_leaderboards или при отсутствии листа в кэше.
+    """
+
+    def _get_cache_key(self, by, category_id):
+        return f'leaderboard:{by}:{category_id or "all"}'
+
+    def _get_scores(self, by, queryset):
+        return queryset.annotate(score=SCORES[by]).values_list(
+            'id', 'category_id', 'score'
+        )
+
+    def _sort(self, board):
+        return sorted(
+            ([product_id, score] for product_id, score in board.items()),
+            key=lambda item: (-item[1], item[0]),
+        )[:LEADERBOARD_CAPACITY]
+
+    def _build(self, by, category_id):
+        queryset = Product.objects.order_by()
+        if category_id is not None:
+            queryset = queryset.filter(category_id=category_id)
+        rows = (
+            self._get_scores(by, queryset)
+            .filter(score__gt=0)
+            .order_by('-score', 'id')
+        )
+        board = [
+            [product_id, score]
+            for product_id, _, score in rows[:LEADERBOARD_CAPACITY]
+        ]
+        cache.set(
+            self._get_cache_key(by, category_id),
+            board,
+            LEADERBOARD_CACHE_TIMEOUT,
+        )
+        return board
+
+    def get(self, by, category_id=None, limit=None):
+        """[id продукта, очки] первых limit позиций листа."""
+        board = cache.get(self._get_cache_key(by, category_id))
+        if board is None:
+            board = self._build(by, category_id)
+        return board[:limit]
+
+    def update(self, by, product_ids):
+        """Пересчёт очков product_ids в общем листе и листах их категорий."""
+        product_ids = set(product_ids)
+        rows = self._get_scores(
+            by, Product.objects.filter(id__in=product_ids).order_by()
+        )
+        # Ключ листа -> {id продукта: очки или None для удаления}.
+        changes = {self._get_cache_key(by, None): {}}
+        for product_id, category_id, score in rows:
+            score = score if score > 0 else None
+            changes[self._get_cache_key(by, None)][product_id] = score
+            changes.setdefault(self._get_cache_key(by, category_id), {})[
+                product_id
+            ] = score
+        # Удалённые продукты убираются из общего листа.
+        for product_id in product_ids:
+            changes[self._get_cache_key(by, None)].setdefault(product_id)
+
+        boards = cache.get_many(changes)
+        for key, board in boards.items():
+            board = dict(board)
+            for product_id, score in changes[key].items():
+                board.pop(product_id, None)
+                if score is not None:
+                    board[product_id] = score
+            boards[key] = self._sort(board)
+        cache.set_many(boards, LEADERBOARD_CACHE_TIMEOUT)
+
+    def update_on_commit(self, by, product_ids):
+        """update после фиксации транзакции, когда запись уже видна."""
+        product_ids = list(product_ids)
+        transaction.on_commit(lambda: self.update(by, product_ids))
+
+    def rebuild(self):
+        """Перестройка всех листов, возвращает их количество."""
+        category_ids = [None] + list(
+            Category.objects.values_list('id', flat=True)
+        )
+        for by in SCORES:
+            for category_id in category_ids:
+                self._build(by, category_id)
+        return len(SCORES) * len(category_ids)
+
+
+leaderboard_util = Leaderboard()
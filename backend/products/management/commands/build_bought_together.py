@@ -0,0 +1,46 @@
+# Thirdparty imports
+from django.core.management.base import BaseCommand
+
+# Projects imports
+from products.bought_together import bought_together_util
+from products.constants import (
+    BOUGHT_TOGETHER_CHUNK_SIZE,
+    BOUGHT_TOGETHER_TOP_K,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Обновляет индекс "покупают вместе" по новым заказам, '
+        'с --full строит его заново.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--full',
+            action='store_true',
+            help='Перестроить индекс по всем заказам.',
+        )
+        parser.add_argument(
+            '--top-k',
+            type=int,
+            default=BOUGHT_TOGETHER_TOP_K,
+            help='Количество соседей, хранимых для продукта.',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=BOUGHT_TOGETHER_CHUNK_SIZE,
+            help='Количество строк заказов, читаемых за один раз.',
+        )
+
+    def handle(self, *args, **options):
+        build = (
+            bought_together_util.rebuild
+            if options['full']
+            else bought_together_util.refresh
+        )
+        updated = build(options['top_k'], options['chunk_size'])
+        self.stdout.write(
+            self.style.SUCCESS(f'Обновлены соседи {updated} продуктов.')
+        )
@@ -0,0 +1,53 @@
+# Standart lib imports
+from functools import partial
+
+# Thirdparty imports
+from django.core.management.base import BaseCommand
+
+# Projects imports
+from products.constants import EXPORT_CHUNK_SIZE, EXPORT_CONTENT_TYPES
+from products.export import export_util
+from products.models import Product
+
+
+class Command(BaseCommand):
+    help = 'Выгружает весь каталог в JSONL или CSV.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--file-format',
+            choices=tuple(EXPORT_CONTENT_TYPES),
+            default='jsonl',
+            help='Формат выгрузки.',
+        )
+        parser.add_argument(
+            '--output',
+            help='Путь к файлу. По умолчанию выгрузка пишется в stdout.',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=EXPORT_CHUNK_SIZE,
+            help='Количество продуктов, читаемых за один запрос.',
+        )
+
+    def export(self, write, options):
+        for line in export_util.iter_lines(
+            options['file_format'],
+            Product.objects.all(),
+            options['chunk_size'],
+        ):
+            write(line)
+
+    def handle(self, *args, **options):
+        if not options['output']:
+            self.export(partial(self.stdout.write, ending=''), options)
+            return
+
+        with open(
+            options['output'], 'w', encoding='utf-8', newline=''
+        ) as stream:
+            self.export(stream.write, options)
+        self.stdout.write(
+            self.style.SUCCESS(f'Каталог выгружен в {options["output"]}.')
+        )
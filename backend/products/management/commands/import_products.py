@@ -0,0 +1,72 @@
+# Standart lib imports
+import json
+from pathlib import Path
+
+# Thirdparty imports
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+# Projects imports
+from products.constants import EXPORT_CONTENT_TYPES, IMPORT_BATCH_SIZE
+from products.importer import import_util
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = 'Загружает продукты из файла CSV или JSONL.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='Путь к файлу.')
+        parser.add_argument(
+            '--creator',
+            required=True,
+            help='email пользователя, указываемого создателем продуктов.',
+        )
+        parser.add_argument(
+            '--file-format',
+            choices=tuple(EXPORT_CONTENT_TYPES),
+            help='Формат файла. По умолчанию берётся из расширения.',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=IMPORT_BATCH_SIZE,
+            help='Количество строк, проверяемых и вставляемых за раз.',
+        )
+        parser.add_argument(
+            '--report',
+            help='Путь к файлу JSONL с ошибками по строкам.',
+        )
+
+    def handle(self, *args, **options):
+        path = Path(options['path'])
+        file_format = options['file_format'] or path.suffix.lstrip('.')
+        if file_format not in EXPORT_CONTENT_TYPES:
+            raise CommandError(f'Неизвестный формат файла: {file_format}.')
+        try:
+            creator = User.objects.get(email=options['creator'])
+        except User.DoesNotExist:
+            raise CommandError(
+                f'Пользователь {options["creator"]} не найден.'
+            )
+
+        with open(path, encoding='utf-8', newline='') as stream:
+            report = import_util.run(
+                stream,
+                file_format,
+                creator,
+                options['batch_size'],
+            )
+
+        if options['report']:
+            with open(options['report'], 'w', encoding='utf-8') as stream:
+                for error in report.errors:
+                    stream.write(json.dumps(error, ensure_ascii=False) + '\n')
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Создано продуктов: {report.created}, '
+                f'строк с ошибками: {len(report.errors)}.'
+            )
+        )
@@ -0,0 +1,16 @@
+# Thirdparty imports
+from django.core.management.base import BaseCommand
+
+# Projects imports
+from products.leaderboard import leaderboard_util
+
+
+class Command(BaseCommand):
+    help = (
+        'Перестраивает топы продуктов по рейтингу, избранному и продажам. '
+        'Запускается периодически, например из cron.'
+    )
+
+    def handle(self, *args, **options):
+        rebuilt = leaderboard_util.rebuild()
+        self.stdout.write(self.style.SUCCESS(f'Перестроено {rebuilt} топов.'))
@@ -0,0 +1,24 @@
+# Thirdparty imports
+from django.core.management.base import BaseCommand
+
+# Projects imports
+from products.constants import RATING_REBUILD_CHUNK_SIZE
+from products.rating import rating_util
+
+
+class Command(BaseCommand):
+    help = 'Пересчитывает rating_avg/rating_count продуктов по таблице Rating.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=RATING_REBUILD_CHUNK_SIZE,
+            help='Количество продуктов, пересчитываемых в одной транзакции.',
+        )
+
+    def handle(self, *args, **options):
+        updated = rating_util.rebuild(options['chunk_size'])
+        self.stdout.write(
+            self.style.SUCCESS(f'Обновлён рейтинг {updated} продуктов.')
+        )
@@ -0,0 +1,25 @@
+# Thirdparty imports
+from django.core.management.base import BaseCommand
+
+# Projects imports
+from products.constants import SEARCH_INDEX_CHUNK_SIZE
+from products.models import Product
+from products.search import get_search_backend
+
+
+class Command(BaseCommand):
+    help = 'Переиндексирует продукты для полнотекстового поиска.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=SEARCH_INDEX_CHUNK_SIZE,
+            help='Количество продуктов, индексируемых за один запрос.',
+        )
+
+    def handle(self, *args, **options):
+        get_search_backend().rebuild(
+            Product.objects.all(), options['chunk_size']
+        )
+        self.stdout.write(self.style.SUCCESS('Поисковый индекс перестроен.'))
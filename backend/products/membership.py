@@ -0,0 +1,75 @@
+# Standart lib imports
+from dataclasses import dataclass
+
+# Thirdparty imports
+from django.core.cache import cache
+from django.db import transaction
+
+# Projects imports
+from products.constants import MEMBERSHIP_CACHE_TIMEOUT
+from products.models import Favorite, ShoppingCart
+
+
+@dataclass(frozen=True)
+class ProductMembership:
+    """Множества id продуктов в избранном и корзине пользователя."""
+
+    favorite_ids: frozenset = frozenset()
+    shopping_cart_ids: frozenset = frozenset()
+
+
+class UserProductMembership:
+    """
+    Загрузка и кэширование ProductMembership пользователя.
+
+    Множества читаются одним cache.get_many на запрос, при промахе -
+    одним SELECT product_id на модель. Пути записи в Favorite/ShoppingCart
+    обязаны вызывать invalidate.
+    """
+
+    MODELS = {
+        'favorite_ids': Favorite,
+        'shopping_cart_ids': ShoppingCart,
+    }
+
+    def _get_cache_key(self, model, user_id):
+        return f'membership:{model._meta.model_name}:{user_id}'
+
+    def get(self, user):
+        if not user.is_authenticated:
+            return ProductMembership()
+
+        keys = {
+            field: self._get_cache_key(model, user.id)
+            for field, model in self.MODELS.items()
+        }
+        cached = cache.get_many(keys.values())
+
+        membership = {}
+        for field, model in self.MODELS.items():
+            product_ids = cached.get(keys[field])
+            if product_ids is None:
+                product_ids = frozenset(
+                    model.objects.filter(user_id=user.id).values_list(
+                        'product_id', flat=True
+                    )
+                )
+                cache.set(keys[field], product_ids, MEMBERSHIP_CACHE_TIMEOUT)
+            membership[field] = product_ids
+
+        return ProductMembership(**membership)
+
+    def invalidate(self, user_id, model):
+        """
+        Сбрасывает множество сразу и ещё раз после коммита транзакции.
+
+        Чтение между записью и коммитом видит старые строки и снова
+        кладёт их в кэш, повторный сброс убирает такую копию.
+        """
+        if model in self.MODELS.values():
+            key = self._get_cache_key(model, user_id)
+            cache.delete(key)
+            transaction.on_commit(lambda: cache.delete(key))
+
+
+membership_util = UserProductMembership()
@@ -0,0 +1,52 @@
+# Generated by Django 3.2.16 on 2026-10-18 07:04
+
+from django.db import migrations, models
+from django.db.models import Avg, Count
+
+
+def fill_product_rating(apps, schema_editor):
+    Product = apps.get_model('products', 'Product')
+    Rating = apps.get_model('products', 'Rating')
+
+    aggregates = (
+        Rating.objects.values('product_id')
+        .annotate(avg=Avg('score'), count=Count('id'))
+        .order_by()
+    )
+    for aggregate in aggregates.iterator():
+        Product.objects.filter(id=aggregate['product_id']).update(
+            rating_avg=aggregate['avg'], rating_count=aggregate['count']
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0013_auto_20250321_0102'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='favorite',
+            options={'default_related_name': 'favorite_list', 'ordering': ('id', 'user', 'product'), 'verbose_name': 'Избранное', 'verbose_name_plural': 'Избранные'},
+        ),
+        migrations.AlterModelOptions(
+            name='rating',
+            options={'default_related_name': 'rating_list', 'ordering': ('id', 'user', 'product'), 'verbose_name': 'Рейтинг', 'verbose_name_plural': 'Рейтинги'},
+        ),
+        migrations.AlterModelOptions(
+            name='shoppingcart',
+            options={'default_related_name': 'shopping_cart_list', 'ordering': ('id', 'user', 'product'), 'verbose_name': 'Добавлен в корзину', 'verbose_name_plural': 'Добавлены в корзину'},
+        ),
+        migrations.AddField(
+            model_name='product',
+            name='rating_avg',
+            field=models.FloatField(default=0, verbose_name='Средняя оценка'),
+        ),
+        migrations.AddField(
+            model_name='product',
+            name='rating_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='Количество оценок'),
+        ),
+        migrations.RunPython(fill_product_rating, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 3.2.16 on 2026-10-18 07:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0014_auto_20261018_0704'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='productproperty',
+            index=models.Index(fields=['property', 'value', 'product'], name='product_property_value_idx'),
+        ),
+    ]
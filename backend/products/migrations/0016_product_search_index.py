@@ -0,0 +1,27 @@
+from django.db import migrations
+
+from products.constants import SEARCH_INDEX_CHUNK_SIZE
+from products.search import get_search_backend
+
+
+def create_search_index(apps, schema_editor):
+    Product = apps.get_model('products', 'Product')
+
+    backend = get_search_backend(schema_editor.connection.vendor)
+    backend.create(schema_editor)
+    backend.rebuild(Product.objects.all(), SEARCH_INDEX_CHUNK_SIZE)
+
+
+def drop_search_index(apps, schema_editor):
+    get_search_backend(schema_editor.connection.vendor).drop(schema_editor)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0015_productproperty_product_property_value_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 3.2.16 on 2026-10-18 07:41
+
+from django.db import migrations, models
+
+ARTICLE_SEQUENCE = 'article'
+DEFAULT_ARTICLE_DIGIT = '100001'
+
+
+def create_article_sequence(apps, schema_editor):
+    """Счётчик продолжает максимальный номер существующих артикулов."""
+    Article = apps.get_model('products', 'Article')
+    Sequence = apps.get_model('products', 'Sequence')
+
+    value = int(DEFAULT_ARTICLE_DIGIT) - 1
+    for article in Article.objects.values_list('article', flat=True).iterator():
+        digit = article.split(':')[-1]
+        if digit.isdigit():
+            value = max(value, int(digit))
+    Sequence.objects.create(name=ARTICLE_SEQUENCE, value=value)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0017_product_updated_at_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Sequence',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=64, unique=True, verbose_name='Название')),
+                ('value', models.BigIntegerField(default=0, verbose_name='Последний выданный номер')),
+            ],
+            options={
+                'verbose_name': 'Счётчик',
+                'verbose_name_plural': 'Счётчики',
+            },
+        ),
+        migrations.AlterField(
+            model_name='article',
+            name='article',
+            field=models.CharField(max_length=32, unique=True, verbose_name='Артикул'),
+        ),
+        migrations.RunPython(
+            create_article_sequence, migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 3.2.16 on 2026-10-18 07:42
+
+import django.core.validators
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def fill_unit_price(apps, schema_editor):
+    """Для старых заказов берётся текущая цена продукта."""
+    OrderProduct = apps.get_model('products', 'OrderProduct')
+    Product = apps.get_model('products', 'Product')
+    OrderProduct.objects.update(
+        unit_price=Subquery(
+            Product.objects.filter(id=OuterRef('product_id')).values('price')
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0018_article_sequence'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='orderproduct',
+            name='quantity',
+            field=models.PositiveIntegerField(default=1, validators=[django.core.validators.MinValueValidator(1)], verbose_name='Количество'),
+        ),
+        migrations.AddField(
+            model_name='orderproduct',
+            name='unit_price',
+            field=models.PositiveIntegerField(default=0, verbose_name='Цена за единицу на момент заказа'),
+        ),
+        migrations.RunPython(fill_unit_price, migrations.RunPython.noop),
+    ]
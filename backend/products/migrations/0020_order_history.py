@@ -0,0 +1,46 @@
+# Generated by Django 3.2.16 on 2026-10-18 07:47
+
+from django.db import migrations, models
+
+
+def fill_snapshot(apps, schema_editor):
+    """Для старых заказов снимок собирается из текущего продукта."""
+    OrderProduct = apps.get_model('products', 'OrderProduct')
+    rows = OrderProduct.objects.values_list(
+        'id',
+        'product_id',
+        'product__name',
+        'product__article_by_product__article',
+        'product__category__name',
+        'product__product_type__name',
+    )
+    for line_id, product_id, name, article, category, product_type in rows:
+        OrderProduct.objects.filter(id=line_id).update(
+            snapshot={
+                'id': product_id,
+                'name': name,
+                'article': article,
+                'category': category,
+                'product_type': product_type,
+            }
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0019_order_product_quantity'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='orderproduct',
+            name='snapshot',
+            field=models.JSONField(default=dict, verbose_name='Продукт на момент заказа'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['customer', '-id'], name='order_customer_id_idx'),
+        ),
+        migrations.RunPython(fill_snapshot, migrations.RunPython.noop),
+    ]
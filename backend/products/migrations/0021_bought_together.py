@@ -0,0 +1,36 @@
+# Generated by Django 3.2.16 on 2026-10-18 07:59
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0020_order_history'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BoughtTogether',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('count', models.PositiveIntegerField(verbose_name='Число общих заказов')),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='bought_together_by_product', to='products.product', verbose_name='Продукт')),
+                ('related', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='products.product', verbose_name='Заказан вместе с')),
+            ],
+            options={
+                'verbose_name': 'Покупают вместе',
+                'verbose_name_plural': 'Покупают вместе',
+                'ordering': ('product', '-count', 'related'),
+            },
+        ),
+        migrations.AddIndex(
+            model_name='boughttogether',
+            index=models.Index(fields=['product', '-count', 'related'], name='bought_together_product_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='boughttogether',
+            constraint=models.UniqueConstraint(fields=('product', 'related'), name='unique_bought_together_product_related'),
+        ),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 3.2.16 on 2026-10-18 08:28
+
+import re
+
+from django.db import migrations, models
+
+from products.constants import (
+    PROPERTY_NUMBER_FILL_CHUNK_SIZE,
+    PROPERTY_NUMBER_PATTERN,
+)
+
+
+def fill_number(apps, schema_editor):
+    """
+    Число в начале value, как в products.models.parse_property_number.
+
+    Строки читаются пачками по id и обновляются одним bulk_update
+    на пачку.
+    """
+    ProductProperty = apps.get_model('products', 'ProductProperty')
+    last_id = 0
+    while True:
+        chunk = list(
+            ProductProperty.objects.filter(id__gt=last_id)
+            .order_by('id')
+            .only('id', 'value')[:PROPERTY_NUMBER_FILL_CHUNK_SIZE]
+        )
+        if not chunk:
+            return
+
+        changed = []
+        for product_property in chunk:
+            match = re.match(PROPERTY_NUMBER_PATTERN, product_property.value)
+            if match:
+                product_property.number = int(match.group(1))
+                changed.append(product_property)
+        ProductProperty.objects.bulk_update(changed, ('number',))
+        last_id = chunk[-1].id
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0021_bought_together'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='productproperty',
+            name='number',
+            field=models.BigIntegerField(blank=True, editable=False, null=True, verbose_name='Числовое значение характеристики'),
+        ),
+        migrations.AddIndex(
+            model_name='productproperty',
+            index=models.Index(fields=['property', 'number', 'product'], name='product_property_number_idx'),
+        ),
+        migrations.RunPython(fill_number, migrations.RunPython.noop),
+    ]
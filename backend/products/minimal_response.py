@@ -0,0 +1,69 @@
+# Thirdparty imports
+from rest_framework import status
+from rest_framework.fields import DateTimeField
+from rest_framework.response import Response
+
+# Projects imports
+from products.constants import (
+    PREFER_RETURN_MINIMAL,
+    RETURN_ID,
+    RETURN_QUERY_PARAM,
+)
+
+
+def is_minimal_response(request):
+    """Клиент просит Prefer: return=minimal или ?return=id."""
+    prefer = request.headers.get('Prefer', '')
+    return (
+        PREFER_RETURN_MINIMAL in (item.strip() for item in prefer.split(','))
+        or request.query_params.get(RETURN_QUERY_PARAM) == RETURN_ID
+    )
+
+
+def minimal_response(instance, status_code=status.HTTP_200_OK):
+    """
+    Ответ с id объекта и его updated_at, если модель его хранит.
+
+    updated_at - версия объекта, по которой клиент решает, нужно ли
+    перечитать его через GET.
+    """
+    data = {'id': instance.pk}
+    updated_at = getattr(instance, 'updated_at', None)
+    if updated_at is not None:
+        data['updated_at'] = DateTimeField().to_representation(updated_at)
+    return Response(
+        data,
+        status=status_code,
+        headers={'Preference-Applied': PREFER_RETURN_MINIMAL},
+    )
+
+
+class MinimalResponseViewMixin:
+    """
+    Prefer: return=minimal для create, update и partial_update.
+
+    Сериализатор сохраняет объект как обычно, но serializer.data не
+    вызывается, поэтому полный объект после записи не перечитывается.
+    """
+
+    def create(self, request, *args, **kwargs):
+        if not is_minimal_response(request):
+            return super().create(request, *args, **kwargs)
+
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        self.perform_create(serializer)
+        return minimal_response(serializer.instance, status.HTTP_201_CREATED)
+
+    def update(self, request, *args, **kwargs):
+        if not is_minimal_response(request):
+            return super().update(request, *args, **kwargs)
+
+        serializer = self.get_serializer(
+            self.get_object(),
+            data=request.data,
+            partial=kwargs.pop('partial', False),
+        )
+        serializer.is_valid(raise_exception=True)
+        self.perform_update(serializer)
+        return minimal_response(serializer.instance)
@@ -1,3 +1,6 @@
+# Standart lib imports
+import re
+
 # Thirdparty imports
 from django.contrib.auth import get_user_model
 from django.core.validators import (
@@ -6,14 +9,18 @@ from django.core.validators import (
     MinValueValidator,
 )
 from django.db import models
-from django.db.models.functions import Coalesce
 
 # Projects imports
 from products.constants import (
+    ARTICLE_MAX_LENGTH,
+    BOUGHT_TOGETHER_INDEX_NAME,
     CATEGORY_NAME_MAX_LENGTH,
     CATEGORY_SLUG_MAX_LENGTH,
+    DEFAULT_ORDER_QUANTITY,
     DEFAULT_ORDER_TOTAL_PRICE,
     DEFAULT_RATING,
+    DEFAULT_RATING_COUNT,
+    DEFAULT_UNIT_PRICE,
     LONG_STR_CUT_VALUE,
     MAX_DESCRIPTION_LENGTH,
     MAX_NAME_LENGTH,
@@ -21,7 +28,14 @@ from products.constants import (
     MAX_VALUE_LENGTH,
     MIN_DESCRIPTION_LENGTH,
     MIN_NAME_LENGTH,
+    MIN_ORDER_QUANTITY,
     MIN_PRICE_VALUE,
+    ORDER_HISTORY_INDEX_NAME,
+    ORDER_UPDATED_AT_INDEX_NAME,
+    PRODUCT_PROPERTY_NUMBER_INDEX_NAME,
+    PRODUCT_SELECT_RELATED,
+    PROPERTY_NUMBER_PATTERN,
+    SEQUENCE_NAME_MAX_LENGTH,
 )
 
 User = get_user_model()
@@ -98,51 +112,20 @@ class Property(models.Model):
 
 class ProductManager(models.Manager):
 
-    def get_annotated_queryset(self, user):
-        rating_sub_query = Rating.objects.filter(
-            product=models.OuterRef('pk')
-        ).values('score')
-
-        queryset = (
+    def get_annotated_queryset(self):
+        """Продукты со связями, нужными GetProductSerializer."""
+        return (
             super()
             .get_queryset()
-            .select_related(
-                'creator',
-                'category',
-                'sub_category',
-                'article_by_product',
-                'product_type',
-            )
+            .order_by('id', 'name', 'creator')
+            .select_related(*PRODUCT_SELECT_RELATED.values())
             .prefetch_related(
                 models.Prefetch(
                     'product_property_prod',
-                    queryset=ProductProperty.objects.all().select_related(
-                        'property'
-                    ),
-                ),
-            )
-            .annotate(
-                rating=Coalesce(
-                    models.Subquery(rating_sub_query),
-                    models.Value(DEFAULT_RATING),
+                    queryset=ProductProperty.objects.order_by('id'),
                 ),
             )
-        ).order_by('id', 'name', 'creator')
-
-        if user.is_authenticated:
-            return queryset.annotate(
-                is_favorited=models.Exists(
-                    Favorite.objects.filter(
-                        user=user, product=models.OuterRef('pk')
-                    )
-                ),
-                is_in_shopping_cart=models.Exists(
-                    ShoppingCart.objects.filter(
-                        user=user, product=models.OuterRef('pk')
-                    )
-                ),
-            )
-        return queryset
+        )
 
 
 class ProductType(models.Model):
@@ -220,6 +203,18 @@ class Product(models.Model):
             MaxValueValidator(MAX_PRICE_VALUE),
         ],
     )
+    rating_avg = models.FloatField(
+        verbose_name='Средняя оценка',
+        default=DEFAULT_RATING,
+        blank=False,
+        null=False,
+    )
+    rating_count = models.PositiveIntegerField(
+        verbose_name='Количество оценок',
+        default=DEFAULT_RATING_COUNT,
+        blank=False,
+        null=False,
+    )
     properties = models.ManyToManyField(
         to=Property,
         through='ProductProperty',
@@ -240,7 +235,11 @@ class Product(models.Model):
         auto_now_add=True,
     )
     updated_at = models.DateTimeField(
-        verbose_name='Дата обновления', blank=True, null=False, auto_now=True
+        verbose_name='Дата обновления',
+        blank=True,
+        null=False,
+        auto_now=True,
+        db_index=True,
     )
 
     objects = ProductManager()
@@ -265,7 +264,7 @@ class Article(models.Model):
         on_delete=models.CASCADE,
     )
     article = models.CharField(
-        max_length=8,
+        max_length=ARTICLE_MAX_LENGTH,
         verbose_name='Артикул',
         blank=False,
         null=False,
@@ -285,7 +284,30 @@ class Article(models.Model):
         return f'{self.product} - {self.article}'
 
 
+def parse_property_number(value):
+    """Число в начале значения характеристики или None."""
+    match = re.match(PROPERTY_NUMBER_PATTERN, value or '')
+    return int(match.group(1)) if match else None
+
+
+class ProductPropertyManager(models.Manager):
+
+    def bulk_create(self, objs, *args, **kwargs):
+        """bulk_create не вызывает save, number заполняется здесь."""
+        objs = list(objs)
+        for obj in objs:
+            obj.number = parse_property_number(obj.value)
+        return super().bulk_create(objs, *args, **kwargs)
+
+
 class ProductProperty(models.Model):
+    """
+    Значение характеристики продукта.
+
+    number - число в начале value, его заполняют save и bulk_create.
+    Числовые сравнения (мощность, объём) идут по индексу
+    (property, number, product), а не по приведению строки value.
+    """
 
     product = models.ForeignKey(
         Product, on_delete=models.CASCADE, related_name='product_property_prod'
@@ -301,6 +323,14 @@ class ProductProperty(models.Model):
         blank=False,
         null=False,
     )
+    number = models.BigIntegerField(
+        verbose_name='Числовое значение характеристики',
+        null=True,
+        blank=True,
+        editable=False,
+    )
+
+    objects = ProductPropertyManager()
 
     class Meta:
         verbose_name = 'Характеристика продукта'
@@ -310,10 +340,24 @@ class ProductProperty(models.Model):
                 fields=('product', 'property'), name='unique_product_property'
             )
         ]
+        indexes = [
+            models.Index(
+                fields=('property', 'value', 'product'),
+                name='product_property_value_idx',
+            ),
+            models.Index(
+                fields=('property', 'number', 'product'),
+                name=PRODUCT_PROPERTY_NUMBER_INDEX_NAME,
+            ),
+        ]
 
     def __str__(self):
         return f'{self.product.name}: {self.property.name} - {self.value}'
 
+    def save(self, *args, **kwargs):
+        self.number = parse_property_number(self.value)
+        super().save(*args, **kwargs)
+
 
 class RatingFavoriteShoppingCart(models.Model):
     """Абстрактная модель для Rating/Favorite/ShoppingCart"""
@@ -381,6 +425,23 @@ class ShoppingCart(RatingFavoriteShoppingCart):
         ]
 
 
+class OrderManager(models.Manager):
+
+    def get_annotated_queryset(self, fields=None):
+        """fields - поля ответа, продукты загружаются, только если нужны."""
+        queryset = super().get_queryset()
+        if fields is None or 'items' in fields:
+            queryset = queryset.prefetch_related('order_product_by_order')
+        if fields is None or 'products' in fields:
+            queryset = queryset.prefetch_related(
+                models.Prefetch(
+                    'products',
+                    queryset=Product.objects.get_annotated_queryset(),
+                )
+            )
+        return queryset
+
+
 class Order(models.Model):
 
     customer = models.ForeignKey(
@@ -413,10 +474,20 @@ class Order(models.Model):
         auto_now=True,
     )
 
+    objects = OrderManager()
+
     class Meta:
         verbose_name = 'Заказ'
         verbose_name_plural = 'Заказы'
         ordering = ('-created_at',)
+        indexes = (
+            models.Index(
+                fields=('customer', '-id'), name=ORDER_HISTORY_INDEX_NAME
+            ),
+            models.Index(
+                fields=('updated_at',), name=ORDER_UPDATED_AT_INDEX_NAME
+            ),
+        )
 
     def __str__(self):
         return (
@@ -444,3 +515,75 @@ class OrderProduct(models.Model):
         null=False,
         db_index=True,
     )
+    quantity = models.PositiveIntegerField(
+        verbose_name='Количество',
+        default=DEFAULT_ORDER_QUANTITY,
+        validators=[MinValueValidator(MIN_ORDER_QUANTITY)],
+    )
+    unit_price = models.PositiveIntegerField(
+        verbose_name='Цена за единицу на момент заказа',
+        default=DEFAULT_UNIT_PRICE,
+    )
+    snapshot = models.JSONField(
+        verbose_name='Продукт на момент заказа',
+        default=dict,
+    )
+
+
+class Sequence(models.Model):
+    """Именованный счётчик, из которого sequence_util выдаёт блоки."""
+
+    name = models.CharField(
+        max_length=SEQUENCE_NAME_MAX_LENGTH,
+        verbose_name='Название',
+        unique=True,
+    )
+    value = models.BigIntegerField(
+        verbose_name='Последний выданный номер',
+        default=0,
+    )
+
+    class Meta:
+        verbose_name = 'Счётчик'
+        verbose_name_plural = 'Счётчики'
+
+    def __str__(self):
+        return f'{self.name}: {self.value}'
+
+
+class BoughtTogether(models.Model):
+    """Top-K продуктов, чаще всего заказанных вместе с product."""
+
+    product = models.ForeignKey(
+        Product,
+        verbose_name='Продукт',
+        related_name='bought_together_by_product',
+        on_delete=models.CASCADE,
+    )
+    related = models.ForeignKey(
+        Product,
+        verbose_name='Заказан вместе с',
+        related_name='+',
+        on_delete=models.CASCADE,
+    )
+    count = models.PositiveIntegerField(verbose_name='Число общих заказов')
+
+    class Meta:
+        verbose_name = 'Покупают вместе'
+        verbose_name_plural = 'Покупают вместе'
+        ordering = ('product', '-count', 'related')
+        constraints = [
+            models.UniqueConstraint(
+                fields=('product', 'related'),
+                name='unique_bought_together_product_related',
+            )
+        ]
+        indexes = (
+            models.Index(
+                fields=('product', '-count', 'related'),
+                name=BOUGHT_TOGETHER_INDEX_NAME,
+            ),
+        )
+
+    def __str__(self):
+        return f'{self.product_id} + {self.related_id}: {self.count}'
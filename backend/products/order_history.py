@@ -0,0 +1,74 @@
+# Thirdparty imports
+from rest_framework.fields import DateTimeField
+
+# Projects imports
+from products.models import Order
+
+# Колонки заказа и его строк. Строки присоединяются LEFT JOIN,
+# поэтому заказ без строк тоже попадает в выборку.
+HISTORY_COLUMNS = (
+    'id',
+    'total_price',
+    'created_at',
+    'order_product_by_order__product_id',
+    'order_product_by_order__quantity',
+    'order_product_by_order__unit_price',
+    'order_product_by_order__snapshot',
+)
+
+
+class OrderHistoryReader:
+    """
+    Чтение истории заказов одним запросом на страницу.
+
+    Страница заказов выбирается подзапросом id < курсор ORDER BY id DESC
+    LIMIT n по индексу (customer, -id), строки заказов присоединяются к
+    ним в том же запросе. Продукт берётся из снимка строки, поэтому число
+    запросов не зависит ни от числа заказов, ни от числа строк.
+    """
+
+    created_at_field = DateTimeField()
+
+    def get_page(self, queryset, before, limit):
+        """Не больше limit заказов queryset с id < before от новых к старым."""
+        page = queryset.order_by('-id')
+        if before is not None:
+            page = page.filter(id__lt=before)
+        rows = (
+            Order.objects.filter(id__in=page.values('id')[:limit])
+            .order_by('-id', 'order_product_by_order__id')
+            .values_list(*HISTORY_COLUMNS)
+        )
+
+        orders = {}
+        for (
+            order_id,
+            total_price,
+            created_at,
+            product_id,
+            quantity,
+            unit_price,
+            snapshot,
+        ) in rows:
+            if order_id not in orders:
+                orders[order_id] = {
+                    'id': order_id,
+                    'total_price': total_price,
+                    'created_at': self.created_at_field.to_representation(
+                        created_at
+                    ),
+                    'items': [],
+                }
+            if product_id is not None:
+                orders[order_id]['items'].append(
+                    {
+                        'id': product_id,
+                        'quantity': quantity,
+                        'unit_price': unit_price,
+                        'product': snapshot,
+                    }
+                )
+        return list(orders.values())
+
+
+history_util = OrderHistoryReader()
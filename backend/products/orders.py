@@ -0,0 +1,147 @@
+# Thirdparty imports
+from django.db import transaction
+from django.db.models import F, Sum
+
+# Projects imports
+from products.constants import (
+    DEFAULT_ORDER_QUANTITY,
+    DEFAULT_ORDER_TOTAL_PRICE,
+    LEADERBOARD_SALES,
+)
+from products.leaderboard import leaderboard_util
+from products.membership import membership_util
+from products.models import Order, OrderProduct, Product, ShoppingCart
+from products.reference import reference_util
+
+# Колонки продукта, из которых собираются цена и снимок строки заказа.
+SNAPSHOT_COLUMNS = (
+    'id',
+    'price',
+    'name',
+    'article_by_product__article',
+    'category_id',
+    'product_type_id',
+)
+
+
+class OrderPricing:
+    """
+    Создание заказа с ценами за единицу и итоговой суммой.
+
+    Число запросов не зависит от числа строк: один SELECT продуктов,
+    вставка строк с ценой и снимком продукта и один агрегат суммы в той
+    же транзакции. Снимок позволяет читать историю заказов без JOIN
+    к продуктам, даже если продукт потом изменён или удалён.
+    """
+
+    def _merge_lines(self, lines):
+        """
+        Повторы одного продукта складываются в одну строку.
+
+        При PATCH сериализатор не подставляет default, поэтому
+        количество может отсутствовать.
+        """
+        quantities = {}
+        for line in lines:
+            quantities[line['product_id']] = quantities.get(
+                line['product_id'], 0
+            ) + line.get('quantity', DEFAULT_ORDER_QUANTITY)
+        return quantities
+
+    def get_snapshot(self, row):
+        """Снимок продукта из строки values_list(*SNAPSHOT_COLUMNS)."""
+        product_id, _, name, article, category_id, product_type_id = row
+        return {
+            'id': product_id,
+            'name': name,
+            'article': article,
+            'category': reference_util.get('category', category_id)['name'],
+            'product_type': reference_util.get(
+                'product_type', product_type_id
+            )['name'],
+        }
+
+    @transaction.atomic
+    def create(self, customer, lines):
+        """lines - список {'product_id': ..., 'quantity': ...}."""
+        return self._create(customer, self._merge_lines(lines))
+
+    @transaction.atomic
+    def checkout(self, customer):
+        """
+        Заказ из корзины покупателя, None для пустой корзины.
+
+        Корзина читается одним запросом и очищается одним DELETE по
+        прочитанным продуктам: добавленное в корзину во время оформления
+        в заказ не попадает и в корзине остаётся. Строки корзины
+        блокируются SELECT FOR UPDATE: повторное оформление ждёт первое
+        и видит уже пустую корзину, поэтому второй заказ не создаётся.
+        """
+        product_ids = list(
+            ShoppingCart.objects.select_for_update()
+            .filter(user=customer)
+            .values_list('product_id', flat=True)
+        )
+        if not product_ids:
+            return None
+
+        order = self._create(
+            customer, dict.fromkeys(product_ids, DEFAULT_ORDER_QUANTITY)
+        )
+        ShoppingCart.objects.filter(
+            user=customer, product_id__in=product_ids
+        ).delete()
+        membership_util.invalidate(customer.id, ShoppingCart)
+        return order
+
+    @transaction.atomic
+    def update(self, order, lines):
+        """
+        Замена строк заказа, цены берутся на момент изменения.
+
+        lines - список {'product_id': ..., 'quantity': ...}.
+        """
+        quantities = self._merge_lines(lines)
+        order_lines = OrderProduct.objects.filter(order=order)
+        product_ids = set(order_lines.values_list('product_id', flat=True))
+        order_lines.delete()
+        self._add_lines(order, quantities)
+        leaderboard_util.update_on_commit(
+            LEADERBOARD_SALES, product_ids | set(quantities)
+        )
+        return order
+
+    def _create(self, customer, quantities):
+        """quantities - {id продукта: количество}."""
+        order = Order.objects.create(
+            customer=customer, total_price=DEFAULT_ORDER_TOTAL_PRICE
+        )
+        self._add_lines(order, quantities)
+        leaderboard_util.update_on_commit(LEADERBOARD_SALES, quantities)
+        return order
+
+    def _add_lines(self, order, quantities):
+        """Строки заказа с ценой и снимком продукта, пересчёт суммы."""
+        rows = Product.objects.filter(id__in=quantities).values_list(
+            *SNAPSHOT_COLUMNS
+        )
+        OrderProduct.objects.bulk_create(
+            OrderProduct(
+                order=order,
+                product_id=row[0],
+                quantity=quantities[row[0]],
+                unit_price=row[1],
+                snapshot=self.get_snapshot(row),
+            )
+            for row in rows
+        )
+
+        order.total_price = OrderProduct.objects.filter(
+            order=order
+        ).aggregate(total=Sum(F('quantity') * F('unit_price')))['total']
+        Order.objects.filter(id=order.id).update(
+            total_price=order.total_price
+        )
+
+
+order_util = OrderPricing()
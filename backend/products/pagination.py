@@ -0,0 +1,93 @@
+# Thirdparty imports
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, CursorPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+# Projects imports
+from products.constants import (
+    ORDER_HISTORY_CURSOR_QUERY_PARAM,
+    ORDER_HISTORY_MAX_PAGE_SIZE,
+    ORDER_HISTORY_PAGE_SIZE,
+    PRODUCTS_MAX_PAGE_SIZE,
+    PRODUCTS_PAGE_SIZE,
+)
+from products.order_history import history_util
+
+
+class ProductCursorPagination(CursorPagination):
+    """
+    Keyset-пагинация каталога.
+
+    Курсор хранит последний отданный id, следующая страница выбирается
+    через WHERE id > <курсор> по индексу первичного ключа, без COUNT(*)
+    и без OFFSET, поэтому стоимость любой страницы одинакова.
+    Результаты поиска идут по рангу, курсор хранит ранг и смещение.
+    """
+
+    ordering = ('id',)
+    page_size = PRODUCTS_PAGE_SIZE
+    page_size_query_param = 'page_size'
+    max_page_size = PRODUCTS_MAX_PAGE_SIZE
+
+    def get_ordering(self, request, queryset, view):
+        if 'search_rank' in queryset.query.annotations:
+            return ('search_rank', 'id')
+        return super().get_ordering(request, queryset, view)
+
+
+class OrderHistoryPagination(BasePagination):
+    """
+    Keyset-пагинация истории заказов.
+
+    Курсор ?before= - id последнего отданного заказа. Страница читается
+    через history_util на один заказ больше, чтобы узнать о следующей
+    странице без COUNT(*).
+    """
+
+    page_size = ORDER_HISTORY_PAGE_SIZE
+    page_size_query_param = 'page_size'
+    max_page_size = ORDER_HISTORY_MAX_PAGE_SIZE
+    cursor_query_param = ORDER_HISTORY_CURSOR_QUERY_PARAM
+    invalid_cursor_message = CursorPagination.invalid_cursor_message
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(
+                request.query_params.get(
+                    self.page_size_query_param, self.page_size
+                )
+            )
+        except ValueError:
+            return self.page_size
+        return min(max(page_size, 1), self.max_page_size)
+
+    def get_cursor(self, request):
+        cursor = request.query_params.get(self.cursor_query_param)
+        if cursor is None:
+            return None
+        if not cursor.isdigit():
+            raise NotFound(self.invalid_cursor_message)
+        return int(cursor)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        page_size = self.get_page_size(request)
+        orders = history_util.get_page(
+            queryset, self.get_cursor(request), page_size + 1
+        )
+        self.has_next = len(orders) > page_size
+        self.orders = orders[:page_size]
+        return self.orders
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        return replace_query_param(
+            self.request.build_absolute_uri(),
+            self.cursor_query_param,
+            self.orders[-1]['id'],
+        )
+
+    def get_paginated_response(self, data):
+        return Response({'next': self.get_next_link(), 'results': data})
@@ -0,0 +1,60 @@
+# Thirdparty imports
+from django.core.cache import cache
+
+# Projects imports
+from products.constants import PRODUCT_TYPE_CACHE_TIMEOUT
+from products.models import Product
+
+
+class ProductTypeMap:
+    """
+    Кэш соответствия id продукта -> id его ProductType.
+
+    Тип продукта меняется редко, а проверка слотов сборки ПК читает его
+    для многих продуктов сразу: один cache.get_many на набор id, при
+    промахе - один SELECT id, product_type_id. Сигналы save/delete
+    Product сбрасывают ключ продукта.
+    """
+
+    def _get_cache_key(self, product_id):
+        return f'product_type:{product_id}'
+
+    def get_many(self, product_ids):
+        """{id продукта: id типа} для существующих из product_ids."""
+        keys = {
+            product_id: self._get_cache_key(product_id)
+            for product_id in product_ids
+        }
+        cached = cache.get_many(keys.values())
+        product_types = {
+            product_id: cached[key]
+            for product_id, key in keys.items()
+            if key in cached
+        }
+
+        missing_ids = [
+            product_id
+            for product_id in keys
+            if product_id not in product_types
+        ]
+        if missing_ids:
+            loaded = dict(
+                Product.objects.filter(id__in=missing_ids).values_list(
+                    'id', 'product_type_id'
+                )
+            )
+            cache.set_many(
+                {
+                    keys[product_id]: product_type_id
+                    for product_id, product_type_id in loaded.items()
+                },
+                PRODUCT_TYPE_CACHE_TIMEOUT,
+            )
+            product_types.update(loaded)
+        return product_types
+
+    def invalidate(self, product_id):
+        cache.delete(self._get_cache_key(product_id))
+
+
+product_type_util = ProductTypeMap()
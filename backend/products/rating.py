@@ -0,0 +1,189 @@
+# Thirdparty imports
+from django.db import connection, models, transaction
+from django.db.models import Avg, Count, F, OuterRef, Subquery
+from django.utils import timezone
+
+# Projects imports
+from products.constants import (
+    CATALOG_VERSION,
+    DEFAULT_RATING,
+    DEFAULT_RATING_COUNT,
+    LEADERBOARD_RATING,
+)
+from products.leaderboard import leaderboard_util
+from products.models import Product, Rating
+from products.versioning import version_util
+
+
+class ProductRatingAggregate:
+    """
+    Поддержка денормализованных rating_avg/rating_count у Product.
+
+    rate делает upsert оценки и обновляет агрегаты, remove выполняет один
+    UPDATE с F-выражениями и должен вызываться в той же транзакции, что
+    и удаление Rating.
+    """
+
+    def _as_float(self, expression):
+        return models.ExpressionWrapper(
+            expression, output_field=models.FloatField()
+        )
+
+    def remove(self, product_id, score):
+        Product.objects.filter(id=product_id).update(
+            rating_avg=models.Case(
+                models.When(
+                    rating_count__lte=1,
+                    then=self._as_float(models.Value(DEFAULT_RATING)),
+                ),
+                default=self._as_float(
+                    (F('rating_avg') * F('rating_count') - score)
+                    / (F('rating_count') - 1)
+                ),
+            ),
+            rating_count=F('rating_count') - 1,
+        )
+        leaderboard_util.update_on_commit(LEADERBOARD_RATING, [product_id])
+
+    def _upsert(self, user_id, product_id, score):
+        """INSERT ... ON CONFLICT DO UPDATE по ограничению (user, product)."""
+        quote_name = connection.ops.quote_name
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'INSERT INTO {quote_name(Rating._meta.db_table)} '
+                '(user_id, product_id, score) VALUES (%s, %s, %s) '
+                'ON CONFLICT (user_id, product_id) '
+                'DO UPDATE SET score = excluded.score',
+                (user_id, product_id, score),
+            )
+
+    @transaction.atomic
+    def rate(self, user, product_id, score):
+        """
+        Оценка или переоценка продукта, None если продукта нет.
+
+        Три запроса без сигналов Rating: SELECT FOR UPDATE агрегатов
+        продукта вместе с прежней оценкой пользователя, upsert оценки и
+        UPDATE агрегатов. Блокировка строки продукта сериализует оценки
+        одного продукта, поэтому новые значения считаются в Python.
+        Если при переоценке счётчик разошёлся с таблицей (rating_count
+        меньше 1), агрегаты продукта пересчитываются по Rating.
+        """
+        row = (
+            Product.objects.select_for_update()
+            .filter(id=product_id)
+            .annotate(
+                old_score=Subquery(
+                    Rating.objects.filter(
+                        product_id=OuterRef('id'), user_id=user.id
+                    ).values('score')
+                )
+            )
+            .values_list('rating_avg', 'rating_count', 'old_score')
+            .first()
+        )
+        if row is None:
+            return None
+
+        rating_avg, rating_count, old_score = row
+        self._upsert(user.id, product_id, score)
+        if old_score is not None and rating_count < 1:
+            rating_avg, rating_count = self._aggregate(product_id)
+        else:
+            total = rating_avg * rating_count + score
+            if old_score is None:
+                rating_count += 1
+            else:
+                total -= old_score
+            rating_avg = total / rating_count
+
+        Product.objects.filter(id=product_id).update(
+            rating_avg=rating_avg,
+            rating_count=rating_count,
+            updated_at=timezone.now(),
+        )
+        version_util.bump(CATALOG_VERSION)
+        leaderboard_util.update_on_commit(LEADERBOARD_RATING, [product_id])
+        return {
+            'product': product_id,
+            'score': score,
+            'rating': rating_avg,
+            'rating_count': rating_count,
+            'created': old_score is None,
+        }
+
+    def _aggregate(self, product_id):
+        """(rating_avg, rating_count) продукта по таблице Rating."""
+        aggregate = Rating.objects.filter(product_id=product_id).aggregate(
+            avg=Avg('score'), count=Count('id')
+        )
+        return aggregate['avg'] or DEFAULT_RATING, aggregate['count']
+
+    @transaction.atomic
+    def _rebuild_chunk(self, product_ids):
+        """
+        Пересчёт агрегатов пачки, возвращает число изменённых продуктов.
+
+        bulk_update не вызывает save, поэтому updated_at изменённых
+        продуктов сдвигается явно: по нему строится ключ карточки.
+        """
+        products = list(
+            Product.objects.select_for_update()
+            .filter(id__in=product_ids)
+            .only('id', 'rating_avg', 'rating_count')
+        )
+        aggregates = {
+            item['product_id']: item
+            for item in Rating.objects.filter(product_id__in=product_ids)
+            .values('product_id')
+            .annotate(avg=Avg('score'), count=Count('id'))
+            .order_by()
+        }
+
+        now = timezone.now()
+        changed = []
+        for product in products:
+            aggregate = aggregates.get(product.id, {})
+            rating_avg = aggregate.get('avg', DEFAULT_RATING)
+            rating_count = aggregate.get('count', DEFAULT_RATING_COUNT)
+            if (product.rating_avg, product.rating_count) != (
+                rating_avg,
+                rating_count,
+            ):
+                product.rating_avg = rating_avg
+                product.rating_count = rating_count
+                product.updated_at = now
+                changed.append(product)
+
+        if changed:
+            Product.objects.bulk_update(
+                changed, ('rating_avg', 'rating_count', 'updated_at')
+            )
+            version_util.bump(CATALOG_VERSION)
+            leaderboard_util.update_on_commit(
+                LEADERBOARD_RATING, [product.id for product in changed]
+            )
+        return len(changed)
+
+    def rebuild(self, chunk_size):
+        """
+        Полный пересчёт агрегатов пачками по chunk_size продуктов,
+        возвращает число изменённых продуктов.
+        """
+        last_id = 0
+        updated = 0
+
+        while True:
+            product_ids = list(
+                Product.objects.filter(id__gt=last_id)
+                .order_by('id')
+                .values_list('id', flat=True)[:chunk_size]
+            )
+            if not product_ids:
+                return updated
+
+            updated += self._rebuild_chunk(product_ids)
+            last_id = product_ids[-1]
+
+
+rating_util = ProductRatingAggregate()
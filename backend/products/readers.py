@@ -0,0 +1,137 @@
+# Standart lib imports
+from collections import defaultdict
+from operator import itemgetter
+
+# Projects imports
+from products.membership import ProductMembership
+from products.models import Product, ProductProperty
+from products.reference import reference_util
+from products.serializers import GetProductSerializer
+
+# Поле ответа -> колонки values_list, из которых оно собирается.
+# Вложенные объекты описаны парами (ключ, колонка).
+PRODUCT_COLUMNS = {
+    'id': 'id',
+    'name': 'name',
+    'description': 'description',
+    'price': 'price',
+    'rating': 'rating_avg',
+    'rating_count': 'rating_count',
+    'article': 'article_by_product__article',
+    'creator': (
+        ('id', 'creator_id'),
+        ('username', 'creator__username'),
+        ('first_name', 'creator__first_name'),
+        ('last_name', 'creator__last_name'),
+        ('email', 'creator__email'),
+        ('phone_number', 'creator__phone_number'),
+    ),
+}
+# Поле ответа -> (колонка с id, таблица reference_util).
+PRODUCT_REFERENCES = {
+    'category': ('category_id', 'category'),
+    'sub_category': ('sub_category_id', 'sub_category'),
+    'product_type': ('product_type_id', 'product_type'),
+}
+PRODUCT_FIELDS = GetProductSerializer.Meta.fields
+PROPERTY_VALUES = ('product_id', 'property_id', 'value')
+
+
+class ProductReader:
+    """
+    Read-only путь сериализации продуктов без ModelSerializer.
+
+    Не больше двух запросов на любое число продуктов: values_list по
+    продуктам и values_list по их характеристикам. Справочники берутся
+    из reference_util без JOIN. Выбираются только колонки и JOIN
+    запрошенных полей. Результат
+    совпадает с GetProductSerializer(...).data вплоть до порядка ключей.
+    """
+
+    def _get_columns(self, fields):
+        columns = ['id']
+        for field in fields:
+            if field in PRODUCT_REFERENCES:
+                column, _ = PRODUCT_REFERENCES[field]
+                if column not in columns:
+                    columns.append(column)
+                continue
+            source = PRODUCT_COLUMNS.get(field, ())
+            if isinstance(source, str):
+                source = ((field, source),)
+            columns.extend(
+                column for _, column in source if column not in columns
+            )
+        return columns
+
+    def _get_properties(self, product_ids):
+        properties = defaultdict(list)
+        rows = (
+            ProductProperty.objects.filter(product_id__in=product_ids)
+            .order_by('id')
+            .values_list(*PROPERTY_VALUES)
+        )
+        for product_id, property_id, value in rows:
+            name = reference_util.get('property', property_id)['name']
+            properties[product_id].append(
+                {'id': property_id, 'name': name, 'value': value}
+            )
+        return properties
+
+    def _get_nested_getter(self, pairs, positions):
+        pairs = tuple((key, positions[column]) for key, column in pairs)
+        return lambda row: {key: row[position] for key, position in pairs}
+
+    def _get_reference_getter(self, table, position):
+        return lambda row: reference_util.get(table, row[position])
+
+    def _get_getters(self, fields, columns, properties, membership):
+        positions = {column: index for index, column in enumerate(columns)}
+        getters = {
+            'properties': lambda row: properties.get(row[0], []),
+            'is_favorited': lambda row: row[0] in membership.favorite_ids,
+            'is_in_shopping_cart': (
+                lambda row: row[0] in membership.shopping_cart_ids
+            ),
+        }
+        for field, source in PRODUCT_COLUMNS.items():
+            if field not in fields:
+                continue
+            if isinstance(source, str):
+                getters[field] = itemgetter(positions[source])
+            else:
+                getters[field] = self._get_nested_getter(source, positions)
+        for field, (column, table) in PRODUCT_REFERENCES.items():
+            if field in fields:
+                getters[field] = self._get_reference_getter(
+                    table, positions[column]
+                )
+        return [(field, getters[field]) for field in fields]
+
+    def get_many(self, product_ids, membership=None, fields=PRODUCT_FIELDS):
+        """
+        Словари продуктов в порядке product_ids, без отсутствующих.
+
+        fields - поля ответа в порядке PRODUCT_FIELDS.
+        """
+        membership = membership or ProductMembership()
+        columns = self._get_columns(fields)
+        rows = {
+            row[0]: row
+            for row in Product.objects.filter(id__in=product_ids)
+            .order_by()
+            .values_list(*columns)
+        }
+        properties = {}
+        if 'properties' in fields:
+            properties = self._get_properties(list(rows))
+
+        getters = self._get_getters(fields, columns, properties, membership)
+        return [
+            {field: getter(rows[product_id]) for field, getter in getters}
+            for product_id in product_ids
+            if product_id in rows
+        ]
+
+
+reader_util = ProductReader()
@@ -0,0 +1,109 @@
+# Standart lib imports
+import time
+
+# Projects imports
+from products.constants import (
+    REFERENCE_CHECK_INTERVAL,
+    REFERENCE_MAX_AGE,
+    REFERENCE_VERSION,
+)
+from products.models import Category, ProductType, Property, SubCategory
+from products.versioning import version_util
+
+
+class ReferenceDataCache:
+    """
+    In-process кэш справочников Category, SubCategory, ProductType
+    и Property в виде {id: словарь полей}.
+
+    Таблицы читаются целиком при первом обращении. Номер версии
+    REFERENCE_VERSION сверяется с общим кэшем не чаще раза в
+    REFERENCE_CHECK_INTERVAL секунд: сигналы save/delete справочников
+    увеличивают его, и остальные процессы перечитывают таблицы.
+
+    Версия видна другим процессам только через общий кэш (Redis,
+    Memcached). С кэшем в памяти процесса (LocMemCache по умолчанию)
+    изменения других процессов доходят не позже REFERENCE_MAX_AGE
+    секунд: копия старше перечитывается независимо от версии.
+    """
+
+    TABLES = {
+        'category': (Category, ('id', 'name', 'slug')),
+        'sub_category': (SubCategory, ('id', 'name', 'slug')),
+        'product_type': (ProductType, ('id', 'name')),
+        'property': (Property, ('id', 'name')),
+    }
+
+    def __init__(self):
+        self._tables = None
+        self._version = None
+        self._checked_at = 0
+        self._loaded_at = 0
+
+    def _load(self, version):
+        self._tables = {
+            table: {
+                row['id']: row
+                for row in model.objects.order_by('id').values(*fields)
+            }
+            for table, (model, fields) in self.TABLES.items()
+        }
+        self._version = version
+        self._loaded_at = time.monotonic()
+
+    def _load_row(self, table, pk):
+        """Дочитывает строку table, появившуюся после загрузки таблиц."""
+        model, fields = self.TABLES[table]
+        row = model.objects.filter(id=pk).values(*fields).first()
+        if row is not None:
+            self._tables[table][pk] = row
+        return row
+
+    def _get_tables(self):
+        now = time.monotonic()
+        if self._tables is None or now - self._checked_at >= (
+            REFERENCE_CHECK_INTERVAL
+        ):
+            (version,) = version_util.get(REFERENCE_VERSION)
+            if (
+                self._tables is None
+                or version != self._version
+                or now - self._loaded_at >= REFERENCE_MAX_AGE
+            ):
+                self._load(version)
+            self._checked_at = now
+        return self._tables
+
+    def get(self, table, pk, reload=True):
+        """
+        Копия строки справочника table или None.
+
+        Промах дочитывает одну строку table: она могла появиться в другом
+        процессе до очередной проверки версии. reload=False отключает
+        дочитывание для массовой проверки недоверенных id.
+        """
+        if pk is None:
+            return None
+        row = self._get_tables()[table].get(pk)
+        if row is None and reload:
+            row = self._load_row(table, pk)
+        return dict(row) if row is not None else None
+
+    def get_by_name(self, table, name):
+        """Копия строки справочника table с полем name или None."""
+        for row in self._get_tables()[table].values():
+            if row['name'] == name:
+                return dict(row)
+        return None
+
+    def get_version(self):
+        self._get_tables()
+        return self._version
+
+    def invalidate(self):
+        """Сбрасывает копию процесса и версию для остальных процессов."""
+        version_util.bump(REFERENCE_VERSION)
+        self._tables = None
+
+
+reference_util = ReferenceDataCache()
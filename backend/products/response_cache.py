@@ -0,0 +1,60 @@
+# Standart lib imports
+import hashlib
+from functools import wraps
+
+# Thirdparty imports
+from django.core.cache import cache
+from rest_framework import status
+from rest_framework.response import Response
+
+# Projects imports
+from products.constants import CATALOG_VERSION, RESPONSE_CACHE_TIMEOUT
+from products.versioning import version_util
+
+
+def cache_anonymous(handler):
+    """
+    Кэширует данные успешного ответа анонимному пользователю.
+
+    Ключ содержит версии view.response_cache_scopes, поэтому после
+    записи в каталог старые ответы становятся недостижимыми без
+    перебора ключей.
+    """
+
+    @wraps(handler)
+    def wrapper(self, request, *args, **kwargs):
+        if request.user.is_authenticated:
+            return handler(self, request, *args, **kwargs)
+
+        key = self.get_response_cache_key()
+        data = cache.get(key)
+        if data is not None:
+            return Response(data)
+
+        response = handler(self, request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            cache.set(key, response.data, RESPONSE_CACHE_TIMEOUT)
+        return response
+
+    return wrapper
+
+
+class AnonymousCacheViewMixin:
+    """Кэш ответов list и retrieve для анонимных пользователей."""
+
+    response_cache_scopes = (CATALOG_VERSION,)
+
+    def get_response_cache_key(self):
+        versions = ':'.join(
+            map(str, version_util.get(*self.response_cache_scopes))
+        )
+        path = hashlib.md5(self.request.get_full_path().encode()).hexdigest()
+        return f'response:{versions}:{path}'
+
+    @cache_anonymous
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+    @cache_anonymous
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
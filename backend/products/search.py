@@ -0,0 +1,204 @@
+# Standart lib imports
+import re
+from functools import lru_cache
+
+# Thirdparty imports
+import snowballstemmer
+from django.db import connection, models
+from django.db.models.expressions import RawSQL
+
+# Projects imports
+from products.constants import (
+    SEARCH_DESCRIPTION_WEIGHT,
+    SEARCH_LANGUAGE,
+    SEARCH_NAME_WEIGHT,
+    SEARCH_STEM_CACHE_SIZE,
+)
+
+WORD_RE = re.compile(r'\w+')
+stemmer = snowballstemmer.stemmer(SEARCH_LANGUAGE)
+
+
+@lru_cache(maxsize=SEARCH_STEM_CACHE_SIZE)
+def stem_word(word):
+    """Snowball медленный, а словарь каталога мал - основы кэшируются."""
+    return stemmer.stemWord(word)
+
+
+def stem_words(text):
+    return [stem_word(word) for word in WORD_RE.findall(text.lower())]
+
+
+def stem_text(text):
+    return ' '.join(stem_words(text))
+
+
+class BaseProductSearch:
+
+    def rebuild(self, queryset, chunk_size):
+        """Переиндексация всех продуктов queryset пачками."""
+        products = []
+        for product in (
+            queryset.only('id', 'name', 'description')
+            .order_by('id')
+            .iterator(chunk_size=chunk_size)
+        ):
+            products.append(product)
+            if len(products) == chunk_size:
+                self.index(products)
+                products = []
+        self.index(products)
+
+
+class SQLiteProductSearch(BaseProductSearch):
+    """
+    Поиск через виртуальную таблицу FTS5 products_product_fts.
+
+    В FTS5 нет русского стеммера, поэтому в индекс пишутся и в запросе
+    используются основы слов, полученные Snowball-стеммером.
+    rowid строки индекса совпадает с id продукта.
+    """
+
+    table = 'products_product_fts'
+
+    def create(self, schema_editor):
+        schema_editor.execute(
+            f'CREATE VIRTUAL TABLE {self.table} USING fts5(name, description)'
+        )
+
+    def drop(self, schema_editor):
+        schema_editor.execute(f'DROP TABLE IF EXISTS {self.table}')
+
+    def remove(self, product_ids):
+        product_ids = list(product_ids)
+        if not product_ids:
+            return
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'DELETE FROM {self.table} WHERE rowid IN '
+                f'({", ".join(["%s"] * len(product_ids))})',
+                product_ids,
+            )
+
+    def index(self, products):
+        """
+        products - список объектов с id, name и description.
+
+        Один INSERT на пачку: executemany ломает отладочный курсор
+        Django на SQLite при нескольких строках.
+        """
+        self.remove(product.id for product in products)
+        params = []
+        for product in products:
+            params.extend(
+                (
+                    product.id,
+                    stem_text(product.name),
+                    stem_text(product.description),
+                )
+            )
+        if not params:
+            return
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'INSERT INTO {self.table} (rowid, name, description) VALUES '
+                + ', '.join(['(%s, %s, %s)'] * len(products)),
+                params,
+            )
+
+    def _get_match(self, query):
+        return ' '.join(
+            '"{}"*'.format(word.replace('"', '""'))
+            for word in stem_words(query)
+        )
+
+    def search(self, queryset, query):
+        match = self._get_match(query)
+        if not match:
+            return queryset.none()
+
+        return queryset.filter(
+            id__in=RawSQL(
+                f'SELECT rowid FROM {self.table} '
+                f'WHERE {self.table} MATCH %s',
+                (match,),
+            )
+        ).annotate(
+            search_rank=RawSQL(
+                f'SELECT bm25({self.table}, %s, %s) FROM {self.table} '
+                f'WHERE {self.table} MATCH %s '
+                f'AND rowid = {queryset.model._meta.db_table}.id',
+                (SEARCH_NAME_WEIGHT, SEARCH_DESCRIPTION_WEIGHT, match),
+                output_field=models.FloatField(),
+            )
+        )
+
+
+class PostgreSQLProductSearch(BaseProductSearch):
+    """
+    Поиск через колонку products_product.search_vector с GIN-индексом.
+
+    Колонка не описана в модели и заполняется только этим классом.
+    Ранг хранится со знаком минус, чтобы у обоих бэкендов лучший
+    результат был первым при сортировке по возрастанию.
+    """
+
+    table = 'products_product'
+    vector = (
+        f"setweight(to_tsvector('{SEARCH_LANGUAGE}', name), 'A') || "
+        f"setweight(to_tsvector('{SEARCH_LANGUAGE}', description), 'B')"
+    )
+    tsquery = f"websearch_to_tsquery('{SEARCH_LANGUAGE}', %s)"
+
+    def create(self, schema_editor):
+        schema_editor.execute(
+            f'ALTER TABLE {self.table} ADD COLUMN search_vector tsvector'
+        )
+        schema_editor.execute(
+            'CREATE INDEX products_product_search_idx '
+            f'ON {self.table} USING gin(search_vector)'
+        )
+
+    def drop(self, schema_editor):
+        schema_editor.execute(
+            f'ALTER TABLE {self.table} DROP COLUMN IF EXISTS search_vector'
+        )
+
+    def remove(self, product_ids):
+        """Строка индекса удаляется вместе с продуктом."""
+
+    def index(self, products):
+        product_ids = [product.id for product in products]
+        if not product_ids:
+            return
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'UPDATE {self.table} SET search_vector = {self.vector} '
+                'WHERE id = ANY(%s)',
+                (product_ids,),
+            )
+
+    def search(self, queryset, query):
+        return queryset.filter(
+            RawSQL(
+                f'{self.table}.search_vector @@ {self.tsquery}',
+                (query,),
+                output_field=models.BooleanField(),
+            )
+        ).annotate(
+            search_rank=RawSQL(
+                f'-ts_rank({self.table}.search_vector, {self.tsquery})',
+                (query,),
+                output_field=models.FloatField(),
+            )
+        )
+
+
+SEARCH_BACKENDS = {
+    'sqlite': SQLiteProductSearch,
+    'postgresql': PostgreSQLProductSearch,
+}
+
+
+def get_search_backend(vendor=None):
+    return SEARCH_BACKENDS[vendor or connection.vendor]()
@@ -0,0 +1,165 @@
+# Standart lib imports
+import threading
+from dataclasses import dataclass
+
+# Thirdparty imports
+from django.db import (
+    DEFAULT_DB_ALIAS,
+    IntegrityError,
+    connection,
+    connections,
+    transaction,
+)
+from django.db.models import F
+
+# Projects imports
+from products.constants import SEQUENCE_BLOCK_SIZE
+from products.models import Sequence
+
+
+@dataclass
+class SequenceBlock:
+    """Зарезервированный диапазон номеров [next_value, last_value]."""
+
+    next_value: int
+    last_value: int
+
+    def take(self, count):
+        values = range(
+            self.next_value, min(self.next_value + count, self.last_value + 1)
+        )
+        self.next_value += len(values)
+        return values
+
+
+class SequenceAllocator:
+    """
+    Выдача номеров из счётчиков Sequence блоками (hi-lo).
+
+    Один UPDATE value = value + size резервирует у БД блок номеров,
+    дальше номера выдаются из памяти. UPDATE выполняется в отдельной
+    транзакции собственного соединения потока и сразу фиксируется:
+    строка счётчика не ждёт коммита транзакции вызывающего кода, а её
+    откат не возвращает номера блока другим процессам. Номера уникальны,
+    но не обязательно идут подряд: остаток блока пропадает вместе
+    с процессом.
+
+    SQLite допускает одного писателя на всю БД, и второе соединение
+    ждало бы блокировку, которую держит транзакция вызывающего кода.
+    Там блок резервируется в соединении вызывающего кода, а внутри его
+    транзакции - ровно нужное число номеров без остатка в памяти: откат
+    вернёт их счётчику вместе с остальными записями.
+    """
+
+    def __init__(self, block_size=SEQUENCE_BLOCK_SIZE):
+        self.block_size = block_size
+        self._local = threading.local()
+
+    def _get_blocks(self):
+        if not hasattr(self._local, 'blocks'):
+            self._local.blocks = {}
+        return self._local.blocks
+
+    def _is_single_writer(self):
+        return connection.vendor == 'sqlite'
+
+    def _get_connection(self):
+        """Собственное соединение потока для резервирования блоков."""
+        if not hasattr(self._local, 'connection'):
+            self._local.connection = connections.create_connection(
+                DEFAULT_DB_ALIAS
+            )
+        own_connection = self._local.connection
+        own_connection.close_if_unusable_or_obsolete()
+        return own_connection
+
+    def _increment_separately(self, name, size):
+        """Последний номер блока или None, если счётчика ещё нет."""
+        own_connection = self._get_connection()
+        table = own_connection.ops.quote_name(Sequence._meta.db_table)
+        own_connection.set_autocommit(False)
+        try:
+            with own_connection.cursor() as cursor:
+                cursor.execute(
+                    f'UPDATE {table} SET value = value + %s WHERE name = %s',
+                    (size, name),
+                )
+                last_value = None
+                if cursor.rowcount:
+                    cursor.execute(
+                        f'SELECT value FROM {table} WHERE name = %s', (name,)
+                    )
+                    (last_value,) = cursor.fetchone()
+            own_connection.commit()
+        except Exception:
+            own_connection.rollback()
+            raise
+        finally:
+            own_connection.set_autocommit(True)
+        return last_value
+
+    def _reserve_separately(self, name, size):
+        while (last_value := self._increment_separately(name, size)) is None:
+            own_connection = self._get_connection()
+            table = own_connection.ops.quote_name(Sequence._meta.db_table)
+            try:
+                with own_connection.cursor() as cursor:
+                    cursor.execute(
+                        f'INSERT INTO {table} (name, value) VALUES (%s, 0)',
+                        (name,),
+                    )
+            except IntegrityError:
+                # Счётчик создан другим процессом.
+                pass
+        return last_value
+
+    def _increment(self, name, size):
+        return Sequence.objects.filter(name=name).update(
+            value=F('value') + size
+        )
+
+    def _reserve_in_transaction(self, name, size):
+        with transaction.atomic():
+            if not self._increment(name, size):
+                try:
+                    with transaction.atomic():
+                        Sequence.objects.create(name=name, value=size)
+                except IntegrityError:
+                    self._increment(name, size)
+            return Sequence.objects.values_list('value', flat=True).get(
+                name=name
+            )
+
+    def _reserve_block(self, name, size):
+        if self._is_single_writer():
+            last_value = self._reserve_in_transaction(name, size)
+        else:
+            last_value = self._reserve_separately(name, size)
+        return SequenceBlock(last_value - size + 1, last_value)
+
+    def reserve(self, name, count):
+        """count уникальных номеров счётчика name по возрастанию."""
+        if self._is_single_writer() and connection.in_atomic_block:
+            return list(self._reserve_block(name, count).take(count))
+
+        blocks = self._get_blocks()
+        values = []
+        while len(values) < count:
+            block = blocks.get(name)
+            if block is None or block.next_value > block.last_value:
+                block = self._reserve_block(
+                    name, max(self.block_size, count - len(values))
+                )
+                blocks[name] = block
+            values.extend(block.take(count - len(values)))
+        return values
+
+    def next(self, name):
+        return self.reserve(name, 1)[0]
+
+    def reset(self):
+        """Забывает блоки текущего потока."""
+        self._get_blocks().clear()
+
+
+sequence_util = SequenceAllocator()
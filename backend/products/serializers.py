@@ -3,6 +3,7 @@ from collections import OrderedDict
 
 # Thirdparty imports
 from django.contrib.auth import get_user_model
+from django.core.validators import MinLengthValidator
 from django.db import IntegrityError, transaction
 from django.db.models import Avg, F, Max, Prefetch
 from rest_framework import serializers
@@ -11,13 +12,23 @@ from rest_framework.validators import UniqueTogetherValidator
 # Projects imports
 from products.article import article_util
 from products.constants import (
-    DEFAULT_RATING,
+    BATCH_MAX_SIZE,
+    DEFAULT_ORDER_QUANTITY,
+    LEADERBOARD_CAPACITY,
+    LEADERBOARD_PAGE_SIZE,
+    LEADERBOARD_RATING,
+    LEADERBOARDS,
     MAX_NAME_LENGTH,
     MIN_NAME_LENGTH,
+    MIN_ORDER_QUANTITY,
     MIN_PRICE_VALUE,
+    ORDER_EMPTY_ERR_MSG,
+    ORDER_PRODUCT_NOT_FOUND_ERR_MSG,
     PRICE_ERR_MSG,
     PRODUCT_NAME_ERR_MSG,
+    REFERENCE_NOT_FOUND_ERR_MSG,
 )
+from products.membership import ProductMembership
 from products.models import (
     Article,
     Category,
@@ -32,6 +43,9 @@ from products.models import (
     ShoppingCart,
     SubCategory,
 )
+from products.orders import order_util
+from products.reference import reference_util
+from products.sparse_fields import SparseFieldsetSerializerMixin
 from users.serializers import ShopUserRetrieveSerializer
 
 User = get_user_model()
@@ -62,6 +76,14 @@ class RatingSerializer(BaseRatingFavoriteShoppingCartSerializer):
         ]
 
 
+class RatingScoreSerializer(serializers.ModelSerializer):
+    """Оценка без проверки уникальности: повторная оценка заменяет её."""
+
+    class Meta:
+        model = Rating
+        fields = ('score',)
+
+
 class FavoriteSerializer(BaseRatingFavoriteShoppingCartSerializer):
 
     class Meta(BaseRatingFavoriteShoppingCartSerializer.Meta):
@@ -79,6 +101,50 @@ class ShoppingCartSerializer(BaseRatingFavoriteShoppingCartSerializer):
         model = ShoppingCart
 
 
+class ProductBatchSerializer(serializers.Serializer):
+    """Список id продуктов для пакетного добавления и удаления."""
+
+    products = serializers.ListField(
+        child=serializers.IntegerField(),
+        allow_empty=False,
+        max_length=BATCH_MAX_SIZE,
+    )
+
+
+class ReferencePrimaryKeyField(serializers.IntegerField):
+    """id строки справочника, проверяемый по reference_util без БД."""
+
+    default_error_messages = {'does_not_exist': REFERENCE_NOT_FOUND_ERR_MSG}
+
+    def __init__(self, table, **kwargs):
+        self.table = table
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        pk = super().to_internal_value(data)
+        if reference_util.get(self.table, pk, reload=False) is None:
+            self.fail('does_not_exist', pk_value=pk)
+        return pk
+
+
+class LeaderboardQuerySerializer(serializers.Serializer):
+    """Параметры /products/top/."""
+
+    by = serializers.ChoiceField(
+        choices=LEADERBOARDS, default=LEADERBOARD_RATING
+    )
+    # Неизвестная категория отклоняется: иначе её пустой лист
+    # оставался бы в кэше без срока.
+    category = ReferencePrimaryKeyField(
+        'category', required=False, default=None
+    )
+    limit = serializers.IntegerField(
+        min_value=1,
+        max_value=LEADERBOARD_CAPACITY,
+        default=LEADERBOARD_PAGE_SIZE,
+    )
+
+
 class CategorySerializer(serializers.ModelSerializer):
 
     class Meta:
@@ -102,6 +168,17 @@ class PropertyValueSerializer(serializers.ModelSerializer):
         fields = ('id', 'value')
 
 
+class ReferenceField(serializers.ReadOnlyField):
+    """Строка справочника из reference_util по id в source."""
+
+    def __init__(self, table, **kwargs):
+        self.table = table
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        return reference_util.get(self.table, value)
+
+
 class GetProductPropertySerializer(serializers.ModelSerializer):
 
     id = serializers.IntegerField(source='property_id')
@@ -112,7 +189,7 @@ class GetProductPropertySerializer(serializers.ModelSerializer):
         fields = ('id', 'name', 'value')
 
     def get_name(self, instance):
-        return instance.property.name
+        return reference_util.get('property', instance.property_id)['name']
 
 
 class ProductTypeSerializer(serializers.ModelSerializer):
@@ -122,18 +199,18 @@ class ProductTypeSerializer(serializers.ModelSerializer):
         fields = ('id', 'name')
 
 
-class GetProductSerializer(serializers.ModelSerializer):
+class GetProductSerializer(
+    SparseFieldsetSerializerMixin, serializers.ModelSerializer
+):
     article = serializers.SerializerMethodField()
-    category = CategorySerializer(read_only=True)
-    sub_category = SubCategorySerializer(read_only=True)
-    product_type = ProductTypeSerializer(read_only=True)
+    category = ReferenceField('category', source='category_id')
+    sub_category = ReferenceField('sub_category', source='sub_category_id')
+    product_type = ReferenceField('product_type', source='product_type_id')
     properties = serializers.SerializerMethodField()
     creator = ShopUserRetrieveSerializer(read_only=True)
-    rating = serializers.IntegerField(default=DEFAULT_RATING)
-    is_favorited = serializers.BooleanField(default=False, read_only=True)
-    is_in_shopping_cart = serializers.BooleanField(
-        default=False, read_only=True
-    )
+    rating = serializers.FloatField(source='rating_avg', read_only=True)
+    is_favorited = serializers.SerializerMethodField()
+    is_in_shopping_cart = serializers.SerializerMethodField()
 
     class Meta:
         model = Product
@@ -147,6 +224,7 @@ class GetProductSerializer(serializers.ModelSerializer):
             'properties',
             'price',
             'rating',
+            'rating_count',
             'article',
             'creator',
             'is_favorited',
@@ -163,6 +241,18 @@ class GetProductSerializer(serializers.ModelSerializer):
         )
         return serializer.data
 
+    def get_is_favorited(self, instance):
+        membership = self.context.get('membership', ProductMembership())
+        return instance.id in membership.favorite_ids
+
+    def get_is_in_shopping_cart(self, instance):
+        membership = self.context.get('membership', ProductMembership())
+        return instance.id in membership.shopping_cart_ids
+
+
+class ImportPropertyValueSerializer(PropertyValueSerializer):
+    id = ReferencePrimaryKeyField('property', source='property_id')
+
 
 class ProductSerializer(serializers.ModelSerializer):
 
@@ -215,46 +305,104 @@ class ProductSerializer(serializers.ModelSerializer):
         return super().update(instance, validated_data)
 
 
-class GetOrderSerializer(serializers.ModelSerializer):
+class ImportProductSerializer(ProductSerializer):
+    """
+    Проверка строки импорта без запросов к БД.
+
+    Справочники проверяются по reference_util, validated_data содержит
+    их id. Уникальность name проверяется импортом одним запросом на
+    пачку, поэтому UniqueValidator снят.
+    """
+
+    category = ReferencePrimaryKeyField('category')
+    sub_category = ReferencePrimaryKeyField('sub_category')
+    product_type = ReferencePrimaryKeyField('product_type')
+    properties = ImportPropertyValueSerializer(many=True)
+
+    class Meta(ProductSerializer.Meta):
+        extra_kwargs = {
+            'name': {'validators': [MinLengthValidator(MIN_NAME_LENGTH)]},
+        }
+
+
+class OrderProductSerializer(serializers.ModelSerializer):
+
+    id = serializers.IntegerField(source='product_id')
+    quantity = serializers.IntegerField(
+        min_value=MIN_ORDER_QUANTITY, default=DEFAULT_ORDER_QUANTITY
+    )
+
+    class Meta:
+        model = OrderProduct
+        fields = ('id', 'quantity', 'unit_price', 'snapshot')
+        read_only_fields = ('unit_price', 'snapshot')
+
+    def to_internal_value(self, data):
+        # Прежний формат запроса: id продукта вместо строки заказа.
+        if isinstance(data, (int, str)) and not isinstance(data, bool):
+            data = {'id': data}
+        return super().to_internal_value(data)
+
+
+class GetOrderSerializer(
+    SparseFieldsetSerializerMixin, serializers.ModelSerializer
+):
 
     products = GetProductSerializer(many=True)
+    items = serializers.SerializerMethodField()
 
     class Meta:
         model = Order
         fields = '__all__'
 
+    def get_items(self, instance):
+        return OrderProductSerializer(
+            instance.order_product_by_order.all(), many=True
+        ).data
+
 
 class OrderSerializer(serializers.ModelSerializer):
 
-    products = serializers.PrimaryKeyRelatedField(
-        queryset=Product.objects.all(), many=True
-    )
+    products = OrderProductSerializer(many=True)
 
     class Meta:
         model = Order
         fields = '__all__'
-        read_only_fields = ('customer',)
+        read_only_fields = ('customer', 'total_price')
 
     def to_representation(self, instance):
-        return GetOrderSerializer(instance).data
-
-    def order_products_create(self, products, order):
-        data = []
-        for product in products:
-            data.append(OrderProduct(order=order, product=product))
-        OrderProduct.objects.bulk_create(data)
-
-    def _calculate_total_price(self, products):
-        return sum(
-            [Product.objects.get(id=product.id).price for product in products]
+        # Заказ перечитывается с загруженными строками и продуктами.
+        return GetOrderSerializer(
+            Order.objects.get_annotated_queryset().get(id=instance.id)
+        ).data
+
+    def validate_products(self, products):
+        if not products:
+            raise serializers.ValidationError(ORDER_EMPTY_ERR_MSG)
+
+        product_ids = {product['product_id'] for product in products}
+        missing_ids = product_ids - set(
+            Product.objects.filter(id__in=product_ids).values_list(
+                'id', flat=True
+            )
         )
+        if missing_ids:
+            raise serializers.ValidationError(
+                ORDER_PRODUCT_NOT_FOUND_ERR_MSG.format(
+                    ', '.join(map(str, sorted(missing_ids)))
+                )
+            )
+        return products
 
     def create(self, validated_data):
-        products_data = validated_data.pop('products')
-        total_price = self._calculate_total_price(products_data)
-
-        instance = Order.objects.create(
-            **validated_data, total_price=total_price
+        return order_util.create(
+            validated_data['customer'], validated_data['products']
         )
-        self.order_products_create(products_data, instance)
+
+    @transaction.atomic
+    def update(self, instance, validated_data):
+        lines = validated_data.pop('products', None)
+        instance = super().update(instance, validated_data)
+        if lines is not None:
+            order_util.update(instance, lines)
         return instance
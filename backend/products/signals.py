@@ -1,11 +1,12 @@
 # Thirdparty imports
 import faker
 from django.contrib.auth import get_user_model
-from django.db.models.signals import post_migrate
+from django.db.models.signals import post_delete, post_migrate, post_save
 from django.dispatch import receiver
+from django.utils import timezone
 
 # Projects imports
-from products.constants import DEFAULT_ARTICLE_DIGIT
+from products.constants import CATALOG_VERSION, DEFAULT_ARTICLE_DIGIT
 from products.models import (
     Article,
     Category,
@@ -13,8 +14,13 @@ from products.models import (
     ProductProperty,
     ProductType,
     Property,
+    Rating,
     SubCategory,
 )
+from products.product_types import product_type_util
+from products.reference import reference_util
+from products.search import get_search_backend
+from products.versioning import version_util
 
 User = get_user_model()
 
@@ -59,6 +65,52 @@ def create_category_sub_category(sender, **kwargs):
         Property.objects.bulk_create(data)
 
 
+@receiver((post_save, post_delete), sender=ProductProperty)
+@receiver((post_save, post_delete), sender=Article)
+@receiver((post_save, post_delete), sender=Rating)
+def touch_product(sender, instance, **kwargs):
+    """Сдвигает updated_at продукта, инвалидируя его карточку."""
+    Product.objects.filter(id=instance.product_id).update(
+        updated_at=timezone.now()
+    )
+
+
+@receiver((post_save, post_delete), sender=Category)
+@receiver((post_save, post_delete), sender=SubCategory)
+@receiver((post_save, post_delete), sender=ProductType)
+@receiver((post_save, post_delete), sender=Property)
+@receiver((post_save, post_delete), sender=Product)
+@receiver((post_save, post_delete), sender=ProductProperty)
+@receiver((post_save, post_delete), sender=Article)
+@receiver((post_save, post_delete), sender=Rating)
+def bump_catalog_version(sender, **kwargs):
+    """Делает устаревшими ETag и кэши, зависящие от каталога."""
+    version_util.bump(CATALOG_VERSION)
+
+
+@receiver((post_save, post_delete), sender=Category)
+@receiver((post_save, post_delete), sender=SubCategory)
+@receiver((post_save, post_delete), sender=ProductType)
+@receiver((post_save, post_delete), sender=Property)
+def invalidate_reference_data(sender, **kwargs):
+    reference_util.invalidate()
+
+
+@receiver((post_save, post_delete), sender=Product)
+def invalidate_product_type(sender, instance, **kwargs):
+    product_type_util.invalidate(instance.id)
+
+
+@receiver(post_save, sender=Product)
+def index_product(sender, instance, **kwargs):
+    get_search_backend().index([instance])
+
+
+@receiver(post_delete, sender=Product)
+def unindex_product(sender, instance, **kwargs):
+    get_search_backend().remove([instance.id])
+
+
 # @receiver(post_migrate)
 # def create_product(sender, **kwargs):
 #     if sender.name == 'products':
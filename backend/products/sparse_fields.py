@@ -0,0 +1,60 @@
+# Projects imports
+from products.constants import FIELDS_QUERY_PARAM, OMIT_QUERY_PARAM
+
+
+def split_fields(value):
+    return {field.strip() for field in value.split(',') if field.strip()}
+
+
+def get_sparse_fields(request, all_fields):
+    """
+    Поля all_fields, оставшиеся после ?fields= и ?omit=.
+
+    Порядок полей сохраняется, неизвестные имена игнорируются.
+    None - параметры не переданы, нужны все поля.
+    """
+    fields = request.query_params.get(FIELDS_QUERY_PARAM)
+    omit = request.query_params.get(OMIT_QUERY_PARAM)
+    if not fields and not omit:
+        return None
+
+    selected = split_fields(fields) if fields else set(all_fields)
+    omitted = split_fields(omit) if omit else set()
+    return tuple(
+        field
+        for field in all_fields
+        if field in selected and field not in omitted
+    )
+
+
+class SparseFieldsetSerializerMixin:
+    """Принимает fields=<имена полей> и убирает из ответа остальные."""
+
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for field_name in set(self.fields) - set(fields):
+                self.fields.pop(field_name)
+
+
+class SparseFieldsetViewMixin:
+    """
+    Передаёт ?fields=/?omit= в сериализатор чтения.
+
+    get_sparse_fields() также используется в get_queryset, чтобы
+    не подгружать связи, которых нет в ответе.
+    """
+
+    def get_sparse_fields(self):
+        serializer_class = self.get_serializer_class()
+        if not issubclass(serializer_class, SparseFieldsetSerializerMixin):
+            return None
+        return get_sparse_fields(
+            self.request, tuple(serializer_class().fields)
+        )
+
+    def get_serializer(self, *args, **kwargs):
+        fields = self.get_sparse_fields()
+        if fields is not None:
+            kwargs.setdefault('fields', fields)
+        return super().get_serializer(*args, **kwargs)
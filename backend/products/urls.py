@@ -24,12 +24,29 @@ router.register(
     r'sub_category', SubCategoryViewSet, basename='sub_category_v1'
 )
 
+BATCH_ACTIONS = {'post': 'batch_create', 'delete': 'batch_destroy'}
+
 urlpatterns = [
+    # До router.urls, иначе shopping_cart/batch/ совпадёт с detail-маршрутом.
+    path(
+        'favorite/batch/',
+        RatingFavoriteShoppingCartViewSet.as_view(
+            BATCH_ACTIONS, path_segment='favorite'
+        ),
+        name='favorite_batch',
+    ),
+    path(
+        'shopping_cart/batch/',
+        RatingFavoriteShoppingCartViewSet.as_view(
+            BATCH_ACTIONS, path_segment='shopping_cart'
+        ),
+        name='shopping_cart_batch',
+    ),
     path('', include(router.urls)),
     path(
         'products/<int:pk>/rating/',
         RatingFavoriteShoppingCartViewSet.as_view(
-            {'post': 'create', 'get': 'retrieve'}
+            {'post': 'create', 'get': 'retrieve', 'delete': 'destroy'}
         ),
         name='rating_favorite_shopping_cart',
     ),
@@ -0,0 +1,50 @@
+# Standart lib imports
+import time
+
+# Thirdparty imports
+from django.core.cache import cache
+from django.db import transaction
+
+
+class DataVersion:
+    """
+    Счётчики изменений данных в общем кэше.
+
+    Сигналы save/delete увеличивают счётчик своей области, поэтому
+    для проверки свежести ответа достаточно сравнить номера версий.
+    Начальное значение берётся из текущего времени: после вытеснения
+    ключа счётчик не повторит уже выданные номера.
+    """
+
+    def _get_cache_key(self, scope):
+        return f'version:{scope}'
+
+    def get(self, *scopes):
+        """Номера версий областей scopes в том же порядке."""
+        keys = [self._get_cache_key(scope) for scope in scopes]
+        versions = cache.get_many(keys)
+        for key in keys:
+            if key not in versions:
+                cache.add(key, time.time_ns(), None)
+                versions[key] = cache.get(key)
+        return tuple(versions[key] for key in keys)
+
+    def _incr(self, scope):
+        key = self._get_cache_key(scope)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.add(key, time.time_ns(), None)
+
+    def bump(self, scope):
+        """
+        Увеличивает версию сразу и ещё раз после коммита транзакции.
+
+        Ответ, собранный между записью и коммитом, получит промежуточную
+        версию и не совпадёт с версией зафиксированных данных.
+        """
+        self._incr(scope)
+        transaction.on_commit(lambda: self._incr(scope))
+
+
+version_util = DataVersion()
@@ -1,23 +1,61 @@
 # Standart lib imports
+import io
 from dataclasses import dataclass
+from pathlib import Path
 
 # Thirdparty imports
 from django.db import transaction
+from django.db.models import Max
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
+from django_filters.rest_framework import DjangoFilterBackend
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
-from rest_framework.decorators import permission_classes
+from rest_framework import status
+from rest_framework.decorators import action, permission_classes
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import (
+    SAFE_METHODS,
     AllowAny,
     IsAuthenticated,
     IsAuthenticatedOrReadOnly,
 )
+from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet
 
 # Projects imports
 from .crud_for_rating_shopping_cart import (
+    batch_create_favorite_shopping_cart,
+    batch_delete_favorite_shopping_cart,
     create_rating_favorite_shopping_cart,
     delete_rating_favorite_shopping_cart,
+    rate_product,
+)
+from products.bought_together import bought_together_util
+from products.cards import card_util
+from products.conditional import ConditionalGetViewMixin, conditional_get
+from products.constants import (
+    CART_EMPTY_ERR_MSG,
+    EXPORT_CHUNK_SIZE,
+    EXPORT_CONTENT_TYPES,
+    EXPORT_FORMAT_ERR_MSG,
+    EXPORT_FORMAT_QUERY_PARAM,
+    FACETS_QUERY_PARAM,
+    IMPORT_BATCH_SIZE,
+    IMPORT_FILE_ERR_MSG,
+    IMPORT_FILE_FIELD,
+    IMPORT_FORMAT_ERR_MSG,
+    IMPORT_FORMAT_QUERY_PARAM,
+)
+from products.export import export_util
+from products.filters import ProductFilter, ProductSearchFilter, get_facets
+from products.importer import import_util
+from products.leaderboard import leaderboard_util
+from products.membership import membership_util
+from products.minimal_response import (
+    MinimalResponseViewMixin,
+    is_minimal_response,
+    minimal_response,
 )
 from products.models import (
     Category,
@@ -28,31 +66,46 @@ from products.models import (
     ShoppingCart,
     SubCategory,
 )
+from products.orders import order_util
+from products.pagination import (
+    OrderHistoryPagination,
+    ProductCursorPagination,
+)
+from products.readers import PRODUCT_FIELDS, reader_util
+from products.response_cache import AnonymousCacheViewMixin, cache_anonymous
 from products.serializers import (
     CategorySerializer,
     FavoriteSerializer,
     GetOrderSerializer,
     GetProductSerializer,
+    LeaderboardQuerySerializer,
     OrderSerializer,
     ProductSerializer,
     RatingSerializer,
     ShoppingCartSerializer,
     SubCategorySerializer,
 )
+from products.sparse_fields import SparseFieldsetViewMixin
 from users.permissions import IsSuperuserOrReadOnly
 
 SAFE_ACTIONS = ('list', 'retrieve')
+# Действия, отдающие карточки продуктов через reader_util.
+RANKED_ACTIONS = ('top', 'bought_together')
 
 
 @permission_classes((AllowAny,))
-class SubCategoryViewSet(ModelViewSet):
+class SubCategoryViewSet(
+    ConditionalGetViewMixin, AnonymousCacheViewMixin, ModelViewSet
+):
 
     queryset = SubCategory.objects.all()
     serializer_class = SubCategorySerializer
 
 
 @permission_classes((AllowAny,))
-class CategoryViewSet(ModelViewSet):
+class CategoryViewSet(
+    ConditionalGetViewMixin, AnonymousCacheViewMixin, ModelViewSet
+):
 
     queryset = Category.objects.all()
     serializer_class = CategorySerializer
@@ -71,31 +124,38 @@ class RatingFavoriteShoppingCartViewSet(ModelViewSet):
         'shopping_cart': ShoppingCart.objects.all(),
     }
 
+    # Задаётся в as_view для путей, где тип списка не последний сегмент.
+    path_segment = None
+
     def get_path_segment(self):
-        return self.request.path.strip('/').split('/')[-1]
+        return self.path_segment or self.request.path.strip('/').split('/')[-1]
 
     def get_serializer_class(self):
         path_segment = self.get_path_segment()
         return self.SERIALIZER_MAPPING.get(path_segment)
 
     def get_queryset(self):
+        # .all() - queryset класса иначе кэширует результат между запросами.
         path_segment = self.get_path_segment()
-        return self.QUERYSET_MAPPING.get(path_segment)
+        return self.QUERYSET_MAPPING.get(path_segment).all()
 
     def get_permissions(self):
-        if self.get_path_segment() == 'rating':
+        if (
+            self.get_path_segment() == 'rating'
+            and self.request.method in SAFE_METHODS
+        ):
             return [AllowAny()]
         return [IsAuthenticated()]
 
     @transaction.atomic
     def create(self, request, *args, **kwargs):
-
-        extra_fields = request.data.get('score')
+        if self.get_path_segment() == 'rating':
+            return rate_product(request, pk=kwargs.get('pk'))
         return create_rating_favorite_shopping_cart(
             request,
             self.get_serializer_class(),
             pk=kwargs.get('pk'),
-            extra_fields=extra_fields,
+            minimal=is_minimal_response(request),
         )
 
     @transaction.atomic
@@ -106,27 +166,232 @@ class RatingFavoriteShoppingCartViewSet(ModelViewSet):
             pk=kwargs.get('pk'),
         )
 
+    @transaction.atomic
+    def batch_create(self, request, *args, **kwargs):
+        return batch_create_favorite_shopping_cart(
+            request, self.get_queryset().model
+        )
+
+    @transaction.atomic
+    def batch_destroy(self, request, *args, **kwargs):
+        return batch_delete_favorite_shopping_cart(
+            request, self.get_queryset().model
+        )
+
+    @action(detail=False, methods=('post',))
+    def checkout(self, request):
+        """Оформление корзины в заказ одной транзакцией."""
+        order = order_util.checkout(request.user)
+        if order is None:
+            raise ValidationError(CART_EMPTY_ERR_MSG)
+        if is_minimal_response(request):
+            return minimal_response(order, status.HTTP_201_CREATED)
+        return Response(
+            GetOrderSerializer(
+                Order.objects.get_annotated_queryset().get(id=order.id)
+            ).data,
+            status=status.HTTP_201_CREATED,
+        )
+
 
 @permission_classes((IsAuthenticatedOrReadOnly, IsSuperuserOrReadOnly))
-class ProductViewSet(ModelViewSet):
+class ProductViewSet(
+    ConditionalGetViewMixin,
+    AnonymousCacheViewMixin,
+    SparseFieldsetViewMixin,
+    MinimalResponseViewMixin,
+    ModelViewSet,
+):
 
     http_method_names = ('get', 'post', 'patch', 'delete')
+    pagination_class = ProductCursorPagination
+    filter_backends = (DjangoFilterBackend, ProductSearchFilter)
+    filterset_class = ProductFilter
 
     def get_queryset(self):
-        return Product.objects.get_annotated_queryset(self.request.user)
+        if self.action in SAFE_ACTIONS:
+            return Product.objects.only('id', 'updated_at')
+        return Product.objects.get_annotated_queryset()
 
     def get_serializer_class(self):
-        if self.action in SAFE_ACTIONS:
+        if self.action in SAFE_ACTIONS + RANKED_ACTIONS:
             return GetProductSerializer
         return ProductSerializer
 
+    def get_scored_products(self, scores, key):
+        """
+        Карточки продуктов scores ({id: значение}) в его порядке,
+        значение кладётся в поле key. id читается всегда, чтобы
+        сопоставить карточку со значением.
+        """
+        fields = self.get_sparse_fields()
+        if fields is None:
+            fields = PRODUCT_FIELDS
+        products = reader_util.get_many(
+            list(scores),
+            membership_util.get(self.request.user),
+            fields if 'id' in fields else ('id', *fields),
+        )
+        for product in products:
+            product[key] = scores[product['id']]
+            if 'id' not in fields:
+                del product['id']
+        return products
+
+    def get_products_data(self, products):
+        membership = membership_util.get(self.request.user)
+        fields = self.get_sparse_fields()
+        if fields is None:
+            return card_util.get_many(products, membership)
+        return reader_util.get_many(
+            [product.id for product in products], membership, fields
+        )
+
+    def get_etag_parts(self):
+        """
+        Max(updated_at) ловит bulk_create и update в обход сигналов,
+        флаги избранного и корзины - изменения пользователя.
+        """
+        membership = membership_util.get(self.request.user)
+        return (
+            Product.objects.aggregate(Max('updated_at'))['updated_at__max'],
+            self.request.user.id,
+            sorted(membership.favorite_ids),
+            sorted(membership.shopping_cart_ids),
+        )
+
+    @conditional_get
+    @cache_anonymous
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        response = self.get_paginated_response(self.get_products_data(page))
+
+        if request.query_params.get(FACETS_QUERY_PARAM) in ('1', 'true'):
+            response.data['facets'] = self.get_facets_data()
+        return response
+
+    def get_facets_data(self):
+        """
+        Фасеты каталога: get_facets получает продукты без фильтра
+        по характеристикам и значения этого фильтра отдельно.
+        """
+        filterset = ProductFilter(self.request.query_params)
+        filterset.is_valid()
+        queryset = ProductSearchFilter().filter_queryset(
+            self.request, self.get_queryset(), self
+        )
+        return get_facets(queryset, filterset.form.cleaned_data['property'])
+
+    @conditional_get
+    @cache_anonymous
+    def retrieve(self, request, *args, **kwargs):
+        return Response(self.get_products_data([self.get_object()])[0])
+
+    @action(detail=False, methods=('get',))
+    def top(self, request):
+        """Топ продуктов ?by=rating|favorites|sales&category=&limit=."""
+        serializer = LeaderboardQuerySerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        params = serializer.validated_data
+
+        board = leaderboard_util.get(
+            params['by'], params['category'], params['limit']
+        )
+        return Response(
+            {
+                'by': params['by'],
+                'results': self.get_scored_products(dict(board), 'score'),
+            }
+        )
+
+    @action(detail=True, methods=('get',), url_path='bought_together')
+    def bought_together(self, request, pk=None):
+        """Продукты, которые чаще всего заказывают вместе с этим."""
+        return Response(
+            {
+                'results': self.get_scored_products(
+                    dict(bought_together_util.get(pk)), 'count'
+                )
+            }
+        )
+
+    @action(detail=False, methods=('get',))
+    def export(self, request):
+        """Потоковая выгрузка каталога, ?file_format=jsonl|csv."""
+        file_format = request.query_params.get(
+            EXPORT_FORMAT_QUERY_PARAM, 'jsonl'
+        )
+        if file_format not in EXPORT_CONTENT_TYPES:
+            raise ValidationError(
+                {
+                    EXPORT_FORMAT_QUERY_PARAM: EXPORT_FORMAT_ERR_MSG.format(
+                        ', '.join(EXPORT_CONTENT_TYPES)
+                    )
+                }
+            )
+
+        response = StreamingHttpResponse(
+            export_util.iter_lines(
+                file_format,
+                self.filter_queryset(Product.objects.all()),
+                EXPORT_CHUNK_SIZE,
+            ),
+            content_type=EXPORT_CONTENT_TYPES[file_format],
+        )
+        response['Content-Disposition'] = (
+            f'attachment; filename="catalog.{file_format}"'
+        )
+        return response
+
+    @action(detail=False, methods=('post',), url_path='import')
+    def import_products(self, request):
+        """Загрузка файла CSV/JSONL, отчёт об ошибках по строкам."""
+        upload = request.FILES.get(IMPORT_FILE_FIELD)
+        if upload is None:
+            raise ValidationError(
+                {
+                    IMPORT_FILE_FIELD: IMPORT_FILE_ERR_MSG.format(
+                        IMPORT_FILE_FIELD
+                    )
+                }
+            )
+        file_format = request.data.get(
+            IMPORT_FORMAT_QUERY_PARAM, Path(upload.name).suffix.lstrip('.')
+        )
+        if file_format not in EXPORT_CONTENT_TYPES:
+            raise ValidationError(
+                {
+                    IMPORT_FORMAT_QUERY_PARAM: IMPORT_FORMAT_ERR_MSG.format(
+                        ', '.join(EXPORT_CONTENT_TYPES)
+                    )
+                }
+            )
+
+        report = import_util.run(
+            io.TextIOWrapper(upload.file, encoding='utf-8', newline=''),
+            file_format,
+            request.user,
+            IMPORT_BATCH_SIZE,
+        )
+        return Response(report.as_dict())
+
     def perform_create(self, serializer):
         serializer.save(creator=self.request.user)
 
 
 @permission_classes((IsAuthenticated,))
-class OrderViewSet(ModelViewSet):
-    queryset = Order.objects.all()
+class OrderViewSet(
+    SparseFieldsetViewMixin, MinimalResponseViewMixin, ModelViewSet
+):
+
+    def get_queryset(self):
+        if self.action not in SAFE_ACTIONS:
+            # Ответ записи перечитывает заказ в to_representation.
+            return Order.objects.filter(customer=self.request.user)
+        return Order.objects.get_annotated_queryset(
+            self.get_sparse_fields()
+        ).filter(customer=self.request.user)
 
     def get_serializer_class(self):
         return (
@@ -137,3 +402,12 @@ class OrderViewSet(ModelViewSet):
 
     def perform_create(self, serializer):
         serializer.save(customer=self.request.user)
+
+    @action(detail=False, methods=('get',))
+    def history(self, request):
+        """История заказов покупателя, один запрос на страницу."""
+        paginator = OrderHistoryPagination()
+        page = paginator.paginate_queryset(
+            Order.objects.filter(customer=request.user), request, self
+        )
+        return paginator.get_paginated_response(page)
@@ -40,3 +40,193 @@ NOT_ENOUGH_FIELDS = (
     ' Отсутствует поле {}.'
 )
 EXPECTED_PRODUCTS_COUNT = 2
+
+#  Pagination
+PAGE_SIZE = 2
+PAGINATED_PRODUCTS_COUNT = 5
+PAGINATION_KEYS_MISSING = (
+    'Ответ списка продуктов должен содержать ключи next/previous/results.'
+)
+PAGINATION_LOST_PRODUCTS = (
+    'Проход по курсорам должен вернуть все продукты ровно по одному разу.'
+)
+PAGINATION_USES_COUNT = 'Пагинация не должна выполнять COUNT(*).'
+
+#  Rating
+URL_PRODUCT_RATING = '/api/v1/products/{}/rating/'
+RATING_AGGREGATE_MISMATCH = (
+    'rating_avg/rating_count продукта должны соответствовать'
+    ' сохранённым оценкам.'
+)
+RATING_CATALOG_QUERY = (
+    'Оценка не должна перечитывать продукт запросом каталога.'
+)
+
+#  Favorite/ShoppingCart
+URL_PRODUCT_FAVORITE = '/api/v1/products/{}/favorite/'
+URL_PRODUCT_SHOPPING_CART = '/api/v1/products/{}/shopping_cart/'
+URL_FAVORITE_BATCH = '/api/v1/favorite/batch/'
+URL_SHOPPING_CART_BATCH = '/api/v1/shopping_cart/batch/'
+BATCH_MISMATCH = (
+    'Пакетный запрос должен добавить существующие продукты без повторов'
+    ' и вернуть отсутствующие id.'
+)
+MEMBERSHIP_FLAG_MISMATCH = (
+    'Флаги is_favorited/is_in_shopping_cart не соответствуют'
+    ' избранному и корзине пользователя.'
+)
+CATALOG_QUERY_DEPENDS_ON_USER = (
+    'SQL-запрос каталога не должен зависеть от пользователя.'
+)
+
+#  Product cards
+CARD_NOT_CACHED = (
+    'Повторный запрос каталога должен собираться из кэша карточек.'
+)
+CARD_NOT_INVALIDATED = (
+    'Изменение характеристики продукта должно обновлять его карточку.'
+)
+CARD_NOT_INVALIDATED_BY_REBUILD = (
+    'Пересчёт рейтинга должен обновлять карточку продукта.'
+)
+
+#  Product reader
+READER_OUTPUT_MISMATCH = (
+    'reader_util должен возвращать тот же JSON, что и GetProductSerializer.'
+)
+
+#  Property filter
+PROPERTY_FILTER_MISMATCH = (
+    'Фильтр property должен оставлять только продукты'
+    ' с указанными значениями характеристик.'
+)
+FACETS_MISMATCH = (
+    'Блок facets должен содержать количество продуктов по значениям'
+    ' характеристик: выбранной - без её собственного фильтра,'
+    ' остальных - для текущего фильтра.'
+)
+
+#  Search
+SEARCH_MISMATCH = (
+    'Поиск ?search= должен находить продукты по основам русских слов'
+    ' и ставить совпадения в названии выше совпадений в описании.'
+)
+
+#  Sparse fieldsets
+URL_ORDERS = '/api/v1/orders/'
+URL_MAKE_PC = '/api/v1/make_pc/'
+SPARSE_FIELDS_MISMATCH = (
+    'Ответ должен содержать только поля из ?fields= без полей из ?omit=.'
+)
+SPARSE_FIELDS_EXTRA_QUERY = (
+    'Связи полей, которых нет в ответе, не должны запрашиваться.'
+)
+
+#  Conditional GET
+URL_CATEGORIES = '/api/v1/category/'
+NOT_MODIFIED_EXPECTED = (
+    'Совпавший If-None-Match должен давать 304 без запроса продуктов.'
+)
+ETAG_NOT_CHANGED = (
+    'ETag должен меняться после изменения данных, от которых зависит ответ.'
+)
+
+#  Anonymous response cache
+RESPONSE_NOT_CACHED = (
+    'Повторный анонимный запрос должен отдаваться из кэша ответов.'
+)
+RESPONSE_NOT_INVALIDATED = (
+    'Сохранение продукта должно делать кэш ответов устаревшим.'
+)
+
+#  Reference data
+REFERENCE_JOIN_FOUND = (
+    'Справочники должны браться из reference_util без JOIN.'
+)
+REFERENCE_NOT_INVALIDATED = (
+    'Переименование категории должно попадать в ответ каталога.'
+)
+REFERENCE_MISS_RELOADS_TABLES = (
+    'Промах reference_util должен дочитывать одну строку, а не все таблицы.'
+)
+
+#  Export
+URL_PRODUCTS_EXPORT = '/api/v1/products/export/'
+EXPORT_MISMATCH = (
+    'Выгрузка должна содержать по строке на каждый продукт каталога.'
+)
+
+#  Import
+URL_PRODUCTS_IMPORT = '/api/v1/products/import/'
+IMPORT_MISMATCH = (
+    'Импорт должен создать продукты с артикулами и характеристиками,'
+    ' а ошибочные строки вынести в отчёт.'
+)
+
+#  Sequences
+SEQUENCE_DUPLICATE = 'Номера счётчика не должны повторяться.'
+SEQUENCE_EXTRA_QUERY = (
+    'Номера из зарезервированного блока выдаются без запросов к БД.'
+)
+
+#  Orders
+ORDER_TOTAL_MISMATCH = (
+    'Сумма заказа должна учитывать количество и цену на момент заказа.'
+)
+ORDER_QUERIES_GROW = (
+    'Число запросов при создании заказа не должно зависеть от числа строк.'
+)
+URL_ORDERS_HISTORY = '/api/v1/orders/history/'
+ORDER_HISTORY_MISMATCH = (
+    'История должна отдавать только заказы покупателя со снимком'
+    ' продукта на момент заказа.'
+)
+ORDER_HISTORY_EXTRA_QUERY = (
+    'Страница истории заказов должна читаться одним запросом.'
+)
+URL_CHECKOUT = '/api/v1/shopping_cart/checkout/'
+CHECKOUT_MISMATCH = (
+    'Оформление корзины должно создать заказ из её продуктов'
+    ' и очистить корзину.'
+)
+
+#  Minimal response
+MINIMAL_RESPONSE_MISMATCH = (
+    'При Prefer: return=minimal ответ должен содержать только id и версию.'
+)
+
+#  Leaderboard
+URL_PRODUCTS_TOP = '/api/v1/products/top/'
+LEADERBOARD_MISMATCH = (
+    'Топ должен быть упорядочен по очкам и обновляться после записей.'
+)
+LEADERBOARD_UNKNOWN_CATEGORY = (
+    'Топ несуществующей категории должен отклоняться без записи в кэш.'
+)
+
+#  Bought together
+URL_PRODUCT_BOUGHT_TOGETHER = '/api/v1/products/{}/bought_together/'
+BOUGHT_TOGETHER_MISMATCH = (
+    'Блок "покупают вместе" должен упорядочивать соседей по числу'
+    ' общих заказов и учитывать новые заказы.'
+)
+
+#  Make PC
+MAKE_PC_MISMATCH = 'Сборки ПК должны совпадать с GetPcDIYSerializer.'
+MAKE_PC_EXTRA_QUERY = (
+    'Число запросов списка сборок не должно зависеть от числа сборок.'
+)
+URL_MAKE_PC_CANDIDATES = '/api/v1/make_pc/{}/candidates/{}/'
+MAKE_PC_CANDIDATES_MISMATCH = (
+    'Кандидаты слота должны быть совместимы с выбранными частями сборки.'
+)
+URL_MAKE_PC_BULK = '/api/v1/make_pc/bulk/'
+MAKE_PC_BULK_MISMATCH = (
+    'Список сборок должен сохраняться целиком или не сохраняться вовсе.'
+)
+MAKE_PC_VALIDATE_QUERIES = (
+    'Типы продуктов всех сборок должны читаться одним запросом.'
+)
+ORDER_UPDATE_MISMATCH = (
+    'Изменение строк заказа должно пересчитывать цены и сумму заказа.'
+)
@@ -4,7 +4,14 @@ from django.contrib.auth import get_user_model
 from django.contrib.auth.hashers import make_password
 
 # Projects imports
-from products.models import Product, Property
+from products.models import (
+    Article,
+    Category,
+    Product,
+    ProductType,
+    Property,
+    SubCategory,
+)
 
 # from faker import Faker
 
@@ -14,9 +21,10 @@ User = get_user_model()
 
 class UserFactory(factory.django.DjangoModelFactory):
 
-    email = factory.Faker('email')
+    # Уникальные поля: случайные значения Faker могут совпасть.
+    email = factory.Sequence(lambda n: f'user{n}@example.com')
     username = factory.LazyAttribute(lambda obj: obj.email)
-    phone_number = factory.Faker('phone_number')
+    phone_number = factory.Sequence(lambda n: f'+7{n:010d}')
     password = factory.LazyFunction(lambda: make_password('Zb0dd445'))
 
     class Meta:
@@ -31,18 +39,58 @@ class SuperUserFactory(UserFactory):
 
 class PropertyFactory(factory.django.DjangoModelFactory):
 
-    name = factory.Faker('word')
+    name = factory.Sequence(lambda n: f'property_{n}')
 
     class Meta:
         model = Property
 
 
+class CategoryFactory(factory.django.DjangoModelFactory):
+
+    name = factory.Sequence(lambda n: f'category_{n}')
+    slug = factory.Sequence(lambda n: f'category-{n}')
+
+    class Meta:
+        model = Category
+
+
+class SubCategoryFactory(factory.django.DjangoModelFactory):
+
+    name = factory.Sequence(lambda n: f'sub_category_{n}')
+    slug = factory.Sequence(lambda n: f'sub-category-{n}')
+
+    class Meta:
+        model = SubCategory
+
+
+class ProductTypeFactory(factory.django.DjangoModelFactory):
+
+    name = factory.Sequence(lambda n: f'PRODUCT_TYPE_{n}')
+
+    class Meta:
+        model = ProductType
+
+
+class ArticleFactory(factory.django.DjangoModelFactory):
+
+    article = factory.Sequence(lambda n: f'{100001 + n}')
+
+    class Meta:
+        model = Article
+
+
 class ProductFactory(factory.django.DjangoModelFactory):
 
-    name = factory.Faker('word')
-    description = ('test_description_edited',)
+    name = factory.Sequence(lambda n: f'product_{n}')
+    description = 'test_description_edited'
     price = factory.Faker('random_int', min=1, max=1000)
+    category = factory.SubFactory(CategoryFactory)
+    sub_category = factory.SubFactory(SubCategoryFactory)
+    product_type = factory.SubFactory(ProductTypeFactory)
     properties = factory.RelatedFactoryList(PropertyFactory, size=2)
+    article = factory.RelatedFactory(
+        ArticleFactory, factory_related_name='product'
+    )
     creator = factory.SubFactory(SuperUserFactory)
 
     class Meta:
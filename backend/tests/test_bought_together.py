@@ -0,0 +1,103 @@
+# Standart lib imports
+from datetime import timedelta
+from http import HTTPStatus
+
+# Thirdparty imports
+from django.core.cache import cache
+from django.core.management import call_command
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+# Projects imports
+from products.models import Order, OrderProduct
+from tests.constants.product import (
+    BOUGHT_TOGETHER_MISMATCH,
+    URL_PRODUCT_BOUGHT_TOGETHER,
+)
+from tests.factories import ProductFactory, UserFactory
+
+
+class BoughtTogetherTestCase(APITestCase):
+    """Класс для тестирования индекса "покупают вместе"."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = UserFactory()
+        self.products = ProductFactory.create_batch(4)
+
+    def order(self, *products):
+        order = Order.objects.create(customer=self.user)
+        OrderProduct.objects.bulk_create(
+            OrderProduct(order=order, product=product) for product in products
+        )
+        return order
+
+    def get_neighbours(self, product):
+        response = self.client.get(
+            URL_PRODUCT_BOUGHT_TOGETHER.format(product.id),
+            {'fields': 'id'},
+        )
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertTrue(
+            all(
+                set(neighbour) == {'id', 'count'}
+                for neighbour in response.data['results']
+            ),
+            BOUGHT_TOGETHER_MISMATCH,
+        )
+        return [
+            (neighbour['id'], neighbour['count'])
+            for neighbour in response.data['results']
+        ]
+
+    def test_01_build_and_refresh(self):
+        """Тест полного построения и учёта новых заказов."""
+        first, second, third, fourth = self.products
+        self.order(first, second)
+        self.order(first, second, third)
+        call_command('build_bought_together', full=True)
+        self.assertEqual(
+            self.get_neighbours(first),
+            [(second.id, 2), (third.id, 1)],
+            BOUGHT_TOGETHER_MISMATCH,
+        )
+
+        self.order(first, third)
+        self.order(first, third, fourth)
+        call_command('build_bought_together')
+        self.assertEqual(
+            self.get_neighbours(first),
+            [(third.id, 3), (second.id, 2), (fourth.id, 1)],
+            BOUGHT_TOGETHER_MISMATCH,
+        )
+        self.assertEqual(
+            self.get_neighbours(second),
+            [(first.id, 2), (third.id, 1)],
+            BOUGHT_TOGETHER_MISMATCH,
+        )
+
+    def test_02_refresh_late_and_changed_orders(self):
+        """Тест учёта поздно зафиксированных и изменённых заказов."""
+        first, second, third, fourth = self.products
+        changed = self.order(first, second)
+        call_command('build_bought_together', full=True)
+
+        # Заказ, не зафиксированный к прошлому обновлению.
+        late = self.order(first, third)
+        Order.objects.filter(id=late.id).update(
+            updated_at=timezone.now() - timedelta(minutes=1)
+        )
+        # Строки старого заказа заменены.
+        OrderProduct.objects.filter(order=changed).delete()
+        OrderProduct.objects.bulk_create(
+            OrderProduct(order=changed, product=product)
+            for product in (first, second, fourth)
+        )
+        changed.save()
+
+        call_command('build_bought_together')
+        self.assertEqual(
+            self.get_neighbours(first),
+            [(second.id, 1), (third.id, 1), (fourth.id, 1)],
+            BOUGHT_TOGETHER_MISMATCH,
+        )
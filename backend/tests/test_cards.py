@@ -0,0 +1,78 @@
+# Standart lib imports
+from http import HTTPStatus
+
+# Thirdparty imports
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+
+# Projects imports
+from products.models import ProductProperty, Property, Rating
+from tests.constants.product import (
+    CARD_NOT_CACHED,
+    CARD_NOT_INVALIDATED,
+    CARD_NOT_INVALIDATED_BY_REBUILD,
+    URL_PRODUCTS,
+)
+from tests.factories import ProductFactory, UserFactory
+
+
+class ProductCardTestCase(APITestCase):
+    """Класс для тестирования кэша карточек Product"""
+
+    def setUp(self):
+        cache.clear()
+        self.product = ProductFactory()
+        self.product_property = ProductProperty.objects.create(
+            product=self.product,
+            property=Property.objects.first(),
+            value='old',
+        )
+        self.url = f'{URL_PRODUCTS}{self.product.id}/'
+
+    def test_01_cards_are_cached(self):
+        """Тест сборки повторного ответа без обращения к характеристикам."""
+        self.client.get(URL_PRODUCTS)
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(URL_PRODUCTS)
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        for query in context.captured_queries:
+            self.assertNotIn(
+                'products_productproperty', query['sql'], CARD_NOT_CACHED
+            )
+
+    def test_02_card_follows_property_change(self):
+        """Тест инвалидации карточки при изменении характеристики."""
+        self.client.get(self.url)
+
+        self.product_property.value = 'new'
+        self.product_property.save()
+
+        response = self.client.get(self.url)
+        self.assertEqual(
+            response.data['properties'][0]['value'],
+            'new',
+            CARD_NOT_INVALIDATED,
+        )
+
+    def test_03_card_follows_rating_rebuild(self):
+        """Тест инвалидации карточки пересчётом рейтинга."""
+        Rating.objects.create(
+            product=self.product, user=UserFactory(), score=4
+        )
+        self.client.get(self.url)
+
+        # update не вызывает сигналов: агрегаты исправляет только пересчёт.
+        Rating.objects.filter(product=self.product).update(score=2)
+        call_command('rebuild_product_rating')
+
+        response = self.client.get(self.url)
+        self.assertEqual(
+            (response.data['rating'], response.data['rating_count']),
+            (2, 1),
+            CARD_NOT_INVALIDATED_BY_REBUILD,
+        )
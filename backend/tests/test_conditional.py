@@ -0,0 +1,67 @@
+# Standart lib imports
+from http import HTTPStatus
+
+# Thirdparty imports
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+
+# Projects imports
+from products.models import Category
+from tests.constants.product import (
+    ETAG_NOT_CHANGED,
+    NOT_MODIFIED_EXPECTED,
+    URL_CATEGORIES,
+    URL_PRODUCT_FAVORITE,
+    URL_PRODUCTS,
+)
+from tests.factories import ProductFactory, UserFactory
+
+
+class ConditionalGetTestCase(APITestCase):
+    """Класс для тестирования ETag и If-None-Match"""
+
+    def setUp(self):
+        cache.clear()
+        self.product = ProductFactory()
+        self.url = f'{URL_PRODUCTS}{self.product.id}/'
+
+    def get(self, url, etag=None):
+        headers = {'HTTP_IF_NONE_MATCH': etag} if etag else {}
+        return self.client.get(url, **headers)
+
+    def test_01_not_modified(self):
+        """Тест ответа 304 без запроса и сериализации продуктов."""
+        for url in (URL_PRODUCTS, self.url, URL_CATEGORIES):
+            etag = self.get(url)['ETag']
+
+            with CaptureQueriesContext(connection) as context:
+                response = self.get(url, etag)
+
+            self.assertEqual(
+                response.status_code,
+                HTTPStatus.NOT_MODIFIED,
+                NOT_MODIFIED_EXPECTED,
+            )
+            for query in context.captured_queries:
+                self.assertNotIn(
+                    'products_productproperty',
+                    query['sql'],
+                    NOT_MODIFIED_EXPECTED,
+                )
+
+    def test_02_etag_follows_changes(self):
+        """Тест смены ETag после записи в каталог и в избранное."""
+        etag = self.get(URL_CATEGORIES)['ETag']
+        Category.objects.create(name='Ноутбуки', slug='laptops')
+        response = self.get(URL_CATEGORIES, etag)
+        self.assertEqual(response.status_code, HTTPStatus.OK, ETAG_NOT_CHANGED)
+
+        user = UserFactory()
+        self.client.force_authenticate(user)
+        etag = self.get(self.url)['ETag']
+        self.client.post(URL_PRODUCT_FAVORITE.format(self.product.id))
+        response = self.get(self.url, etag)
+        self.assertEqual(response.status_code, HTTPStatus.OK, ETAG_NOT_CHANGED)
+        self.assertTrue(response.data['is_favorited'], ETAG_NOT_CHANGED)
@@ -0,0 +1,60 @@
+# Standart lib imports
+import csv
+import json
+from http import HTTPStatus
+from io import StringIO
+
+# Thirdparty imports
+from django.core.management import call_command
+from rest_framework.test import APITestCase
+
+# Projects imports
+from products.constants import EXPORT_FIELDS
+from tests.constants.product import EXPORT_MISMATCH, URL_PRODUCTS_EXPORT
+from tests.factories import ProductFactory
+
+
+class CatalogExportTestCase(APITestCase):
+    """Класс для тестирования выгрузки каталога"""
+
+    def setUp(self):
+        self.products = ProductFactory.create_batch(3)
+        self.product_ids = [product.id for product in self.products]
+
+    def get_content(self, file_format):
+        response = self.client.get(
+            URL_PRODUCTS_EXPORT, {'file_format': file_format}
+        )
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        return b''.join(response.streaming_content).decode()
+
+    def test_01_jsonl(self):
+        """Тест выгрузки JSONL через API и команду."""
+        command_output = StringIO()
+        call_command(
+            'export_catalog', '--chunk-size', '2', stdout=command_output
+        )
+
+        for content in (self.get_content('jsonl'), command_output.getvalue()):
+            lines = [json.loads(line) for line in content.splitlines()]
+            self.assertEqual(
+                [line['id'] for line in lines],
+                self.product_ids,
+                EXPORT_MISMATCH,
+            )
+            self.assertEqual(tuple(lines[0]), EXPORT_FIELDS, EXPORT_MISMATCH)
+
+    def test_02_csv(self):
+        """Тест выгрузки CSV и неизвестного формата."""
+        rows = list(csv.DictReader(StringIO(self.get_content('csv'))))
+        self.assertEqual(
+            [int(row['id']) for row in rows], self.product_ids, EXPORT_MISMATCH
+        )
+        self.assertEqual(
+            rows[0]['category'],
+            self.products[0].category.name,
+            EXPORT_MISMATCH,
+        )
+
+        response = self.client.get(URL_PRODUCTS_EXPORT, {'file_format': 'xml'})
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
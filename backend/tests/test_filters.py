@@ -0,0 +1,125 @@
+# Standart lib imports
+from http import HTTPStatus
+
+# Thirdparty imports
+from rest_framework.test import APITestCase
+
+# Projects imports
+from products.models import ProductProperty, Property
+from tests.constants.product import (
+    FACETS_MISMATCH,
+    PROPERTY_FILTER_MISMATCH,
+    URL_PRODUCTS,
+)
+from tests.factories import ProductFactory
+
+
+class ProductPropertyFilterTestCase(APITestCase):
+    """Класс для тестирования фильтрации по характеристикам"""
+
+    def setUp(self):
+        self.width, self.length = Property.objects.all()[:2]
+        self.products = ProductFactory.create_batch(3)
+        values = (('8', '19'), ('8', '20'), ('9', '19'))
+
+        for product, (width, length) in zip(self.products, values):
+            ProductProperty.objects.create(
+                product=product, property=self.width, value=width
+            )
+            ProductProperty.objects.create(
+                product=product, property=self.length, value=length
+            )
+
+    def get_ids(self, query):
+        response = self.client.get(f'{URL_PRODUCTS}?{query}')
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        return [item['id'] for item in response.data['results']]
+
+    def get_facets(self, query):
+        response = self.client.get(f'{URL_PRODUCTS}?{query}&facets=true')
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        return {
+            facet['id']: [
+                (value['value'], value['count']) for value in facet['values']
+            ]
+            for facet in response.data['facets']
+        }
+
+    def test_01_filter_by_properties(self):
+        """Тест фильтрации по одной и нескольким характеристикам."""
+        first, second, third = (product.id for product in self.products)
+
+        self.assertEqual(
+            self.get_ids(f'property={self.width.id}:8'),
+            [first, second],
+            PROPERTY_FILTER_MISMATCH,
+        )
+        self.assertEqual(
+            self.get_ids(
+                f'property={self.width.id}:8&property={self.length.id}:19'
+            ),
+            [first],
+            PROPERTY_FILTER_MISMATCH,
+        )
+        self.assertEqual(
+            self.get_ids(
+                f'property={self.width.id}:8&property={self.width.id}:9'
+            ),
+            [first, second, third],
+            PROPERTY_FILTER_MISMATCH,
+        )
+
+    def test_02_invalid_filter(self):
+        """Тест ошибки при неверном формате фильтра."""
+        response = self.client.get(f'{URL_PRODUCTS}?property=width')
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+
+    def test_03_facets(self):
+        """Тест дизъюнктивных фасетов для текущего фильтра."""
+        response = self.client.get(
+            f'{URL_PRODUCTS}?property={self.width.id}:8&facets=true'
+        )
+
+        self.assertEqual(
+            response.data['facets'],
+            [
+                {
+                    'id': self.width.id,
+                    'name': self.width.name,
+                    'values': [
+                        {'value': '8', 'count': 2},
+                        {'value': '9', 'count': 1},
+                    ],
+                },
+                {
+                    'id': self.length.id,
+                    'name': self.length.name,
+                    'values': [
+                        {'value': '19', 'count': 1},
+                        {'value': '20', 'count': 1},
+                    ],
+                },
+            ],
+            FACETS_MISMATCH,
+        )
+
+    def test_04_facets_of_several_properties(self):
+        """Тест фасетов, каждый из которых учитывает только чужие фильтры."""
+        self.assertEqual(
+            self.get_facets(
+                f'property={self.width.id}:8&property={self.length.id}:19'
+            ),
+            {
+                self.width.id: [('8', 1), ('9', 1)],
+                self.length.id: [('19', 1), ('20', 1)],
+            },
+            FACETS_MISMATCH,
+        )
+        self.assertEqual(
+            self.get_facets(f'property={self.length.id}:20'),
+            {
+                self.width.id: [('8', 1)],
+                self.length.id: [('19', 2), ('20', 1)],
+            },
+            FACETS_MISMATCH,
+        )
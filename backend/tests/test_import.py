@@ -0,0 +1,123 @@
+# Standart lib imports
+import json
+import tempfile
+from http import HTTPStatus
+from io import StringIO
+from pathlib import Path
+
+# Thirdparty imports
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from rest_framework.test import APITestCase
+
+# Projects imports
+from products.models import (
+    Category,
+    Product,
+    ProductType,
+    Property,
+    SubCategory,
+)
+from tests.constants.product import IMPORT_MISMATCH, URL_PRODUCTS_IMPORT
+from tests.factories import SuperUserFactory, UserFactory
+
+
+class ProductImportTestCase(APITestCase):
+    """Класс для тестирования импорта продуктов"""
+
+    def setUp(self):
+        self.superuser = SuperUserFactory()
+        self.row = {
+            'name': 'imported',
+            'description': 'imported description',
+            'price': 100,
+            'category': Category.objects.first().id,
+            'sub_category': SubCategory.objects.first().id,
+            'product_type': ProductType.objects.first().id,
+            'properties': [{'id': Property.objects.first().id, 'value': '8'}],
+        }
+
+    def test_01_csv_endpoint(self):
+        """Тест загрузки CSV через API только суперпользователем."""
+        header = 'description,price,category,sub_category,product_type'
+        values = ','.join(
+            str(self.row[column]) for column in header.split(',')
+        )
+        property_id = self.row['properties'][0]['id']
+        content = (
+            f'{header},name,properties\n'
+            f'{values},imported1,{property_id}:8\n'
+            f'{values},imported2,{property_id}:8; 999:1\n'
+            f'{values},imported3,\n'
+        )
+
+        self.client.force_authenticate(UserFactory())
+        response = self.client.post(
+            URL_PRODUCTS_IMPORT,
+            {'file': SimpleUploadedFile('products.csv', content.encode())},
+        )
+        self.assertEqual(response.status_code, HTTPStatus.FORBIDDEN)
+
+        self.client.force_authenticate(self.superuser)
+        response = self.client.post(
+            URL_PRODUCTS_IMPORT,
+            {'file': SimpleUploadedFile('products.csv', content.encode())},
+        )
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response.data['created'], 2, IMPORT_MISMATCH)
+        self.assertEqual(
+            [error['line'] for error in response.data['errors']],
+            [3],
+            IMPORT_MISMATCH,
+        )
+
+        products = Product.objects.order_by('id')
+        self.assertEqual(
+            [product.name for product in products],
+            ['imported1', 'imported3'],
+            IMPORT_MISMATCH,
+        )
+        self.assertEqual(
+            products[0].product_property_prod.count(), 1, IMPORT_MISMATCH
+        )
+        self.assertNotEqual(
+            products[0].article_by_product.article,
+            products[1].article_by_product.article,
+            IMPORT_MISMATCH,
+        )
+
+    def test_02_jsonl_command(self):
+        """Тест команды import_products с отчётом об ошибках."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / 'products.jsonl'
+            report = Path(directory) / 'report.jsonl'
+            path.write_text(
+                '\n'.join(
+                    (
+                        json.dumps(self.row),
+                        '{broken',
+                        json.dumps({**self.row, 'price': 0}),
+                        json.dumps({**self.row, 'name': 'imported2'}),
+                        json.dumps(self.row),
+                    )
+                ),
+                encoding='utf-8',
+            )
+            call_command(
+                'import_products',
+                str(path),
+                '--creator',
+                self.superuser.email,
+                '--batch-size',
+                '2',
+                '--report',
+                str(report),
+                stdout=StringIO(),
+            )
+            errors = [
+                json.loads(line)['line']
+                for line in report.read_text(encoding='utf-8').splitlines()
+            ]
+
+        self.assertEqual(Product.objects.count(), 2, IMPORT_MISMATCH)
+        self.assertEqual(errors, [2, 3, 5], IMPORT_MISMATCH)
@@ -0,0 +1,120 @@
+# Standart lib imports
+from http import HTTPStatus
+
+# Thirdparty imports
+from django.core.cache import cache
+from django.core.management import call_command
+from rest_framework.test import APITestCase
+
+# Projects imports
+from products.models import Favorite
+from tests.constants.product import (
+    LEADERBOARD_MISMATCH,
+    LEADERBOARD_UNKNOWN_CATEGORY,
+    URL_ORDERS,
+    URL_PRODUCT_FAVORITE,
+    URL_PRODUCTS_TOP,
+)
+from tests.factories import ProductFactory, UserFactory
+
+
+class LeaderboardTestCase(APITestCase):
+    """Класс для тестирования топов продуктов."""
+
+    def setUp(self):
+        cache.clear()
+        self.products = ProductFactory.create_batch(3)
+        self.users = UserFactory.create_batch(2)
+
+    def get_top(self, params):
+        response = self.client.get(URL_PRODUCTS_TOP, params)
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        return [
+            (product['id'], product['score'])
+            for product in response.data['results']
+        ]
+
+    def test_01_favorites(self):
+        """Тест топа по избранному и его обновления после записи."""
+        first, second, third = self.products
+        Favorite.objects.bulk_create(
+            Favorite(user=user, product=second) for user in self.users
+        )
+        Favorite.objects.create(user=self.users[0], product=first)
+        self.assertEqual(
+            self.get_top({'by': 'favorites'}),
+            [(second.id, 2), (first.id, 1)],
+            LEADERBOARD_MISMATCH,
+        )
+
+        self.client.force_authenticate(self.users[1])
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(URL_PRODUCT_FAVORITE.format(first.id))
+            self.client.post(URL_PRODUCT_FAVORITE.format(third.id))
+        self.assertEqual(
+            self.get_top({'by': 'favorites', 'limit': 2}),
+            [(first.id, 2), (second.id, 2)],
+            LEADERBOARD_MISMATCH,
+        )
+        self.assertEqual(
+            self.get_top({'by': 'favorites', 'category': third.category_id}),
+            [(third.id, 1)],
+            LEADERBOARD_MISMATCH,
+        )
+
+    def test_02_sales_and_rebuild(self):
+        """Тест топа по продажам и полной перестройки."""
+        first, second, _ = self.products
+        self.assertEqual(self.get_top({'by': 'sales'}), [])
+
+        self.client.force_authenticate(self.users[0])
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(
+                URL_ORDERS,
+                {
+                    'products': [
+                        {'id': first.id, 'quantity': 1},
+                        {'id': second.id, 'quantity': 3},
+                    ]
+                },
+                format='json',
+            )
+        expected = [(second.id, 3), (first.id, 1)]
+        self.assertEqual(
+            self.get_top({'by': 'sales'}), expected, LEADERBOARD_MISMATCH
+        )
+
+        cache.clear()
+        call_command('rebuild_leaderboards')
+        self.assertEqual(
+            self.get_top({'by': 'sales'}), expected, LEADERBOARD_MISMATCH
+        )
+
+    def test_03_sparse_fields(self):
+        """Тест ?fields= в топе продуктов."""
+        Favorite.objects.create(user=self.users[0], product=self.products[0])
+        for fields, keys in (
+            ('id,name', {'id', 'name', 'score'}),
+            ('name', {'name', 'score'}),
+        ):
+            response = self.client.get(
+                URL_PRODUCTS_TOP, {'by': 'favorites', 'fields': fields}
+            )
+            self.assertEqual(
+                set(response.data['results'][0]),
+                keys,
+                LEADERBOARD_MISMATCH,
+            )
+
+    def test_04_unknown_category(self):
+        """Тест отказа для несуществующей категории без записи в кэш."""
+        response = self.client.get(URL_PRODUCTS_TOP, {'category': 10 ** 9})
+        self.assertEqual(
+            response.status_code,
+            HTTPStatus.BAD_REQUEST,
+            LEADERBOARD_UNKNOWN_CATEGORY,
+        )
+        self.assertIsNone(
+            cache.get(f'leaderboard:rating:{10 ** 9}'),
+            LEADERBOARD_UNKNOWN_CATEGORY,
+        )
@@ -0,0 +1,235 @@
+# Standart lib imports
+from http import HTTPStatus
+
+# Thirdparty imports
+from cachalot.api import invalidate
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+
+# Projects imports
+from make_pc.constants import (
+    POWER_CONSUMPTION_PROPERTY,
+    POWER_PROPERTY,
+    SOCKET_PROPERTY,
+)
+from make_pc.models import PcDIY
+from make_pc.serializers import GetPcDIYSerializer
+from products.models import Product, ProductProperty, ProductType
+from products.product_types import product_type_util
+from tests.constants.product import (
+    MAKE_PC_BULK_MISMATCH,
+    MAKE_PC_CANDIDATES_MISMATCH,
+    MAKE_PC_EXTRA_QUERY,
+    MAKE_PC_MISMATCH,
+    MAKE_PC_VALIDATE_QUERIES,
+    URL_MAKE_PC,
+    URL_MAKE_PC_BULK,
+    URL_MAKE_PC_CANDIDATES,
+)
+from tests.factories import ProductFactory, PropertyFactory
+
+
+class MakePcReaderTestCase(APITestCase):
+    """Класс для тестирования двухфазного чтения сборок ПК."""
+
+    def setUp(self):
+        cache.clear()
+        self.cpu, self.gpu, self.other_gpu = ProductFactory.create_batch(3)
+
+    def get_builds(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(URL_MAKE_PC)
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        return response.data, len(context.captured_queries)
+
+    def test_01_matches_serializer(self):
+        """Тест совпадения ответа с GetPcDIYSerializer."""
+        PcDIY.objects.create(cpu=self.cpu, gpu=self.gpu)
+        PcDIY.objects.create(cpu=self.cpu)
+
+        data, _ = self.get_builds()
+        self.assertEqual(
+            data,
+            GetPcDIYSerializer(PcDIY.objects.all(), many=True).data,
+            MAKE_PC_MISMATCH,
+        )
+
+    def test_02_constant_queries(self):
+        """Тест числа запросов при росте числа сборок."""
+        PcDIY.objects.create(cpu=self.cpu, gpu=self.gpu)
+        self.get_builds()
+        _, few_queries = self.get_builds()
+
+        PcDIY.objects.bulk_create(
+            PcDIY(cpu=self.cpu, gpu=self.other_gpu) for _ in range(20)
+        )
+        cache.clear()
+        self.get_builds()
+        _, many_queries = self.get_builds()
+        self.assertEqual(few_queries, many_queries, MAKE_PC_EXTRA_QUERY)
+
+
+class MakePcCandidatesTestCase(APITestCase):
+    """Класс для тестирования подбора совместимых частей сборки."""
+
+    def setUp(self):
+        cache.clear()
+        self.properties = {
+            name: PropertyFactory(name=name)
+            for name in (
+                SOCKET_PROPERTY,
+                POWER_PROPERTY,
+                POWER_CONSUMPTION_PROPERTY,
+            )
+        }
+
+    def create_part(self, product_type, **values):
+        product = ProductFactory(
+            product_type=ProductType.objects.get_or_create(
+                name=product_type
+            )[0]
+        )
+        for name, value in values.items():
+            ProductProperty.objects.create(
+                product=product, property=self.properties[name], value=value
+            )
+        return product
+
+    def get_candidates(self, build, slot):
+        response = self.client.get(
+            URL_MAKE_PC_CANDIDATES.format(build.id, slot)
+        )
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        return [product['id'] for product in response.data['results']]
+
+    def test_01_compatible_candidates(self):
+        """Тест отбора кандидатов по сокету и мощности."""
+        board = self.create_part('MOTHERBOARD', **{SOCKET_PROPERTY: 'AM4'})
+        cpu = self.create_part(
+            'CPU',
+            **{SOCKET_PROPERTY: 'AM4', POWER_CONSUMPTION_PROPERTY: '100'},
+        )
+        self.create_part('CPU', **{SOCKET_PROPERTY: 'LGA1700'})
+        small_gpu = self.create_part(
+            'GPU', **{POWER_CONSUMPTION_PROPERTY: '150'}
+        )
+        big_gpu = self.create_part(
+            'GPU', **{POWER_CONSUMPTION_PROPERTY: '300'}
+        )
+        self.create_part('POWER_SUPPLY', **{POWER_PROPERTY: '350'})
+        power_supply = self.create_part(
+            'POWER_SUPPLY', **{POWER_PROPERTY: '650 Вт'}
+        )
+
+        build = PcDIY.objects.create(motherboard=board, gpu=big_gpu)
+        self.assertEqual(
+            self.get_candidates(build, 'cpu'),
+            [cpu.id],
+            MAKE_PC_CANDIDATES_MISMATCH,
+        )
+        build.cpu = cpu
+        build.save()
+        self.assertEqual(
+            self.get_candidates(build, 'power_supply'),
+            [power_supply.id],
+            MAKE_PC_CANDIDATES_MISMATCH,
+        )
+        build.power_supply = power_supply
+        build.save()
+        self.assertEqual(
+            self.get_candidates(build, 'gpu'),
+            [small_gpu.id, big_gpu.id],
+            MAKE_PC_CANDIDATES_MISMATCH,
+        )
+        build.power_supply = Product.objects.get(
+            product_type__name='POWER_SUPPLY',
+            product_property_prod__value='350',
+        )
+        build.save()
+        self.assertEqual(
+            self.get_candidates(build, 'gpu'),
+            [small_gpu.id],
+            MAKE_PC_CANDIDATES_MISMATCH,
+        )
+
+    def test_02_unknown_slot(self):
+        """Тест ответа 404 для неизвестного слота."""
+        build = PcDIY.objects.create()
+        response = self.client.get(
+            URL_MAKE_PC_CANDIDATES.format(build.id, 'keyboard')
+        )
+        self.assertEqual(response.status_code, HTTPStatus.NOT_FOUND)
+
+
+class MakePcBulkTestCase(APITestCase):
+    """Класс для тестирования пакетной проверки и сохранения сборок."""
+
+    def setUp(self):
+        cache.clear()
+        self.parts = {
+            slot: ProductFactory.create_batch(
+                2,
+                product_type=ProductType.objects.get_or_create(
+                    name=product_type
+                )[0],
+            )
+            for slot, product_type in (('cpu', 'CPU'), ('gpu', 'GPU'))
+        }
+        self.builds = [
+            {'cpu': cpu.id, 'gpu': gpu.id}
+            for cpu in self.parts['cpu']
+            for gpu in self.parts['gpu']
+        ]
+
+    def post(self, data, dry_run=False):
+        url = URL_MAKE_PC_BULK + ('?dry_run=1' if dry_run else '')
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(url, data, format='json')
+        return response, len(context.captured_queries)
+
+    def test_01_validate_queries(self):
+        """Тест проверки всех сборок одним запросом типов продуктов."""
+        self.post(self.builds, dry_run=True)
+        for parts in self.parts.values():
+            for part in parts:
+                product_type_util.invalidate(part.id)
+        invalidate(Product)
+
+        response, cold_queries = self.post(self.builds, dry_run=True)
+        self.assertEqual(response.status_code, HTTPStatus.NO_CONTENT)
+        self.assertEqual(cold_queries, 1, MAKE_PC_VALIDATE_QUERIES)
+        _, warm_queries = self.post(self.builds, dry_run=True)
+        self.assertEqual(warm_queries, 0, MAKE_PC_VALIDATE_QUERIES)
+        self.assertFalse(PcDIY.objects.exists(), MAKE_PC_BULK_MISMATCH)
+
+    def test_02_create(self):
+        """Тест сохранения списка сборок."""
+        response, _ = self.post(self.builds)
+        self.assertEqual(response.status_code, HTTPStatus.CREATED)
+        self.assertEqual(
+            [
+                (build['cpu']['id'], build['gpu']['id'])
+                for build in response.data
+            ],
+            [(build['cpu'], build['gpu']) for build in self.builds],
+            MAKE_PC_BULK_MISMATCH,
+        )
+        self.assertEqual(
+            sorted(build['id'] for build in response.data),
+            list(PcDIY.objects.order_by('id').values_list('id', flat=True)),
+            MAKE_PC_BULK_MISMATCH,
+        )
+
+    def test_03_invalid_build(self):
+        """Тест отказа для списка с ошибочной сборкой."""
+        cpu, gpu = self.parts['cpu'][0], self.parts['gpu'][0]
+        response, _ = self.post(
+            [{'cpu': cpu.id}, {'cpu': gpu.id}, {'gpu': 10 ** 6}]
+        )
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        self.assertEqual(response.data[0], {})
+        self.assertIn('cpu', response.data[1])
+        self.assertIn('gpu', response.data[2])
+        self.assertFalse(PcDIY.objects.exists(), MAKE_PC_BULK_MISMATCH)
@@ -0,0 +1,144 @@
+# Standart lib imports
+from http import HTTPStatus
+
+# Thirdparty imports
+from cachalot.api import invalidate
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+
+# Projects imports
+from products.membership import membership_util
+from products.models import Favorite
+from tests.constants.product import (
+    BATCH_MISMATCH,
+    CATALOG_QUERY_DEPENDS_ON_USER,
+    MEMBERSHIP_FLAG_MISMATCH,
+    URL_FAVORITE_BATCH,
+    URL_PRODUCT_FAVORITE,
+    URL_PRODUCT_SHOPPING_CART,
+    URL_PRODUCTS,
+    URL_SHOPPING_CART_BATCH,
+)
+from tests.factories import ProductFactory, UserFactory
+
+
+class ProductMembershipTestCase(APITestCase):
+    """Класс для тестирования флагов избранного и корзины"""
+
+    def setUp(self):
+        cache.clear()
+        self.user, self.other_user = UserFactory.create_batch(2)
+        self.favorite, self.in_cart, self.other = (
+            ProductFactory.create_batch(3)
+        )
+
+    def get_flags(self):
+        response = self.client.get(URL_PRODUCTS)
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        return {
+            item['id']: (item['is_favorited'], item['is_in_shopping_cart'])
+            for item in response.data['results']
+        }
+
+    def test_01_flags_follow_writes(self):
+        """Тест флагов после добавления и удаления."""
+        self.client.force_authenticate(self.user)
+        self.assertEqual(
+            set(self.get_flags().values()), {(False, False)}
+        )
+
+        self.client.post(URL_PRODUCT_FAVORITE.format(self.favorite.id))
+        self.client.post(URL_PRODUCT_SHOPPING_CART.format(self.in_cart.id))
+        flags = self.get_flags()
+        self.assertEqual(
+            flags[self.favorite.id], (True, False), MEMBERSHIP_FLAG_MISMATCH
+        )
+        self.assertEqual(
+            flags[self.in_cart.id], (False, True), MEMBERSHIP_FLAG_MISMATCH
+        )
+        self.assertEqual(
+            flags[self.other.id], (False, False), MEMBERSHIP_FLAG_MISMATCH
+        )
+
+        self.client.delete(URL_PRODUCT_FAVORITE.format(self.favorite.id))
+        self.assertEqual(
+            self.get_flags()[self.favorite.id],
+            (False, False),
+            MEMBERSHIP_FLAG_MISMATCH,
+        )
+
+    def test_02_catalog_query_is_shared(self):
+        """Тест одинакового SQL каталога для разных пользователей."""
+        catalog_queries = []
+        for user in (self.user, self.other_user):
+            cache.clear()
+            invalidate()
+            self.client.force_authenticate(user)
+            with CaptureQueriesContext(connection) as context:
+                self.get_flags()
+            catalog_queries.append(
+                [
+                    query['sql']
+                    for query in context.captured_queries
+                    if 'FROM "products_product"' in query['sql']
+                ]
+            )
+        self.assertTrue(catalog_queries[0], CATALOG_QUERY_DEPENDS_ON_USER)
+        self.assertEqual(*catalog_queries, CATALOG_QUERY_DEPENDS_ON_USER)
+
+    def test_03_batch(self):
+        """Тест пакетного добавления и удаления."""
+        self.client.force_authenticate(self.user)
+        self.client.post(URL_PRODUCT_SHOPPING_CART.format(self.in_cart.id))
+        missing_id = self.other.id + 1
+        response = self.client.post(
+            URL_SHOPPING_CART_BATCH,
+            {'products': [self.in_cart.id, self.other.id, missing_id]},
+            format='json',
+        )
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(
+            response.data,
+            {
+                'products': [self.in_cart.id, self.other.id],
+                'not_found': [missing_id],
+            },
+            BATCH_MISMATCH,
+        )
+        self.assertEqual(
+            self.get_flags()[self.other.id], (False, True), BATCH_MISMATCH
+        )
+
+        self.client.post(
+            URL_FAVORITE_BATCH, {'products': [self.favorite.id]}, format='json'
+        )
+        response = self.client.delete(
+            URL_SHOPPING_CART_BATCH,
+            {'products': [self.in_cart.id, self.other.id]},
+            format='json',
+        )
+        self.assertEqual(response.data, {'deleted': 2}, BATCH_MISMATCH)
+        flags = self.get_flags()
+        self.assertEqual(
+            flags[self.favorite.id], (True, False), BATCH_MISMATCH
+        )
+        self.assertEqual(flags[self.other.id], (False, False), BATCH_MISMATCH)
+
+    def test_04_invalidate_on_commit(self):
+        """Тест сброса множеств, прочитанных до коммита записи."""
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                Favorite.objects.create(user=self.user, product=self.favorite)
+                membership_util.invalidate(self.user.id, Favorite)
+                # Чтение другого запроса до коммита кэширует старое множество.
+                cache.set(
+                    membership_util._get_cache_key(Favorite, self.user.id),
+                    frozenset(),
+                )
+        self.assertEqual(
+            membership_util.get(self.user).favorite_ids,
+            {self.favorite.id},
+            MEMBERSHIP_FLAG_MISMATCH,
+        )
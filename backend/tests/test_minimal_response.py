@@ -0,0 +1,71 @@
+# Standart lib imports
+from http import HTTPStatus
+
+# Thirdparty imports
+from django.core.cache import cache
+from rest_framework.test import APITestCase
+
+# Projects imports
+from products.models import Favorite, Product
+from tests.constants.product import (
+    MINIMAL_RESPONSE_MISMATCH,
+    URL_ORDERS,
+    URL_PRODUCT_FAVORITE,
+    URL_PRODUCTS,
+)
+from tests.factories import ProductFactory, SuperUserFactory
+
+
+class MinimalResponseTestCase(APITestCase):
+    """Класс для тестирования Prefer: return=minimal."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = SuperUserFactory()
+        self.client.force_authenticate(self.user)
+        self.product = ProductFactory()
+
+    def assert_minimal(self, response, status_code):
+        self.assertEqual(response.status_code, status_code)
+        self.assertEqual(
+            response['Preference-Applied'],
+            'return=minimal',
+            MINIMAL_RESPONSE_MISMATCH,
+        )
+        self.assertEqual(
+            set(response.data), {'id', 'updated_at'}, MINIMAL_RESPONSE_MISMATCH
+        )
+
+    def test_01_prefer_header(self):
+        """Тест заголовка Prefer для изменения продукта и избранного."""
+        response = self.client.patch(
+            f'{URL_PRODUCTS}{self.product.id}/',
+            {'price': 50},
+            format='json',
+            HTTP_PREFER='return=minimal',
+        )
+        self.assert_minimal(response, HTTPStatus.OK)
+        self.assertEqual(
+            Product.objects.get(id=self.product.id).price,
+            50,
+            MINIMAL_RESPONSE_MISMATCH,
+        )
+
+        response = self.client.post(
+            URL_PRODUCT_FAVORITE.format(self.product.id),
+            HTTP_PREFER='return=minimal',
+        )
+        self.assert_minimal(response, HTTPStatus.CREATED)
+        self.assertTrue(
+            Favorite.objects.filter(user=self.user).exists(),
+            MINIMAL_RESPONSE_MISMATCH,
+        )
+
+    def test_02_return_id(self):
+        """Тест ?return=id при создании заказа."""
+        response = self.client.post(
+            f'{URL_ORDERS}?return=id',
+            {'products': [{'id': self.product.id}]},
+            format='json',
+        )
+        self.assert_minimal(response, HTTPStatus.CREATED)
@@ -0,0 +1,170 @@
+# Standart lib imports
+from http import HTTPStatus
+
+# Thirdparty imports
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+
+# Projects imports
+from products.models import Order, ShoppingCart
+from tests.constants.product import (
+    CHECKOUT_MISMATCH,
+    ORDER_HISTORY_EXTRA_QUERY,
+    ORDER_HISTORY_MISMATCH,
+    ORDER_QUERIES_GROW,
+    ORDER_TOTAL_MISMATCH,
+    ORDER_UPDATE_MISMATCH,
+    URL_CHECKOUT,
+    URL_ORDERS,
+    URL_ORDERS_HISTORY,
+)
+from tests.factories import ProductFactory, UserFactory
+
+
+class OrderTestCase(APITestCase):
+    """Класс для тестирования создания заказов."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = UserFactory()
+        self.client.force_authenticate(self.user)
+
+    def create_order(self, lines):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(URL_ORDERS, lines, format='json')
+        self.assertEqual(response.status_code, HTTPStatus.CREATED)
+        return response, len(context.captured_queries)
+
+    def test_01_total_price(self):
+        """Тест суммы заказа с количеством и повторами продукта."""
+        first, second = ProductFactory(price=100), ProductFactory(price=30)
+        response, _ = self.create_order(
+            {
+                'products': [
+                    {'id': first.id, 'quantity': 2},
+                    {'id': second.id},
+                    {'id': first.id, 'quantity': 1},
+                ]
+            }
+        )
+        self.assertEqual(
+            response.data['total_price'], 330, ORDER_TOTAL_MISMATCH
+        )
+
+        first.price = 500
+        first.save()
+        order = Order.objects.get(id=response.data['id'])
+        self.assertEqual(
+            sorted(
+                order.order_product_by_order.values_list(
+                    'quantity', 'unit_price'
+                )
+            ),
+            [(1, 30), (3, 100)],
+            ORDER_TOTAL_MISMATCH,
+        )
+
+    def test_02_constant_queries(self):
+        """Тест числа запросов при росте числа строк заказа."""
+        products = ProductFactory.create_batch(30)
+        # Первый заказ загружает справочники reference_util.
+        self.create_order({'products': [{'id': products[0].id}]})
+        _, few_queries = self.create_order(
+            {'products': [{'id': product.id} for product in products[:3]]}
+        )
+        _, many_queries = self.create_order(
+            {'products': [{'id': product.id} for product in products]}
+        )
+        self.assertEqual(few_queries, many_queries, ORDER_QUERIES_GROW)
+
+    def test_03_history(self):
+        """Тест истории заказов: снимок продукта и один запрос на страницу."""
+        products = ProductFactory.create_batch(5)
+        for product in products:
+            self.create_order(
+                {'products': [{'id': product.id}, {'id': products[0].id}]}
+            )
+        self.client.force_authenticate(UserFactory())
+        self.create_order({'products': [{'id': products[0].id}]})
+        self.client.force_authenticate(self.user)
+        name = products[1].name
+        products[1].name = 'renamed'
+        products[1].save()
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(URL_ORDERS_HISTORY, {'page_size': 3})
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(
+            len(context.captured_queries), 1, ORDER_HISTORY_EXTRA_QUERY
+        )
+        orders = response.data['results']
+        self.assertEqual(len(orders), 3, ORDER_HISTORY_MISMATCH)
+        self.assertIsNotNone(response.data['next'], ORDER_HISTORY_MISMATCH)
+
+        response = self.client.get(response.data['next'])
+        orders += response.data['results']
+        self.assertIsNone(response.data['next'], ORDER_HISTORY_MISMATCH)
+        self.assertEqual(len(orders), 5, ORDER_HISTORY_MISMATCH)
+        self.assertIn(
+            name,
+            [item['product']['name'] for item in orders[3]['items']],
+            ORDER_HISTORY_MISMATCH,
+        )
+
+    def test_04_checkout(self):
+        """Тест оформления корзины в заказ."""
+        response = self.client.post(URL_CHECKOUT)
+        self.assertEqual(
+            response.status_code, HTTPStatus.BAD_REQUEST, CHECKOUT_MISMATCH
+        )
+
+        products = ProductFactory.create_batch(3)
+        ShoppingCart.objects.bulk_create(
+            ShoppingCart(user=self.user, product=product)
+            for product in products
+        )
+        response = self.client.post(URL_CHECKOUT)
+        self.assertEqual(
+            response.status_code, HTTPStatus.CREATED, CHECKOUT_MISMATCH
+        )
+        self.assertEqual(
+            response.data['total_price'],
+            sum(product.price for product in products),
+            CHECKOUT_MISMATCH,
+        )
+        self.assertFalse(
+            ShoppingCart.objects.filter(user=self.user).exists(),
+            CHECKOUT_MISMATCH,
+        )
+        self.assertEqual(
+            self.client.post(URL_CHECKOUT).status_code,
+            HTTPStatus.BAD_REQUEST,
+            CHECKOUT_MISMATCH,
+        )
+
+    def test_05_update_lines(self):
+        """Тест прежнего формата id и изменения строк заказа."""
+        first, second = ProductFactory(price=100), ProductFactory(price=30)
+        response, _ = self.create_order({'products': [first.id]})
+        self.assertEqual(
+            response.data['total_price'], 100, ORDER_UPDATE_MISMATCH
+        )
+
+        second.price = 40
+        second.save()
+        response = self.client.patch(
+            f'{URL_ORDERS}{response.data["id"]}/',
+            {'products': [second.id, {'id': first.id, 'quantity': 2}]},
+            format='json',
+        )
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(
+            response.data['total_price'], 240, ORDER_UPDATE_MISMATCH
+        )
+        self.assertEqual(
+            sorted(item['quantity'] for item in response.data['items']),
+            [1, 2],
+            ORDER_UPDATE_MISMATCH,
+        )
@@ -0,0 +1,58 @@
+# Standart lib imports
+from http import HTTPStatus
+
+# Thirdparty imports
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+
+# Projects imports
+from tests.constants.product import (
+    PAGE_SIZE,
+    PAGINATED_PRODUCTS_COUNT,
+    PAGINATION_KEYS_MISSING,
+    PAGINATION_LOST_PRODUCTS,
+    PAGINATION_USES_COUNT,
+    URL_PRODUCTS,
+)
+from tests.factories import ProductFactory
+
+
+class ProductPaginationTestCase(APITestCase):
+    """Класс для тестирования курсорной пагинации Product"""
+
+    def setUp(self):
+        self.products = ProductFactory.create_batch(PAGINATED_PRODUCTS_COUNT)
+
+    def test_01_cursor_walks_whole_catalog(self):
+        """Тест прохода по всем страницам каталога."""
+        url = f'{URL_PRODUCTS}?page_size={PAGE_SIZE}'
+        received_ids = []
+
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, HTTPStatus.OK)
+            for key in ('next', 'previous', 'results'):
+                self.assertIn(key, response.data, PAGINATION_KEYS_MISSING)
+            self.assertLessEqual(len(response.data['results']), PAGE_SIZE)
+
+            received_ids.extend(
+                item['id'] for item in response.data['results']
+            )
+            url = response.data['next']
+
+        self.assertEqual(
+            received_ids,
+            sorted(product.id for product in self.products),
+            PAGINATION_LOST_PRODUCTS,
+        )
+
+    def test_02_no_count_query(self):
+        """Тест отсутствия COUNT(*) при запросе страницы."""
+        with CaptureQueriesContext(connection) as context:
+            self.client.get(f'{URL_PRODUCTS}?page_size={PAGE_SIZE}')
+
+        for query in context.captured_queries:
+            self.assertNotIn(
+                'COUNT(', query['sql'].upper(), PAGINATION_USES_COUNT
+            )
@@ -0,0 +1,105 @@
+# Standart lib imports
+from http import HTTPStatus
+
+# Thirdparty imports
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+
+# Projects imports
+from products.models import Product
+from tests.constants.product import (
+    RATING_AGGREGATE_MISMATCH,
+    RATING_CATALOG_QUERY,
+    URL_PRODUCT_RATING,
+)
+from tests.factories import ProductFactory, UserFactory
+
+
+class ProductRatingTestCase(APITestCase):
+    """Класс для тестирования агрегатов рейтинга Product"""
+
+    def setUp(self):
+        self.product = ProductFactory()
+        self.url = URL_PRODUCT_RATING.format(self.product.id)
+
+    def rate(self, user, score):
+        self.client.force_authenticate(user)
+        return self.client.post(self.url, {'score': score}, format='json')
+
+    def assert_rating(self, rating_avg, rating_count):
+        self.product.refresh_from_db()
+        self.assertAlmostEqual(
+            self.product.rating_avg, rating_avg, msg=RATING_AGGREGATE_MISMATCH
+        )
+        self.assertEqual(
+            self.product.rating_count, rating_count, RATING_AGGREGATE_MISMATCH
+        )
+
+    def test_01_create_and_delete_rating(self):
+        """Тест инкрементального обновления агрегатов."""
+        first_user, second_user = UserFactory.create_batch(2)
+
+        response = self.rate(first_user, 5)
+        self.assertEqual(response.status_code, HTTPStatus.CREATED)
+        self.assertEqual(response.data['rating'], 5)
+        self.assertEqual(response.data['rating_count'], 1)
+
+        self.rate(second_user, 2)
+        self.assert_rating(3.5, 2)
+
+        response = self.client.delete(self.url)
+        self.assertEqual(response.status_code, HTTPStatus.NO_CONTENT)
+        self.assert_rating(5, 1)
+
+        self.client.force_authenticate(first_user)
+        self.client.delete(self.url)
+        self.assert_rating(0, 0)
+
+    def test_02_rebuild_command(self):
+        """Тест полного пересчёта агрегатов командой."""
+        for user, score in zip(UserFactory.create_batch(3), (1, 2, 4)):
+            self.rate(user, score)
+        Product.objects.update(rating_avg=0, rating_count=0)
+
+        call_command('rebuild_product_rating', chunk_size=1)
+
+        self.assert_rating(7 / 3, 3)
+
+    def test_03_rerate(self):
+        """Тест повторной оценки через upsert."""
+        first_user, second_user = UserFactory.create_batch(2)
+        self.rate(first_user, 4)
+        self.rate(second_user, 2)
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.rate(first_user, 1)
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(
+            response.data,
+            {
+                'product': self.product.id,
+                'score': 1,
+                'rating': 1.5,
+                'rating_count': 2,
+            },
+            RATING_AGGREGATE_MISMATCH,
+        )
+        self.assert_rating(1.5, 2)
+        self.assertNotIn(
+            'products_productproperty',
+            ' '.join(query['sql'] for query in context.captured_queries),
+            RATING_CATALOG_QUERY,
+        )
+
+    def test_04_rerate_with_drifted_count(self):
+        """Тест переоценки при разошедшемся с Rating счётчике."""
+        first_user, second_user = UserFactory.create_batch(2)
+        self.rate(first_user, 4)
+        self.rate(second_user, 2)
+        Product.objects.update(rating_count=0)
+
+        response = self.rate(first_user, 1)
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assert_rating(1.5, 2)
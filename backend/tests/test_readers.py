@@ -0,0 +1,47 @@
+# Thirdparty imports
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+
+# Projects imports
+from products.membership import ProductMembership
+from products.models import Product, ProductProperty, Property
+from products.readers import reader_util
+from products.serializers import GetProductSerializer
+from tests.constants.product import READER_OUTPUT_MISMATCH
+from tests.factories import ProductFactory
+
+
+class ProductReaderTestCase(APITestCase):
+    """Класс для тестирования read-only сериализации Product"""
+
+    def setUp(self):
+        self.products = ProductFactory.create_batch(3)
+        for product in self.products:
+            ProductProperty.objects.bulk_create(
+                ProductProperty(
+                    product=product, property=product_property, value='1'
+                )
+                for product_property in Property.objects.all()
+            )
+
+    def test_01_output_matches_serializer(self):
+        """Тест побайтного совпадения с GetProductSerializer."""
+        product_ids = [product.id for product in self.products]
+        membership = ProductMembership(
+            favorite_ids=frozenset(product_ids[:1]),
+            shopping_cart_ids=frozenset(product_ids[1:2]),
+        )
+        queryset = Product.objects.get_annotated_queryset().filter(
+            id__in=product_ids
+        )
+        renderer = JSONRenderer()
+
+        self.assertEqual(
+            renderer.render(reader_util.get_many(product_ids, membership)),
+            renderer.render(
+                GetProductSerializer(
+                    queryset, many=True, context={'membership': membership}
+                ).data
+            ),
+            READER_OUTPUT_MISMATCH,
+        )
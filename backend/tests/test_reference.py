@@ -0,0 +1,66 @@
+# Thirdparty imports
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+
+# Projects imports
+from products.models import Category, ProductProperty, Property
+from products.reference import reference_util
+from tests.constants.product import (
+    REFERENCE_JOIN_FOUND,
+    REFERENCE_MISS_RELOADS_TABLES,
+    REFERENCE_NOT_INVALIDATED,
+    URL_PRODUCTS,
+)
+from tests.factories import ProductFactory
+
+
+class ReferenceDataTestCase(APITestCase):
+    """Класс для тестирования кэша справочников"""
+
+    def setUp(self):
+        cache.clear()
+        self.product = ProductFactory()
+        ProductProperty.objects.create(
+            product=self.product, property=Property.objects.first(), value='1'
+        )
+
+    def test_01_no_reference_joins(self):
+        """Тест сборки каталога без JOIN справочников."""
+        self.client.get(URL_PRODUCTS)
+        with CaptureQueriesContext(connection) as context:
+            self.client.get(URL_PRODUCTS, {'fields': 'id,category,properties'})
+
+        for query in context.captured_queries:
+            for table in ('products_category', 'products_property'):
+                self.assertNotIn(table, query['sql'], REFERENCE_JOIN_FOUND)
+
+    def test_02_rename_is_visible(self):
+        """Тест обновления ответа после переименования категории."""
+        self.client.get(URL_PRODUCTS)
+        category = self.product.category
+        category.name = 'renamed'
+        category.save()
+
+        response = self.client.get(URL_PRODUCTS)
+        self.assertEqual(
+            response.data['results'][0]['category']['name'],
+            'renamed',
+            REFERENCE_NOT_INVALIDATED,
+        )
+
+    def test_03_miss_loads_single_row(self):
+        """Тест дочитывания одной строки при промахе."""
+        reference_util.get_version()
+        # bulk_create не вызывает сигналов и не меняет версию справочников.
+        Category.objects.bulk_create([Category(name='new', slug='new')])
+        category = Category.objects.get(slug='new')
+
+        with CaptureQueriesContext(connection) as context:
+            row = reference_util.get('category', category.id)
+
+        self.assertEqual(row['name'], 'new')
+        self.assertEqual(
+            len(context.captured_queries), 1, REFERENCE_MISS_RELOADS_TABLES
+        )
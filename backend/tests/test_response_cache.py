@@ -0,0 +1,48 @@
+# Thirdparty imports
+from django.core.cache import cache
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+# Projects imports
+from products.models import Product
+from tests.constants.product import (
+    RESPONSE_NOT_CACHED,
+    RESPONSE_NOT_INVALIDATED,
+    URL_PRODUCTS,
+)
+from tests.factories import ProductFactory, UserFactory
+
+
+class AnonymousResponseCacheTestCase(APITestCase):
+    """Класс для тестирования кэша анонимных ответов"""
+
+    def setUp(self):
+        cache.clear()
+        self.product = ProductFactory(name='old_name')
+        self.url = f'{URL_PRODUCTS}{self.product.id}/'
+
+    def test_01_cached_until_version_bump(self):
+        """Тест кэширования ответа и его сброса сигналом save."""
+        self.client.get(self.url)
+        Product.objects.filter(id=self.product.id).update(
+            name='new_name', updated_at=timezone.now()
+        )
+
+        response = self.client.get(self.url)
+        self.assertEqual(
+            response.data['name'], 'old_name', RESPONSE_NOT_CACHED
+        )
+
+        self.client.force_authenticate(UserFactory())
+        response = self.client.get(self.url)
+        self.assertEqual(
+            response.data['name'], 'new_name', RESPONSE_NOT_CACHED
+        )
+        self.client.force_authenticate(None)
+
+        self.product.refresh_from_db()
+        self.product.save()
+        response = self.client.get(self.url)
+        self.assertEqual(
+            response.data['name'], 'new_name', RESPONSE_NOT_INVALIDATED
+        )
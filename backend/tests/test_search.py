@@ -0,0 +1,47 @@
+# Standart lib imports
+from http import HTTPStatus
+
+# Thirdparty imports
+from rest_framework.test import APITestCase
+
+# Projects imports
+from tests.constants.product import SEARCH_MISMATCH, URL_PRODUCTS
+from tests.factories import ProductFactory
+
+
+class ProductSearchTestCase(APITestCase):
+    """Класс для тестирования полнотекстового поиска Product"""
+
+    def setUp(self):
+        self.in_description = ProductFactory(
+            name='Корпус Zalman', description='Подходит для видеокарты'
+        )
+        self.in_name = ProductFactory(
+            name='Видеокарта Palit', description='Игровая'
+        )
+        self.other = ProductFactory(
+            name='Процессор Intel', description='Для игровых сборок'
+        )
+
+    def search(self, query):
+        response = self.client.get(URL_PRODUCTS, {'search': query})
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        return [item['id'] for item in response.data['results']]
+
+    def test_01_ranked_stemmed_search(self):
+        """Тест поиска по словоформам с ранжированием."""
+        self.assertEqual(
+            self.search('видеокарты'),
+            [self.in_name.id, self.in_description.id],
+            SEARCH_MISMATCH,
+        )
+
+    def test_02_index_follows_updates(self):
+        """Тест обновления индекса при изменении и удалении продукта."""
+        self.other.name = 'Процессор AMD'
+        self.other.save()
+        self.assertEqual(self.search('intel'), [], SEARCH_MISMATCH)
+        self.assertEqual(self.search('amd'), [self.other.id], SEARCH_MISMATCH)
+
+        self.other.delete()
+        self.assertEqual(self.search('amd'), [], SEARCH_MISMATCH)
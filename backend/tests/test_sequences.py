@@ -0,0 +1,73 @@
+# Thirdparty imports
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITransactionTestCase
+
+# Projects imports
+from products.article import article_util
+from products.constants import DEFAULT_ARTICLE_DIGIT
+from products.models import Article
+from products.sequences import SequenceAllocator
+from tests.constants.product import SEQUENCE_DUPLICATE, SEQUENCE_EXTRA_QUERY
+from tests.factories import ProductFactory
+
+
+class SequenceAllocatorTestCase(APITransactionTestCase):
+    """
+    Класс для тестирования выдачи номеров блоками.
+
+    Блоки переживают только зафиксированные транзакции, поэтому тесты
+    выполняются вне общей транзакции TestCase.
+    """
+
+    # Счётчик article создаётся миграцией и восстанавливается после flush.
+    serialized_rollback = True
+
+    def setUp(self):
+        self.allocator = SequenceAllocator(block_size=10)
+
+    def test_01_block_allocation(self):
+        """Тест выдачи номеров из блока и резервирования пачки."""
+        first = self.allocator.next('test')
+        with CaptureQueriesContext(connection) as context:
+            values = [self.allocator.next('test') for _ in range(9)]
+        self.assertEqual(
+            len(context.captured_queries), 0, SEQUENCE_EXTRA_QUERY
+        )
+
+        values = [first, *values, *self.allocator.reserve('test', 25)]
+        self.assertEqual(values, list(range(1, 36)), SEQUENCE_DUPLICATE)
+
+        other = SequenceAllocator(block_size=10)
+        self.assertEqual(other.next('test'), 36, SEQUENCE_DUPLICATE)
+
+    def test_02_rolled_back_block_is_dropped(self):
+        """Тест отказа от блока из откатившейся транзакции."""
+        try:
+            with transaction.atomic():
+                self.assertEqual(self.allocator.next('test'), 1)
+                raise RuntimeError
+        except RuntimeError:
+            pass
+
+        self.assertEqual(self.allocator.next('test'), 1, SEQUENCE_DUPLICATE)
+
+    def test_03_articles(self):
+        """Тест артикулов продуктов из счётчика article."""
+        products = ProductFactory.create_batch(2)
+        Article.objects.all().delete()
+
+        article_util.create_many(products)
+
+        digits = sorted(
+            article.split(':')[-1]
+            for article in Article.objects.filter(
+                product__in=products
+            ).values_list('article', flat=True)
+        )
+        first_digit = int(DEFAULT_ARTICLE_DIGIT)
+        self.assertEqual(
+            digits,
+            [str(first_digit), str(first_digit + 1)],
+            SEQUENCE_DUPLICATE,
+        )
@@ -0,0 +1,86 @@
+# Standart lib imports
+from http import HTTPStatus
+
+# Thirdparty imports
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+
+# Projects imports
+from make_pc.models import PcDIY
+from products.models import Order, ProductProperty, Property
+from tests.constants.product import (
+    SPARSE_FIELDS_EXTRA_QUERY,
+    SPARSE_FIELDS_MISMATCH,
+    URL_MAKE_PC,
+    URL_ORDERS,
+    URL_PRODUCTS,
+)
+from tests.factories import ProductFactory, UserFactory
+
+
+class SparseFieldsTestCase(APITestCase):
+    """Класс для тестирования ?fields= и ?omit="""
+
+    def setUp(self):
+        cache.clear()
+        self.user = UserFactory()
+        self.product = ProductFactory()
+        ProductProperty.objects.create(
+            product=self.product,
+            property=Property.objects.first(),
+            value='1',
+        )
+
+    def get(self, url, params):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, params)
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        return response, ' '.join(
+            query['sql'] for query in context.captured_queries
+        )
+
+    def test_01_product_fields(self):
+        """Тест ?fields= и ?omit= в каталоге."""
+        response, sql = self.get(URL_PRODUCTS, {'fields': 'id,name'})
+        self.assertEqual(
+            list(response.data['results'][0]),
+            ['id', 'name'],
+            SPARSE_FIELDS_MISMATCH,
+        )
+        self.assertNotIn(
+            'products_productproperty', sql, SPARSE_FIELDS_EXTRA_QUERY
+        )
+
+        response, _ = self.get(
+            f'{URL_PRODUCTS}{self.product.id}/',
+            {'omit': 'properties,creator'},
+        )
+        self.assertNotIn('properties', response.data, SPARSE_FIELDS_MISMATCH)
+        self.assertNotIn('creator', response.data, SPARSE_FIELDS_MISMATCH)
+        self.assertIn('category', response.data, SPARSE_FIELDS_MISMATCH)
+
+    def test_02_order_fields(self):
+        """Тест ?fields= в заказах без загрузки продуктов."""
+        order = Order.objects.create(customer=self.user)
+        order.products.add(self.product)
+        self.client.force_authenticate(self.user)
+
+        response, sql = self.get(URL_ORDERS, {'fields': 'id,customer'})
+        self.assertEqual(
+            list(response.data[0]), ['id', 'customer'], SPARSE_FIELDS_MISMATCH
+        )
+        self.assertNotIn(
+            'products_orderproduct', sql, SPARSE_FIELDS_EXTRA_QUERY
+        )
+
+    def test_03_make_pc_fields(self):
+        """Тест ?fields= в сборках ПК."""
+        PcDIY.objects.create()
+
+        response, sql = self.get(URL_MAKE_PC, {'fields': 'id'})
+        self.assertEqual(
+            list(response.data[0]), ['id'], SPARSE_FIELDS_MISMATCH
+        )
+        self.assertNotIn('products_product', sql, SPARSE_FIELDS_EXTRA_QUERY)